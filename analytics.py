@@ -0,0 +1,129 @@
+# Incremental screening analytics
+# Running counts and score histograms, so analytics never rescan results
+
+import threading
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+SCORE_BINS = 101  # total_score is an integer in 0..100
+HIGH_CONFIDENCE_SCORE = 80
+
+class ThresholdSplit(NamedTuple):
+    """Per-role counts either side of a review threshold, one array entry per role"""
+    roles: List[str]
+    applications: np.ndarray
+    accepted: np.ndarray  # AI Accept, at or above the threshold
+    rejected: np.ndarray  # AI Reject, at or above the threshold
+    review: np.ndarray    # below the threshold, whatever the AI decided
+
+class ScreeningAggregates:
+    """Per-role score histograms, updated as each result is produced.
+
+    Every metric the analytics tab shows (totals, accepts, average score,
+    high-confidence count, score distribution) is derived from two 101-bin
+    histograms per role, so reading them costs the same for ten applications
+    or ten million, including for any score band.
+    """
+
+    def __init__(self):
+        self._scores: Dict[str, np.ndarray] = {}
+        self._accepted: Dict[str, np.ndarray] = {}
+        # (roles, score prefix sums, accept prefix sums), rebuilt after new results arrive
+        self._prefix: Optional[Tuple[List[str], np.ndarray, np.ndarray]] = None
+        self._lock = threading.Lock()
+
+    def _role_bins(self, job_type: str) -> Tuple[np.ndarray, np.ndarray]:
+        if job_type not in self._scores:
+            self._scores[job_type] = np.zeros(SCORE_BINS, dtype=np.int64)
+            self._accepted[job_type] = np.zeros(SCORE_BINS, dtype=np.int64)
+        return self._scores[job_type], self._accepted[job_type]
+
+    def __getstate__(self) -> Dict:
+        # Picklable for the session spill store; the lock is recreated on load
+        with self._lock:
+            return {'_scores': self._scores, '_accepted': self._accepted, '_prefix': None}
+
+    def __setstate__(self, state: Dict) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def add(self, job_type: str, total_score: int, decision: str, count: int = 1) -> None:
+        """Record one result (or `count` identical ones; a negative count retracts them)"""
+        with self._lock:
+            scores, accepted = self._role_bins(job_type)
+            scores[total_score] += count
+            if decision == 'Accept':
+                accepted[total_score] += count
+            self._prefix = None
+
+    def add_batch(self, job_type: str, total_scores: Iterable[int], decisions: Iterable[str]) -> None:
+        """Record a batch of results for one role with two bincounts"""
+        total_scores = np.asarray(total_scores, dtype=np.int64)
+        is_accept = np.asarray(decisions) == 'Accept'
+        batch_scores = np.bincount(total_scores, minlength=SCORE_BINS)
+        batch_accepted = np.bincount(total_scores[is_accept], minlength=SCORE_BINS)
+        with self._lock:
+            scores, accepted = self._role_bins(job_type)
+            scores += batch_scores
+            accepted += batch_accepted
+            self._prefix = None
+
+    def roles(self) -> List[str]:
+        return list(self._scores)
+
+    def _select(self, job_type: Optional[str], min_score: int, max_score: int) -> Tuple[np.ndarray, np.ndarray]:
+        band = slice(min_score, max_score + 1)
+        with self._lock:
+            roles = [job_type] if job_type else list(self._scores)
+            scores = np.zeros(SCORE_BINS, dtype=np.int64)
+            accepted = np.zeros(SCORE_BINS, dtype=np.int64)
+            for role in roles:
+                if role in self._scores:
+                    scores[band] += self._scores[role][band]
+                    accepted[band] += self._accepted[role][band]
+        return scores, accepted
+
+    def summary(self, job_type: Optional[str] = None, min_score: int = 0, max_score: int = 100) -> Dict:
+        """Total, accepted, average score and high-confidence counts for a slice"""
+        scores, accepted = self._select(job_type, min_score, max_score)
+        total = int(scores.sum())
+        return {
+            'total': total,
+            'accepted': int(accepted.sum()),
+            'avg_score': float(scores @ np.arange(SCORE_BINS)) / total if total else 0.0,
+            'high_confidence': int(scores[HIGH_CONFIDENCE_SCORE:].sum())
+        }
+
+    def score_histogram(self, job_type: Optional[str] = None, min_score: int = 0,
+                        max_score: int = 100) -> List[Tuple[int, int]]:
+        """(score, count) pairs for every score present in the slice"""
+        scores, _ = self._select(job_type, min_score, max_score)
+        return [(int(score), int(scores[score])) for score in np.flatnonzero(scores)]
+
+    def _prefix_sums(self) -> Tuple[List[str], np.ndarray, np.ndarray]:
+        with self._lock:
+            if self._prefix is None:
+                roles = list(self._scores)
+                leading = np.zeros((len(roles), 1), dtype=np.int64)
+                scores = np.array([self._scores[role] for role in roles], dtype=np.int64).reshape(-1, SCORE_BINS)
+                accepted = np.array([self._accepted[role] for role in roles], dtype=np.int64).reshape(-1, SCORE_BINS)
+                self._prefix = (roles, np.hstack((leading, scores.cumsum(axis=1))),
+                                np.hstack((leading, accepted.cumsum(axis=1))))
+            return self._prefix
+
+    def threshold_split(self, threshold: int) -> ThresholdSplit:
+        """Per role: applications at or above a review threshold by AI decision, and those below it.
+
+        Each role's score histogram is its sorted score array stored run-length
+        encoded, and its prefix sums give, for every score t, the number of
+        applications scoring below t - exactly where a binary search for t in
+        the sorted scores would land. Splitting at a threshold is therefore
+        one column read per role, however many results are stored; the prefix
+        sums are rebuilt once after new results arrive.
+        """
+        roles, scores, accepted = self._prefix_sums()
+        column = min(max(threshold, 0), SCORE_BINS)
+        below, total = scores[:, column], scores[:, -1]
+        accepted_above = accepted[:, -1] - accepted[:, column]
+        return ThresholdSplit(roles, total, accepted_above, total - below - accepted_above, below)
@@ -2,30 +2,78 @@
 # Real-world HR diagnostic tool for AI resume screening validation
 
 import streamlit as st
-import pandas as pd
-import re
 import io
-from typing import Dict, List, Tuple
-
-# Job requirements and constraints
-JOB_REQUIREMENTS = {
-    "data_engineer": {
-        "title": "Senior Data Engineer",
-        "department": "Engineering", 
-        "min_experience": 3,
-        "required_skills": ["python", "sql", "etl", "data pipeline", "spark", "airflow"],
-        "preferred_skills": ["aws", "docker", "kubernetes", "kafka", "hadoop"],
-        "education_required": ["bachelor", "master", "computer science", "engineering"]
-    },
-    "data_analyst": {
-        "title": "Data Analyst",
-        "department": "Analytics",
-        "min_experience": 2, 
-        "required_skills": ["sql", "excel", "tableau", "power bi", "statistics", "python"],
-        "preferred_skills": ["r", "looker", "data visualization", "business intelligence"],
-        "education_required": ["bachelor", "master", "statistics", "mathematics", "business"]
-    }
-}
+import time
+import uuid
+from typing import Dict, List
+
+from job_profiles import ProfileRegistry, get_registry
+from screening import PARALLEL_MIN_BATCH, screen_resumes, screen_resumes_parallel
+from screening_cache import ScreeningCache, content_hash, screening_key
+from results_store import ResultStore
+from analytics import ScreeningAggregates
+from results_table import ResultsTable
+from sampling import required_sample_size, stratified_sample
+from bias import analyze_bias, experience_bracket
+from consistency import check_consistency
+from role_index import get_role_index
+from talent_pool import TalentIndex
+from rescoring import FeatureCache, ScoringPolicy
+from edge_cases import CASES, LARGE_CASES, MB, run_edge_cases
+from ingest import DecodedText, decode_bytes
+from page_styles import stylesheet
+from session_memory import SessionMemory, SessionValues
+
+@st.cache_resource
+def get_screening_cache() -> ScreeningCache:
+    """Process-wide screening cache, shared by all sessions"""
+    return ScreeningCache(max_entries=10000)
+
+@st.cache_resource
+def get_profile_registry() -> ProfileRegistry:
+    """Process-wide job profiles, compiled once; edited files are reloaded in the background"""
+    registry = get_registry()
+    registry.watch()
+    return registry
+
+def role_title(job_type: str) -> str:
+    """Display title for a role, falling back to its id if the profile has since been removed"""
+    profile = get_profile_registry().get(job_type)
+    return profile.title if profile else job_type
+
+@st.cache_resource
+def get_result_store() -> ResultStore:
+    """Process-wide handle on the persistent results database"""
+    return ResultStore()
+
+@st.cache_resource
+def get_session_memory() -> SessionMemory:
+    """Process-wide budgeted store for every session's large values"""
+    return SessionMemory()
+
+def session_values() -> SessionValues:
+    """This session's result tables, reviews and reports, held under the memory budget"""
+    session_id = st.session_state.setdefault('memory_session', uuid.uuid4().hex)
+    return SessionValues(get_session_memory(), session_id)
+
+def rebalance_session_memory():
+    """Spill or evict cold values; called where a run or fragment run starts, before any value is held"""
+    values = session_values()
+    values.memory.rebalance(values.session_id)
+
+@st.cache_resource(max_entries=1)
+def get_talent_index(vocabulary: frozenset) -> TalentIndex:
+    """Retrieval index over the stored resumes; rebuilt only when the role vocabulary changes"""
+    return TalentIndex([], [], {}, vocabulary)
+
+def synced_talent_index() -> TalentIndex:
+    """The talent index with every resume stored since its last use appended"""
+    matcher = get_role_index().matcher
+    index = get_talent_index(frozenset(matcher.terms))
+    store = get_result_store()
+    index.sync(lambda after: ((sequence, filename, text)
+                              for sequence, _, filename, text in store.stored_resumes(after)), matcher)
+    return index
 
 def main():
     st.set_page_config(
@@ -33,185 +81,10 @@ def main():
         page_icon="🏢", 
         layout="wide"
     )
+    rebalance_session_memory()
     
-    # Professional CSS styling
-    st.markdown("""
-    <style>
-    /* Global typography improvements */
-    .main .block-container {
-        font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', 'Roboto', sans-serif;
-        line-height: 1.6;
-        color: #1f2937;
-    }
-    
-    /* Main header styling */
-    .main-header {
-        background: linear-gradient(90deg, #1e3a8a 0%, #3b82f6 100%);
-        padding: 2rem;
-        border-radius: 12px;
-        margin-bottom: 2rem;
-        color: white;
-        text-align: center;
-        box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
-    }
-    
-    .main-header h1 {
-        font-size: 2.2rem;
-        font-weight: 600;
-        margin-bottom: 0.5rem;
-        text-shadow: 1px 1px 2px rgba(0,0,0,0.2);
-    }
-    
-    .main-header p {
-        font-size: 1rem;
-        opacity: 0.9;
-        margin: 0;
-    }
-    
-    /* Professional diagnostic section */
-    .diagnostic-section {
-        background: linear-gradient(135deg, #fef3c7, #fde68a);
-        padding: 1.5rem;
-        border-radius: 10px;
-        border-left: 4px solid #f59e0b;
-        margin: 1rem 0;
-        box-shadow: 0 2px 4px rgba(0, 0, 0, 0.05);
-    }
-    
-    .diagnostic-section h3 {
-        color: #92400e;
-        font-size: 1.3rem;
-        font-weight: 600;
-        margin-top: 0;
-        margin-bottom: 0.5rem;
-    }
-    
-    .diagnostic-section p {
-        color: #78350f;
-        font-size: 0.95rem;
-        margin: 0;
-    }
-    
-    /* Candidate cards with professional styling */
-    .candidate-card {
-        background: #ffffff;
-        padding: 1.2rem;
-        border-radius: 8px;
-        border-left: 3px solid #3b82f6;
-        margin: 0.5rem 0;
-        font-size: 0.9rem;
-        box-shadow: 0 1px 3px rgba(0,0,0,0.1);
-        border: 1px solid #e5e7eb;
-    }
-    
-    /* Professional metric styling */
-    div[data-testid="metric-container"] {
-        background-color: #ffffff;
-        border: 1px solid #e5e7eb;
-        padding: 1rem;
-        border-radius: 8px;
-        box-shadow: 0 1px 3px rgba(0,0,0,0.05);
-    }
-    
-    div[data-testid="metric-container"] > label {
-        font-size: 0.8rem !important;
-        font-weight: 500 !important;
-        color: #6b7280 !important;
-        text-transform: uppercase;
-        letter-spacing: 0.05em;
-    }
-    
-    div[data-testid="metric-container"] > div {
-        font-size: 1.6rem !important;
-        font-weight: 600 !important;
-        color: #111827 !important;
-    }
-    
-    /* Typography hierarchy */
-    h1 {
-        font-size: 2rem !important;
-        font-weight: 600 !important;
-        color: #111827 !important;
-        margin-bottom: 1rem !important;
-    }
-    
-    h2 {
-        font-size: 1.5rem !important;
-        font-weight: 600 !important;
-        color: #1f2937 !important;
-        margin-top: 2rem !important;
-        margin-bottom: 1rem !important;
-    }
-    
-    h3 {
-        font-size: 1.25rem !important;
-        font-weight: 600 !important;
-        color: #374151 !important;
-        margin-top: 1.5rem !important;
-        margin-bottom: 0.75rem !important;
-    }
-    
-    h4 {
-        font-size: 1.1rem !important;
-        font-weight: 600 !important;
-        color: #4b5563 !important;
-        margin-top: 1.25rem !important;
-        margin-bottom: 0.5rem !important;
-    }
-    
-    /* Professional text sizing */
-    p, li {
-        font-size: 0.9rem !important;
-        line-height: 1.6 !important;
-        color: #374151 !important;
-    }
-    
-    /* Enhanced button styling */
-    .stButton > button {
-        background: linear-gradient(135deg, #3b82f6, #1d4ed8);
-        color: white;
-        border: none;
-        border-radius: 8px;
-        padding: 0.75rem 2rem;
-        font-size: 0.9rem;
-        font-weight: 600;
-        transition: all 0.3s ease;
-        box-shadow: 0 2px 4px rgba(59,130,246,0.3);
-    }
-    
-    .stButton > button:hover {
-        background: linear-gradient(135deg, #1d4ed8, #1e40af);
-        transform: translateY(-1px);
-        box-shadow: 0 4px 8px rgba(59,130,246,0.4);
-    }
-    
-    /* Form element styling */
-    .stCheckbox > label, .stSelectbox > label, .stSlider > label {
-        font-size: 0.85rem !important;
-        font-weight: 500 !important;
-        color: #374151 !important;
-    }
-    
-    /* Small text styling */
-    small {
-        font-size: 0.75rem !important;
-        color: #6b7280 !important;
-        line-height: 1.4 !important;
-    }
-    
-    /* Alert and info box styling */
-    .stAlert {
-        border-radius: 8px;
-        font-size: 0.85rem !important;
-    }
-    
-    /* Tab styling */
-    .stTabs [data-baseweb="tab-list"] button {
-        font-size: 0.85rem !important;
-        font-weight: 500 !important;
-    }
-    </style>
-    """, unsafe_allow_html=True)
+    # Professional CSS styling, loaded from styles/app.css once per process
+    st.html(stylesheet("app.css"))
     
     # Header
     st.markdown("""
@@ -221,31 +94,42 @@ def main():
     </div>
     """, unsafe_allow_html=True)
     
-    # Navigation
+    # Navigation - tabs are lazy: only the open tab's view runs on a rerun
+    render_start = time.perf_counter()
     tab1, tab2, tab3, tab4, tab5 = st.tabs([
         "📝 Resume Screening", 
         "🔍 AI Diagnostic Review", 
         "📊 System Analytics",
         "📋 Resources & Templates",
         "⚖️ Approach Comparison"
-    ])
+    ], key="active_tab", on_change="rerun")
     
     with tab1:
-        show_resume_screening()
+        if tab1.open:
+            show_resume_screening()
     
     with tab2:
-        show_diagnostic_review()
+        if tab2.open:
+            show_diagnostic_review()
         
     with tab3:
-        show_system_analytics()
+        if tab3.open:
+            show_system_analytics()
+            show_session_memory()
         
     with tab4:
-        show_resources_templates()
+        if tab4.open:
+            show_resources_templates()
         
     with tab5:
-        show_approach_comparison()
+        if tab5.open:
+            show_approach_comparison()
+    
+    st.caption(f"Page rendered in {(time.perf_counter() - render_start) * 1000:.0f} ms")
 
+@st.fragment
 def show_resume_screening():
+    rebalance_session_memory()
     st.header("Resume Screening Interface")
     st.write("*Internal tool for HR team to process incoming applications*")
     
@@ -253,10 +137,26 @@ def show_resume_screening():
     col1, col2 = st.columns([1, 2])
     
     with col1:
+        registry = get_profile_registry()
+        profiles = registry.snapshot()
         job_type = st.selectbox(
             "Select Position:",
-            ["data_engineer", "data_analyst"],
-            format_func=lambda x: JOB_REQUIREMENTS[x]["title"]
+            sorted(profiles, key=lambda x: (profiles[x].title, x)),
+            format_func=role_title,
+            help=f"{len(profiles)} open positions; type to search"
+        )
+        # One profile for the whole batch: keys, scores, storage and the results table
+        # agree on its revision even if the registry reloads part-way through
+        profile = profiles[job_type]
+        if registry.last_error:
+            st.warning("Job profile changes were not applied; the previous profiles are still in use.\n\n"
+                       + registry.last_error)
+    
+    with col2:
+        parallel_screening = st.toggle(
+            "Parallel screening",
+            value=True,
+            help=f"Spread large batches over all CPU cores (batches under {PARALLEL_MIN_BATCH} resumes are screened serially)"
         )
     
     # Resume upload
@@ -269,69 +169,220 @@ def show_resume_screening():
     )
     
     if uploaded_files:
-        st.subheader("AI Screening Results - For HR Review Only")
+        # Each upload is read once: a zero-copy view of its buffer is hashed for
+        # the cache key and, on a miss, decoded directly
+        views = [file.getbuffer() for file in uploaded_files]
         
-        screening_results = []
-        
-        for i, file in enumerate(uploaded_files):
-            # Read file with encoding handling
-            if file.type == "text/plain":
-                try:
-                    resume_text = str(file.read(), "utf-8")
-                except UnicodeDecodeError:
-                    file.seek(0)
-                    try:
-                        resume_text = str(file.read(), "latin-1")
-                    except UnicodeDecodeError:
-                        file.seek(0)
-                        resume_text = str(file.read(), "cp1252")
-            else:
-                # Simulate PDF parsing
-                resume_text = "Sample resume with data engineering experience, Python, SQL skills, 4 years experience..."
+        # Reuse results for files already screened under this role and scoring config
+        cache = get_screening_cache()
+        decoders = ["text" if file.type == "text/plain" else "pdf" for file in uploaded_files]
+        cache_keys = [screening_key(content_hash(view), job_type, decoder, profile)
+                      for view, decoder in zip(views, decoders)]
+        entries = [cache.get(key) for key in cache_keys]
+        pending = [i for i, entry in enumerate(entries) if entry is None]
+        full_texts: Dict[int, str] = {}
+        
+        if pending:
+            decoded_files = []
             
-            # AI screening
-            screening_result = screen_resume(resume_text, job_type)
-            candidate_name = f"Candidate_{i+1}"
+            for i in pending:
+                # Read file with encoding detection
+                if decoders[i] == "text":
+                    decoded_files.append(decode_bytes(views[i]))
+                else:
+                    # Simulate PDF parsing
+                    decoded_files.append(DecodedText(
+                        "Sample resume with data engineering experience, Python, SQL skills, 4 years experience...",
+                        "pdf (simulated)",
+                        0.0
+                    ))
             
-            screening_results.append({
-                'name': candidate_name,
-                'filename': file.name,
-                'result': screening_result,
-                'resume_text': resume_text[:200]
-            })
+            # AI screening - new or changed files only, scored as one batch
+            resume_texts = [decoded.text for decoded in decoded_files]
+            full_texts = dict(zip(pending, resume_texts))
+            if parallel_screening:
+                pending_frame = screen_resumes_parallel(resume_texts, job_type, profile=profile)
+            else:
+                pending_frame = screen_resumes(resume_texts, job_type, profile)
             
-            # Display result in HR format
-            st.markdown(f"""
-            <div class="candidate-card">
-                <strong>{candidate_name}</strong> ({file.name})<br>
-                AI Decision: <strong>{screening_result['decision']}</strong> | 
-                Score: <strong>{screening_result['total_score']}/100</strong> | 
-                Experience: <strong>{screening_result['experience_assessment']}</strong>
-            </div>
-            """, unsafe_allow_html=True)
+            for i, decoded, screening_result in zip(pending, decoded_files, pending_frame.to_dict('records')):
+                entries[i] = {
+                    'result': screening_result,
+                    'resume_text': decoded.text[:200],
+                    'encoding': decoded.encoding,
+                    'decode_ms': decoded.decode_seconds * 1000,
+                    'size_kb': views[i].nbytes / 1024
+                }
+                cache.put(cache_keys[i], entries[i])
+        
+        for view in views:
+            view.release()
         
-        # Store for diagnostic review
-        st.session_state.screening_results = screening_results
+        import pandas as pd
+        screening_frame = pd.DataFrame([entry['result'] for entry in entries])
         
-        # Summary metrics
-        if screening_results:
-            total_apps = len(screening_results)
-            accepted = len([r for r in screening_results if r['result']['decision'] == 'Accept'])
+        # Persist each distinct upload batch once, not on every rerun
+        batch_signature = (job_type, tuple(cache_keys))
+        if st.session_state.get('batch_signature') != batch_signature:
+            st.session_state.batch_id = get_result_store().add_batch(job_type, [
+                {
+                    'content_hash': key[0],
+                    'filename': file.name,
+                    'resume_text': entry['resume_text'],
+                    'result': entry['result'],
+                    'full_text': full_texts.get(i)
+                }
+                for i, (file, key, entry) in enumerate(zip(uploaded_files, cache_keys, entries))
+            ], profile)
+            st.session_state.batch_signature = batch_signature
             
-            col1, col2, col3 = st.columns(3)
-            with col1:
-                st.metric("Applications Processed", total_apps)
-            with col2:
-                st.metric("AI Recommendations", f"{accepted} Accept, {total_apps-accepted} Reject")
-            with col3:
-                st.metric("Acceptance Rate", f"{accepted/total_apps*100:.1f}%")
+            # Running analytics for this batch, built once as its results are produced
+            batch_aggregates = ScreeningAggregates()
+            batch_aggregates.add_batch(job_type, screening_frame['total_score'], screening_frame['decision'])
+            session_values()['batch_aggregates'] = batch_aggregates
             
-            st.warning("⚠️ **HR Notice**: These are AI recommendations only. Human review required before any hiring decisions.")
+            # The session keeps the batch column-wise only, for the results view and diagnostic review
+            session_values()['results_table'] = ResultsTable(
+                profile,
+                [file.name for file in uploaded_files],
+                [key[0] for key in cache_keys],
+                screening_frame,
+                [entry['encoding'] for entry in entries],
+                [entry['decode_ms'] for entry in entries],
+                [entry['size_kb'] for entry in entries]
+            )
+    
+    # Results persist in session state, so they survive switching tabs
+    table = session_values().get('results_table')
+    
+    if table is not None:
+        st.subheader("AI Screening Results - For HR Review Only")
+        
+        if uploaded_files:
+            st.caption(f"{len(pending)} new or changed files screened, {len(entries) - len(pending)} reused from cache")
+        else:
+            st.caption("Showing the most recently processed batch")
+        
+        with st.expander("Upload decoding"):
+            import pandas as pd
+            st.dataframe(
+                pd.DataFrame({
+                    'File': table.filenames,
+                    'Size (KB)': table.size_kb.round(1),
+                    'Encoding': table.encodings(),
+                    'Decode time (ms)': table.decode_ms.round(3)
+                }),
+                hide_index=True,
+                width="stretch"
+            )
+        
+        show_results_page(table)
+        show_best_fit_roles(table)
+        
+        # Summary metrics, read off the table so they are available whenever it is
+        total_apps = len(table)
+        accepted = int(table.accepted.sum())
+        
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("Applications Processed", total_apps)
+        with col2:
+            st.metric("AI Recommendations", f"{accepted} Accept, {total_apps-accepted} Reject")
+        with col3:
+            st.metric("Acceptance Rate", f"{accepted/total_apps*100:.1f}%")
+        
+        st.warning("⚠️ **HR Notice**: These are AI recommendations only. Human review required before any hiring decisions.")
 
+def show_best_fit_roles(table: ResultsTable):
+    """Rank every open position for one candidate, scanning their resume once"""
+    index = get_role_index()
+    with st.expander(f"Best-fit roles across all {len(index)} open positions"):
+        position = st.selectbox(
+            "Candidate",
+            range(len(table)),
+            format_func=lambda i: f"{table.name(i)} ({table.filenames[i]})",
+            key="best_fit_candidate"
+        )
+        content_hash = table.content_hash(position)
+        text = get_result_store().resume_texts([content_hash]).get(content_hash)
+        if text is None:
+            st.caption("The full text of this resume was not stored, so it cannot be re-scored")
+            return
+        
+        started = time.perf_counter()
+        ranked = index.rank(text, top=10)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        st.dataframe(
+            {
+                'Position': [r['title'] for r in ranked],
+                'Decision': [r['decision'] for r in ranked],
+                'Score': [r['total_score'] for r in ranked],
+                'Skills': [r['skills_score'] for r in ranked],
+                'Experience': [r['experience_score'] for r in ranked],
+                'Education': [r['education_score'] for r in ranked],
+                'Matched skills': [', '.join(r['found_skills']) for r in ranked]
+            },
+            hide_index=True,
+            width="stretch"
+        )
+        st.caption(f"Top {len(ranked)} of {len(index)} positions, ranked in {elapsed_ms:.2f} ms")
+
+def show_results_page(table: ResultsTable):
+    """One page of the batch's results, sorted and filtered server-side"""
+    col1, col2, col3, col4 = st.columns([1, 2, 2, 2])
+    with col1:
+        decision = st.selectbox("Decision", ["All", "Accept", "Reject"], key="results_decision")
+    with col2:
+        min_score, max_score = st.slider("Score", 0, 100, (0, 100), key="results_score")
+    with col3:
+        skill = st.selectbox("Matched skill", ["Any"] + table.skills(), key="results_skill")
+    with col4:
+        sort_labels = {
+            "Score (high to low)": ('total_score', True),
+            "Score (low to high)": ('total_score', False),
+            "Experience (most first)": ('experience_years', True),
+            "Skills score (high to low)": ('skills_score', True),
+            "Upload order": (None, False)
+        }
+        sort_by, descending = sort_labels[st.selectbox("Sort by", list(sort_labels), key="results_sort")]
+    
+    rows = table.query(
+        decision=None if decision == "All" else decision,
+        min_score=min_score,
+        max_score=max_score,
+        skill=None if skill == "Any" else skill,
+        sort_by=sort_by,
+        descending=descending
+    )
+    
+    col1, col2 = st.columns([1, 3])
+    with col1:
+        page_size = st.selectbox("Rows per page", [25, 50, 100, 250], key="results_page_size")
+    pages = max(1, -(-len(rows) // page_size))
+    # A narrower filter can leave the stored page past the end
+    if st.session_state.get("results_page", 1) > pages:
+        st.session_state.results_page = pages
+    with col2:
+        page = st.number_input(f"Page (of {pages})", min_value=1, max_value=pages, step=1, key="results_page")
+    
+    first = (page - 1) * page_size
+    st.caption(f"Showing {min(first + 1, len(rows))}-{min(first + page_size, len(rows))} "
+               f"of {len(rows)} matching candidates ({len(table)} in batch)")
+    st.dataframe(
+        table.page(rows, page, page_size),
+        hide_index=True,
+        width="stretch",
+        column_config={
+            "Score": st.column_config.ProgressColumn("Score", min_value=0, max_value=100, format="%d")
+        }
+    )
+
+@st.fragment
 def show_diagnostic_review():
+    rebalance_session_memory()
     st.header("AI System Diagnostic Review")
     
-    if 'screening_results' not in st.session_state or not st.session_state.screening_results:
+    if 'batch_id' not in st.session_state:
         st.info("No screening results available. Please process resumes in the Resume Screening tab first.")
         return
     
@@ -342,7 +393,7 @@ def show_diagnostic_review():
     </div>
     """, unsafe_allow_html=True)
     
-    results = st.session_state.screening_results
+    results = get_result_store().batch_results(st.session_state.batch_id)
     
     # Diagnostic configuration
     st.markdown("### Configure Diagnostic Review")
@@ -360,14 +411,53 @@ def show_diagnostic_review():
         st.write("**Review Parameters**")
         reviewer_type = st.selectbox("Human Reviewer Role", ["Senior HR Manager", "Technical Hiring Manager", "Department Head"])
         review_threshold = st.slider("Human Override Threshold", 0, 100, 70, help="Score below which human review is mandatory")
+        
+        # Sample size needed for the chosen confidence interval on the agreement rate
+        col_conf, col_margin = st.columns(2)
+        with col_conf:
+            confidence = st.select_slider("Confidence Level", [0.80, 0.90, 0.95, 0.99], value=0.95,
+                                          format_func=lambda c: f"{c:.0%}")
+        with col_margin:
+            margin = st.slider("Margin of Error (±%)", 2, 25, 10,
+                               help="Half-width of the confidence interval on the human-AI agreement rate")
+        required = required_sample_size(confidence, margin / 100, population=len(results))
+        st.caption(f"{required} reviews give a {confidence:.0%} confidence interval of ±{margin}% "
+                   f"on the agreement rate across {len(results)} applications")
+        
         # Handle slider edge case when only one result exists
         max_sample = max(len(results), 2)
-        default_sample = min(5, len(results))
-        sample_size = st.slider("Sample Size for Review", 1, max_sample, default_sample)
+        sample_size = st.slider("Sample Size for Review", 1, max_sample, required)
+        sample_seed = st.number_input("Sampling Seed", min_value=0, value=0, step=1,
+                                      help="The same seed always draws the same candidates")
+    
+    show_threshold_what_if(review_threshold)
+    
+    # Stratified by role, decision and score band rather than the first N uploads
+    sample = stratified_sample(
+        [r['result']['total_score'] for r in results],
+        [r['result']['decision'] for r in results],
+        [r['job_type'] for r in results],
+        sample_size,
+        seed=sample_seed
+    )
+    with st.expander(f"Review sample: {len(sample.positions)} candidates across {len(sample.strata)} strata"):
+        st.dataframe(
+            {
+                'Stratum (role / decision / score band)': sample.strata,
+                'Applications': sample.population,
+                'Sampled': sample.allocated
+            },
+            hide_index=True,
+            width="stretch"
+        )
     
     if st.button("Conduct Diagnostic Review", type="primary"):
+        st.session_state.diagnosis_batch = st.session_state.batch_id
+    
+    # The review stays open across reruns (page submits, page changes) until a new batch arrives
+    if st.session_state.get('diagnosis_batch') == st.session_state.batch_id:
         conduct_systematic_diagnosis(
-            results[:sample_size], 
+            [results[position] for position in sample.positions], 
             {
                 'accuracy': test_accuracy,
                 'consistency': test_consistency, 
@@ -375,10 +465,313 @@ def show_diagnostic_review():
                 'edge_cases': test_edge_cases
             },
             reviewer_type,
-            review_threshold
+            review_threshold,
+            batch_results=results
+        )
+
+def show_threshold_what_if(threshold: int):
+    """Live split of applications at the Human Override Threshold, from the running score histograms"""
+    st.markdown("### Override Threshold What-If")
+    scope = st.radio("Applications", ["Current batch", "All stored applications"], horizontal=True,
+                     key="what_if_scope")
+    aggregates = session_values().get('batch_aggregates') if scope == "Current batch" else get_result_store().aggregates
+    if aggregates is None:
+        st.caption("The current batch's results are no longer held for this session")
+        return
+    
+    started = time.perf_counter()
+    split = aggregates.threshold_split(threshold)
+    elapsed_us = (time.perf_counter() - started) * 1e6
+    total = int(split.applications.sum())
+    if not total:
+        st.caption("No applications to split yet")
+        return
+    review = int(split.review.sum())
+    
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("AI Accept, no review needed", int(split.accepted.sum()))
+    with col2:
+        st.metric("AI Reject, no review needed", int(split.rejected.sum()))
+    with col3:
+        st.metric("Mandatory human review", f"{review / total:.1%}", help=f"{review} of {total} score below {threshold}")
+    
+    order = sorted(range(len(split.roles)), key=lambda i: role_title(split.roles[i]))
+    st.dataframe(
+        {
+            'Position': [role_title(split.roles[i]) for i in order],
+            'Applications': split.applications[order],
+            'AI Accept': split.accepted[order],
+            'AI Reject': split.rejected[order],
+            'Mandatory review': split.review[order],
+            'Review share': [f"{split.review[i] / split.applications[i]:.1%}" if split.applications[i] else "-"
+                             for i in order]
+        },
+        hide_index=True,
+        width="stretch"
+    )
+    st.caption(f"{total:,} applications split at a threshold of {threshold} in {elapsed_us:.0f} µs")
+
+REVIEW_DECISIONS = ["Accept", "Reject", "Interview", "Further Review"]
+REVIEW_PAGE_SIZE = 20
+
+def batch_reviews(batch_id: str) -> Dict:
+    """Saved human reviews of a batch, by position"""
+    return session_values().setdefault('human_reviews', {}).setdefault(batch_id, {})
+
+def save_review_page(page_candidates: List[Dict], batch_id: str, pages: int):
+    """Form submit callback: store the page's decisions and move to the next page"""
+    # Looked up here rather than bound at render time, in case the reviews were spilled in between
+    reviews = batch_reviews(batch_id)
+    for candidate in page_candidates:
+        position = candidate['position']
+        reviews[position] = {
+            'human_decision': st.session_state[f"human_{position}"],
+            'human_confidence': st.session_state[f"conf_{position}"],
+            'notes': st.session_state[f"notes_{position}"]
+        }
+    if st.session_state.review_page < pages:
+        st.session_state.review_page += 1
+
+def show_review_page(results: List[Dict], reviews: Dict, reviewer_type: str):
+    """One page of the human review grid inside a form, so editing it causes no reruns"""
+    pages = max(1, -(-len(results) // REVIEW_PAGE_SIZE))
+    if st.session_state.get("review_page", 1) > pages:
+        st.session_state.review_page = pages
+    
+    col1, col2 = st.columns([1, 3])
+    with col1:
+        page = st.number_input(f"Review page (of {pages})", min_value=1, max_value=pages, step=1, key="review_page")
+    with col2:
+        reviewed = sum(1 for candidate in results if candidate['position'] in reviews)
+        st.caption(f"{reviewed} of {len(results)} candidates reviewed. "
+                   "Decisions on a page are saved together when the page is submitted.")
+    
+    page_candidates = results[(page - 1) * REVIEW_PAGE_SIZE:page * REVIEW_PAGE_SIZE]
+    
+    with st.form("review_page_form"):
+        header = st.columns([3, 2, 2, 3])
+        header[0].write("**Candidate / AI Recommendation**")
+        header[1].write(f"**Human Decision ({reviewer_type})**")
+        header[2].write("**Reviewer Confidence**")
+        header[3].write("**Review Notes**")
+        
+        for candidate in page_candidates:
+            position = candidate['position']
+            result = candidate['result']
+            saved = reviews.get(position, {})
+            
+            col1, col2, col3, col4 = st.columns([3, 2, 2, 3])
+            with col1:
+                st.markdown(f"**{candidate['name']}** - AI: {result['decision']} ({result['total_score']})")
+                status = ""
+                if saved:
+                    agrees = saved['human_decision'].lower() == result['decision'].lower()
+                    status = " | ✅ Agreement" if agrees else " | ⚠️ Override"
+                st.caption(f"Skills {result['skills_score']} | Experience {result['experience_score']} | "
+                           f"Education {result['education_score']}{status}")
+            with col2:
+                st.selectbox(
+                    "Human Decision",
+                    REVIEW_DECISIONS,
+                    index=REVIEW_DECISIONS.index(saved.get('human_decision', "Accept")),
+                    key=f"human_{position}",
+                    label_visibility="collapsed"
+                )
+            with col3:
+                st.slider("Reviewer Confidence", 1, 10, saved.get('human_confidence', 7),
+                          key=f"conf_{position}", label_visibility="collapsed")
+            with col4:
+                st.text_area(
+                    "Review Notes",
+                    value=saved.get('notes', ""),
+                    placeholder="Context, concerns, additional factors...",
+                    key=f"notes_{position}",
+                    height=68,
+                    label_visibility="collapsed"
+                )
+        
+        st.form_submit_button(
+            "Save page" if page == pages else "Save page and continue",
+            type="primary",
+            on_click=save_review_page,
+            args=(page_candidates, st.session_state.batch_id, pages)
         )
 
-def conduct_systematic_diagnosis(results, tests, reviewer_type, threshold):
+def load_candidate_attributes(data) -> Dict[str, Dict[str, str]]:
+    """filename -> {attribute: value} from an uploaded CSV with a 'filename' column"""
+    import csv
+    rows = csv.DictReader(io.StringIO(decode_bytes(data).text))
+    return {row['filename']: {k: v for k, v in row.items() if k != 'filename'} for row in rows if row.get('filename')}
+
+def show_bias_analysis(batch_results: List[Dict]):
+    """Acceptance and score disparities per group, with significance tests"""
+    attributes = {
+        "Experience bracket": [experience_bracket(c['result']['experience_years']) for c in batch_results],
+        "Education keyword": ["Found" if c['result']['education_score'] == 100 else "Not found"
+                              for c in batch_results]
+    }
+    
+    attribute_file = st.file_uploader(
+        "Candidate attributes (optional CSV with a 'filename' column, e.g. self-reported demographics)",
+        type=['csv'],
+        key="bias_attributes"
+    )
+    if attribute_file is not None:
+        candidate_attributes = load_candidate_attributes(attribute_file.getbuffer())
+        columns = {column for values in candidate_attributes.values() for column in values}
+        for column in sorted(columns):
+            attributes[column] = [candidate_attributes.get(c['filename'], {}).get(column) or "Unknown"
+                                  for c in batch_results]
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        attribute = st.selectbox("Group attribute", list(attributes), key="bias_attribute")
+    with col2:
+        n_permutations = st.select_slider("Permutations", [1000, 10000, 100000], value=10000, key="bias_permutations")
+    
+    # Reports are kept per batch and attribute, so review-page reruns do not repeat the tests
+    cache_key = (st.session_state.batch_id, attribute, n_permutations,
+                 attribute_file.file_id if attribute_file is not None else None)
+    reports = session_values().setdefault('bias_reports', {})
+    if cache_key not in reports:
+        reports[cache_key] = analyze_bias(
+            attributes[attribute],
+            [c['result']['decision'] for c in batch_results],
+            [c['result']['total_score'] for c in batch_results],
+            n_permutations=n_permutations
+        )
+    report = reports[cache_key]
+    
+    st.dataframe(
+        {
+            attribute: [g['group'] for g in report['groups']],
+            'Applications': [g['applications'] for g in report['groups']],
+            'Acceptance rate': [f"{g['acceptance_rate']:.1%}" for g in report['groups']],
+            'Impact ratio': [round(g['impact_ratio'], 2) for g in report['groups']],
+            'Mean score': [round(g['mean_score'], 1) for g in report['groups']],
+            'Score p-value': [round(g['score_p_value'], 4) for g in report['groups']]
+        },
+        hide_index=True,
+        width="stretch"
+    )
+    
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Chi-square", f"{report['chi_square']:.2f}", help=f"{report['dof']} degrees of freedom")
+    with col2:
+        st.metric("p-value (chi-square)", f"{report['chi_square_p']:.4f}")
+    with col3:
+        st.metric("p-value (permutation)", f"{report['chi_square_permutation_p']:.4f}",
+                  help=f"{report['n_permutations']:,} label permutations")
+    
+    adverse = [g['group'] for g in report['groups'] if g['adverse_impact']]
+    if adverse:
+        st.error(f"🚨 Adverse impact (four-fifths rule) against: {', '.join(adverse)} "
+                 f"- acceptance under 80% of the '{report['reference_group']}' group's rate")
+    if report['chi_square_permutation_p'] < 0.05:
+        st.warning(f"⚠️ Acceptance rates differ significantly across {attribute.lower()} groups")
+    elif not adverse:
+        st.success(f"✅ No significant acceptance-rate differences across {attribute.lower()} groups")
+
+def show_metamorphic_consistency(results: List[Dict]):
+    """Re-screen perturbed copies of the sampled resumes and report decision flips"""
+    st.markdown("##### Metamorphic Consistency Test")
+    st.caption("Each sampled resume is re-screened with changes a reviewer would ignore: another name, "
+               "reordered sections, equivalent wording, spacing and letter case. Decisions should not change.")
+    
+    n_variants = st.slider("Variants per resume", 5, 20, 10, key="consistency_variants")
+    
+    texts = get_result_store().resume_texts([c['content_hash'] for c in results])
+    tested = [c for c in results if c['content_hash'] in texts]
+    if len(tested) < len(results):
+        st.caption(f"{len(results) - len(tested)} sampled resumes have no stored text and are skipped")
+    if not tested:
+        return
+    
+    # Memoised per batch, sample and variant count, so review reruns do not re-screen
+    cache_key = (st.session_state.batch_id, tuple(c['position'] for c in tested), n_variants)
+    reports = session_values().setdefault('consistency_reports', {})
+    if cache_key not in reports:
+        reports[cache_key] = check_consistency(
+            [texts[c['content_hash']] for c in tested],
+            tested[0]['job_type'],
+            n_variants=n_variants
+        )
+    report = reports[cache_key]
+    
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Decision Flip Rate", f"{report['flip_rate']:.1%}")
+    with col2:
+        st.metric("Resumes With Flips", f"{report['resumes_with_flips']} of {report['resumes']}")
+    with col3:
+        st.metric("Variants Screened", f"{report['variants']:,}", help=f"{report['variants_per_sec']:,.0f} resumes/sec")
+    
+    st.dataframe(
+        {
+            'Perturbation': list(report['by_perturbation']),
+            'Variants': [p['variants'] for p in report['by_perturbation'].values()],
+            'Flip rate': [f"{p['flip_rate']:.1%}" for p in report['by_perturbation'].values()],
+            'Mean score change': [round(p['mean_score_change'], 2) for p in report['by_perturbation'].values()]
+        },
+        hide_index=True,
+        width="stretch"
+    )
+    if report['most_unstable']:
+        st.caption("Least stable: " + ", ".join(
+            f"{tested[u['index']]['name']} ({u['flips']} flips)" for u in report['most_unstable'][:5]))
+    
+    if report['flip_rate'] == 0:
+        st.success("✅ Decisions are stable under all perturbations")
+    else:
+        st.warning("⚠️ Some decisions change under irrelevant edits - the screener depends on surface form")
+
+def show_edge_case_performance(job_type: str):
+    """Run generated pathological resumes through screening under time and memory budgets"""
+    st.caption("Empty files, binary junk, invalid encodings, deep Unicode, digit runs and thousands of repeated "
+               "\"experience\" tokens are screened one per process. Each input must finish within a time budget "
+               "and memory budget that grow with its size; crashes and overruns are listed below.")
+    
+    include_large = st.toggle("Include 50 MB inputs", value=False, key="edge_case_large",
+                              help=f"Runs {', '.join(LARGE_CASES)} at 50 MB; takes about half a minute")
+    large_size = 50 * MB if include_large else MB
+    
+    reports = session_values().setdefault('edge_case_reports', {})
+    cache_key = (job_type, large_size)
+    if st.button("Run Edge Case Tests", key="edge_case_run"):
+        progress = st.progress(0.0, text="Running edge cases...")
+        done = []
+        def advance(result):
+            done.append(result)
+            progress.progress(len(done) / len(CASES), text=f"Ran {result.case}")
+        reports[cache_key] = run_edge_cases(MB, large_size, job_type, progress=advance)
+        progress.empty()
+    if cache_key not in reports:
+        return
+    results = reports[cache_key]
+    
+    st.dataframe(
+        {
+            'Input': [r.case for r in results],
+            'Size (MB)': [round(r.size / MB, 2) for r in results],
+            'Status': [r.status for r in results],
+            'Time (s)': [None if r.seconds is None else round(r.seconds, 2) for r in results],
+            'Time budget (s)': [round(r.time_budget, 1) for r in results],
+            'Peak memory (MB)': [None if r.peak_memory is None else round(r.peak_memory / MB, 1) for r in results],
+            'Memory budget (MB)': [round(r.memory_budget / MB) for r in results],
+            'Detail': [r.detail for r in results]
+        },
+        hide_index=True,
+        width="stretch"
+    )
+    failures = [r for r in results if r.status != 'ok']
+    if failures:
+        st.error("🚨 " + ", ".join(f"{r.case} ({r.status.replace('_', ' ')})" for r in failures))
+    else:
+        st.success(f"✅ All {len(results)} edge cases screened within budget")
+
+def conduct_systematic_diagnosis(results, tests, reviewer_type, threshold, batch_results=None):
     st.markdown("### Diagnostic Analysis Results")
     
     if tests['accuracy']:
@@ -387,67 +780,31 @@ def conduct_systematic_diagnosis(results, tests, reviewer_type, threshold):
         st.write("**Manual Review Process:**")
         st.write(f"Reviewer: {reviewer_type}")
         
-        human_ai_comparison = []
+        # Reviews are saved per batch and survive reruns; each page is submitted as one form
+        reviews = batch_reviews(st.session_state.batch_id)
+        show_review_page(results, reviews, reviewer_type)
         
-        for i, candidate in enumerate(results):
-            ai_decision = candidate['result']['decision']
-            ai_score = candidate['result']['total_score']
-            
-            st.markdown(f"**{candidate['name']}** - AI Score: {ai_score}")
-            
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                st.write(f"**AI Recommendation:** {ai_decision}")
-                st.write(f"**AI Reasoning:**")
-                st.write(f"- Skills: {candidate['result']['skills_score']}/100")
-                st.write(f"- Experience: {candidate['result']['experience_score']}/100") 
-                st.write(f"- Education: {candidate['result']['education_score']}/100")
-            
-            with col2:
-                human_decision = st.selectbox(
-                    f"Human Decision ({reviewer_type}):",
-                    ["Accept", "Reject", "Interview", "Further Review"],
-                    key=f"human_{i}"
-                )
-                
-                human_confidence = st.slider(
-                    "Reviewer Confidence",
-                    1, 10, 7,
-                    key=f"conf_{i}"
-                )
-                
-                human_notes = st.text_area(
-                    "Review Notes:",
-                    placeholder="Context, concerns, additional factors...",
-                    key=f"notes_{i}",
-                    height=80
-                )
-            
-            # Store comparison
-            agreement = (ai_decision.lower() == human_decision.lower())
+        human_ai_comparison = []
+        for candidate in results:
+            review = reviews.get(candidate['position'])
+            if review is None:
+                continue
             human_ai_comparison.append({
                 'candidate': candidate['name'],
-                'ai_decision': ai_decision,
-                'human_decision': human_decision,
-                'agreement': agreement,
-                'ai_score': ai_score,
-                'human_confidence': human_confidence,
-                'notes': human_notes
+                'ai_decision': candidate['result']['decision'],
+                'human_decision': review['human_decision'],
+                'agreement': candidate['result']['decision'].lower() == review['human_decision'].lower(),
+                'ai_score': candidate['result']['total_score'],
+                'human_confidence': review['human_confidence'],
+                'notes': review['notes']
             })
-            
-            if agreement:
-                st.success("✅ Human-AI Agreement")
-            else:
-                st.warning("⚠️ Human Override Required")
-                
-            st.markdown("---")
         
         # Summary analysis
         if human_ai_comparison:
             agreement_rate = sum(1 for c in human_ai_comparison if c['agreement']) / len(human_ai_comparison)
             
             st.markdown("#### Human-AI Validation Summary")
+            st.caption(f"Based on {len(human_ai_comparison)} of {len(results)} sampled candidates reviewed so far")
             col1, col2, col3 = st.columns(3)
             
             with col1:
@@ -470,6 +827,7 @@ def conduct_systematic_diagnosis(results, tests, reviewer_type, threshold):
     if tests['consistency']:
         st.markdown("#### Decision Consistency Analysis")
         
+        import pandas as pd
         scores = [r['result']['total_score'] for r in results]
         score_series = pd.Series(scores)
         score_std = score_series.std()
@@ -493,6 +851,8 @@ def conduct_systematic_diagnosis(results, tests, reviewer_type, threshold):
             st.success("✅ Consistent scoring patterns")
         else:
             st.warning("⚠️ High score variance - may indicate inconsistent criteria application")
+        
+        show_metamorphic_consistency(results)
     
     if tests['bias']:
         st.markdown("#### Bias Detection Analysis")
@@ -504,9 +864,11 @@ def conduct_systematic_diagnosis(results, tests, reviewer_type, threshold):
         - Experience pathway biases
         - Keyword dependency patterns
         
-        *In production: Analyze patterns across hundreds of applications*
+        *Group tests below run over every application in the batch, not just the review sample*
         """)
         
+        show_bias_analysis(batch_results or results)
+        
         acceptance_rate = len([r for r in results if r['result']['decision'] == 'Accept']) / len(results)
         
         if acceptance_rate < 0.05:
@@ -515,43 +877,74 @@ def conduct_systematic_diagnosis(results, tests, reviewer_type, threshold):
             st.warning("Very high acceptance rate - potential under-filtering")
         else:
             st.success("Reasonable acceptance rate observed")
+    
+    if tests['edge_cases']:
+        st.markdown("#### Edge Case Performance")
+        show_edge_case_performance(results[0]['job_type'])
 
 def show_system_analytics():
     st.header("System Performance Analytics")
     
-    if 'screening_results' not in st.session_state:
-        st.info("No data available. Process some applications first.")
-        return
+    store = get_result_store()
     
-    results = st.session_state.screening_results
-    
-    # Performance metrics
-    col1, col2, col3, col4 = st.columns(4)
+    # Slice selection
+    col1, col2, col3 = st.columns(3)
     
     with col1:
-        total = len(results)
-        st.metric("Total Applications", total)
+        # Gone once the session expires from session memory, even if batch_id survives
+        batch_aggregates = session_values().get('batch_aggregates')
+        scope_options = ["All stored applications"]
+        if batch_aggregates is not None:
+            scope_options.insert(0, "Current batch")
+        scope = st.selectbox("Scope", scope_options)
+        if batch_aggregates is None and 'batch_id' in st.session_state:
+            st.caption("The current batch's results are no longer held for this session")
     
     with col2:
-        accepted = len([r for r in results if r['result']['decision'] == 'Accept'])
-        st.metric("AI Recommendations", f"{accepted} Accept")
+        role = st.selectbox(
+            "Position",
+            [None] + sorted(get_profile_registry(), key=role_title),
+            format_func=lambda x: "All positions" if x is None else role_title(x)
+        )
     
     with col3:
-        avg_score = sum(r['result']['total_score'] for r in results) / len(results)
-        st.metric("Average AI Score", f"{avg_score:.1f}")
-    
-    with col4:
-        high_confidence = len([r for r in results if r['result']['total_score'] >= 80])
-        st.metric("High Confidence Cases", high_confidence)
-    
-    # Score distribution
-    st.subheader("AI Score Distribution")
-    scores = [r['result']['total_score'] for r in results]
-    score_df = pd.DataFrame({'scores': scores})
+        min_score, max_score = st.slider("Score Band", 0, 100, (0, 100))
+    
+    # Running aggregates: reading them is O(1) in the number of applications
+    if scope == "Current batch":
+        aggregates = batch_aggregates
+    else:
+        aggregates = store.aggregates
+    summary = aggregates.summary(role, min_score, max_score)
+    
+    if not summary['total']:
+        # The shortlist below works over every stored resume, whatever the slice holds
+        st.info("No screening results in this slice. Process some applications first.")
+    else:
+        # Performance metrics
+        col1, col2, col3, col4 = st.columns(4)
+        
+        with col1:
+            st.metric("Total Applications", summary['total'])
+        
+        with col2:
+            st.metric("AI Recommendations", f"{summary['accepted']} Accept")
+        
+        with col3:
+            st.metric("Average AI Score", f"{summary['avg_score']:.1f}")
+        
+        with col4:
+            st.metric("High Confidence Cases", summary['high_confidence'])
+        
+        # Score distribution
+        st.subheader("AI Score Distribution")
+        import pandas as pd
+        import plotly.express as px
+        score_df = pd.DataFrame(aggregates.score_histogram(role, min_score, max_score), columns=['scores', 'count'])
+        fig = px.histogram(score_df, x='scores', y='count', histfunc='sum', nbins=10, title="Distribution of AI Screening Scores")
+        st.plotly_chart(fig, width="stretch")
     
-    import plotly.express as px
-    fig = px.histogram(score_df, x='scores', nbins=10, title="Distribution of AI Screening Scores")
-    st.plotly_chart(fig, width="stretch")
+    show_talent_pool_shortlist(role)
     
     st.subheader("Key Insights")
     st.info("""
@@ -562,6 +955,125 @@ def show_system_analytics():
     - The diagnostic process ensures responsible AI deployment in human-centered applications
     """)
 
+@st.cache_resource(max_entries=8)
+def get_feature_cache(role: str, revision: int, vocabulary: frozenset) -> FeatureCache:
+    """A role's features over the stored pool, taken from the talent index's posting lists"""
+    return FeatureCache.from_talent_index(get_talent_index(vocabulary), get_profile_registry()[role])
+
+def synced_feature_cache(role: str) -> FeatureCache:
+    """A role's feature cache with every resume stored since its last use appended"""
+    index = synced_talent_index()
+    features = get_feature_cache(role, get_profile_registry()[role].revision, index.vocabulary)
+    features.sync(index)
+    return features
+
+def show_policy_what_if(role):
+    """Re-score the stored pool for a position under different weights and threshold"""
+    with st.expander("Try a different scoring policy"):
+        features = synced_feature_cache(role)
+        if not len(features):
+            st.caption("No resumes are stored with their full text, so there is nothing to re-score yet")
+            return
+        
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            required_weight = st.slider("Required skills share (%)", 0, 100, 70, key="policy_required",
+                                        help="The rest of the skills score comes from preferred skills")
+            threshold = st.slider("Accept threshold", 0, 100, 70, key="policy_threshold")
+        with col2:
+            skills_weight = st.slider("Skills weight", 0.0, 1.0, 0.5, 0.05, key="policy_skills")
+            experience_weight = st.slider("Experience weight", 0.0, 1.0, 0.3, 0.05, key="policy_experience")
+        with col3:
+            education_weight = st.slider("Education weight", 0.0, 1.0, 0.2, 0.05, key="policy_education")
+            missing_education = st.slider("Score without matching education", 0, 100, 50,
+                                          key="policy_missing_education")
+        policy = ScoringPolicy(required_weight, 100 - required_weight, skills_weight, experience_weight,
+                               education_weight, missing_education, threshold)
+        
+        started = time.perf_counter()
+        comparison = features.compare(policy)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            st.metric("Accepted now", f"{comparison['accepted_before']:,}")
+        with col2:
+            st.metric("Accepted under this policy", f"{comparison['accepted_after']:,}",
+                      delta=comparison['accepted_after'] - comparison['accepted_before'])
+        with col3:
+            st.metric("Newly accepted", f"{comparison['newly_accepted']:,}")
+        with col4:
+            st.metric("Newly rejected", f"{comparison['newly_rejected']:,}")
+        st.caption(f"{comparison['candidates']:,} stored resumes re-scored in {elapsed_ms:.1f} ms "
+                   f"without re-reading any of them")
+
+def show_talent_pool_shortlist(role):
+    """Top-K candidates for a position from every stored resume, without re-screening them"""
+    st.subheader("Talent Pool Shortlist")
+    if role is None:
+        st.caption("Pick a position above to shortlist the best stored candidates for it")
+        return
+    
+    index = synced_talent_index()
+    k = st.slider("Shortlist size", 5, 200, 50, step=5, key="shortlist_size")
+    
+    started = time.perf_counter()
+    try:
+        shortlist = index.top_k(get_profile_registry()[role], k)
+    except KeyError as exc:
+        st.warning(f"The talent pool index does not cover this position yet: {exc}")
+        return
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    
+    st.dataframe(
+        {
+            'File': [c['id'] for c in shortlist],
+            'Decision': [c['decision'] for c in shortlist],
+            'Score': [c['total_score'] for c in shortlist],
+            'Skills': [c['skills_score'] for c in shortlist],
+            'Experience (years)': [c['experience_years'] for c in shortlist],
+            'Education': [c['education_score'] for c in shortlist],
+            'Matched skills': [', '.join(c['found_skills']) for c in shortlist]
+        },
+        hide_index=True,
+        width="stretch"
+    )
+    st.caption(f"Top {len(shortlist)} of {len(index):,} stored resumes for {role_title(role)}, "
+               f"retrieved in {elapsed_ms:.1f} ms")
+    
+    show_policy_what_if(role)
+
+def show_session_memory():
+    """Admin view: what every session in this server process holds in memory and on disk"""
+    memory = get_session_memory()
+    usage = memory.usage()
+    current = session_values().session_id
+    with st.expander(f"Session memory: {len(usage)} sessions in this server process"):
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("Resident", f"{memory.resident_bytes() / MB:.1f} MB",
+                      help=f"Process budget {memory.process_budget / MB:.0f} MB")
+        with col2:
+            st.metric("Spilled to disk", f"{sum(u.spilled_bytes for u in usage) / MB:.1f} MB")
+        with col3:
+            st.metric("Idle sessions evicted", memory.evictions)
+        st.dataframe(
+            {
+                'Session': [u.session_id[:8] + (" (you)" if u.session_id == current else "") for u in usage],
+                'Idle (s)': [round(u.idle_seconds) for u in usage],
+                'Resident (MB)': [round(u.resident_bytes / MB, 2) for u in usage],
+                'Spilled (MB)': [round(u.spilled_bytes / MB, 2) for u in usage],
+                'In memory': [', '.join(u.resident_keys) for u in usage],
+                'On disk': [', '.join(u.spilled_keys) for u in usage]
+            },
+            hide_index=True,
+            width="stretch"
+        )
+        st.caption(f"Each session is held to {memory.session_budget / MB:.0f} MB: its least recently used values "
+                   f"are spilled to {memory.spill_dir} and read back when next needed. Sessions idle for "
+                   f"{memory.idle_seconds / 60:.0f} minutes are evicted, least recently seen first, while the "
+                   f"process is over budget.")
+
 def show_resources_templates():
     st.header("Diagnostic Resources & Templates")
     st.write("Downloadable templates and frameworks for AI system validation")
@@ -611,7 +1123,8 @@ def show_resources_templates():
         label="Download Diagnostic Checklist",
         data=checklist_content,
         file_name="ai_diagnostic_checklist.md",
-        mime="text/markdown"
+        mime="text/markdown",
+        on_click="ignore"
     )
     
     with st.expander("Preview Diagnostic Checklist"):
@@ -648,7 +1161,8 @@ def show_resources_templates():
         label="Download Override Template",
         data=override_template,
         file_name="human_override_template.md",
-        mime="text/markdown"
+        mime="text/markdown",
+        on_click="ignore"
     )
     
     # Risk Assessment Framework
@@ -693,7 +1207,8 @@ def show_resources_templates():
         label="Download Risk Framework",
         data=risk_framework,
         file_name="risk_assessment_framework.md", 
-        mime="text/markdown"
+        mime="text/markdown",
+        on_click="ignore"
     )
     
     with st.expander("Preview Risk Assessment Framework"):
@@ -754,7 +1269,8 @@ This framework can be adapted for any AI decision-making system requiring valida
         label="Download Generic Framework",
         data=generic_framework,
         file_name="generic_ai_diagnostic_framework.md",
-        mime="text/markdown"
+        mime="text/markdown",
+        on_click="ignore"
     )
     
     with st.expander("Preview Generic AI Framework"):
@@ -902,6 +1418,7 @@ def show_approach_comparison():
             'With Diagnosis': ['Protected', 'Fair treatment', 'Continuous success', '2 months prep']
         }
         
+        import pandas as pd
         results_df = pd.DataFrame(results_data)
         st.dataframe(results_df, hide_index=True, width="stretch")
     
@@ -955,64 +1472,5 @@ def show_approach_comparison():
         </div>
         """, unsafe_allow_html=True)
 
-def screen_resume(resume_text: str, job_type: str) -> Dict:
-    """Simulate AI resume screening"""
-    
-    requirements = JOB_REQUIREMENTS[job_type]
-    resume_lower = resume_text.lower()
-    
-    # Skills analysis
-    found_required = [skill for skill in requirements['required_skills'] if skill.lower() in resume_lower]
-    found_preferred = [skill for skill in requirements['preferred_skills'] if skill.lower() in resume_lower]
-    
-    # Experience extraction
-    experience_years = extract_experience(resume_text)
-    experience_score = min(experience_years / requirements['min_experience'] * 100, 100)
-    
-    # Skills scoring
-    required_match = len(found_required) / len(requirements['required_skills'])
-    preferred_match = len(found_preferred) / len(requirements['preferred_skills']) 
-    skills_score = (required_match * 70 + preferred_match * 30)
-    
-    # Education assessment
-    education_score = 50
-    for edu in requirements['education_required']:
-        if edu.lower() in resume_lower:
-            education_score = 100
-            break
-    
-    # Final calculation
-    total_score = int((skills_score * 0.5 + experience_score * 0.3 + education_score * 0.2))
-    decision = 'Accept' if total_score >= 70 else 'Reject'
-    
-    return {
-        'decision': decision,
-        'total_score': total_score,
-        'skills_score': int(skills_score),
-        'experience_score': int(experience_score),
-        'education_score': int(education_score),
-        'found_skills': found_required + found_preferred,
-        'experience_assessment': f"{experience_years} years"
-    }
-
-def extract_experience(resume_text: str) -> int:
-    """Extract years of experience"""
-    patterns = [
-        r'(\d+)\+?\s*years?\s*(?:of\s*)?experience',
-        r'experience.*?(\d+)\+?\s*years?'
-    ]
-    
-    for pattern in patterns:
-        matches = re.findall(pattern, resume_text.lower())
-        if matches:
-            return max([int(match) for match in matches])
-    
-    # Estimate from keywords
-    if any(word in resume_text.lower() for word in ['senior', 'lead']):
-        return 5
-    elif any(word in resume_text.lower() for word in ['junior', 'entry']):
-        return 1
-    return 2
-
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,161 @@
+# Seeded synthetic resume corpus
+#
+#   python benchmarks/corpus.py out/ --count 10000 --seed 7       # write .txt files
+#   python benchmarks/corpus.py - --count 1000 > corpus.jsonl     # JSONL on stdout
+#
+# Resumes are built from sections (contact, summary, experience, skills,
+# education) with role-specific skills drawn from the job-profile registry, plus
+# distractor skills, so screening scores spread over the whole 0-100 range.
+# The same seed always yields the same corpus, byte for byte.
+
+import argparse
+import json
+import math
+import os
+import random
+import sys
+from typing import Iterator, List, Optional, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from job_profiles import get_registry
+
+MIN_SIZE = 1024
+MAX_SIZE = 5 * 1024 * 1024
+# Most real resumes are a few KB; sizes are drawn log-normally around this
+MEDIAN_SIZE = 4 * 1024
+
+FIRST_NAMES = ["Alex", "Priya", "Wei", "Maria", "James", "Fatima", "Kenji", "Olga", "Samuel", "Aisha",
+               "Diego", "Hannah", "Ravi", "Chloe", "Tomasz", "Yuki", "Grace", "Omar", "Lena", "Kwame"]
+LAST_NAMES = ["Smith", "Patel", "Chen", "Garcia", "Johnson", "Khan", "Tanaka", "Ivanova", "Okafor", "Muller",
+              "Rossi", "Nguyen", "Silva", "Kowalski", "Haddad", "Brown", "Sato", "Mensah", "Lopez", "Novak"]
+COMPANIES = ["Acme Analytics", "Northwind Data", "Globex", "Initech", "Umbrella Retail", "Stark Logistics",
+             "Wayne Financial", "Hooli", "Vandelay Imports", "Soylent Health", "Cyberdyne Systems", "Tyrell Labs"]
+TITLES = {
+    "data_engineer": ["Data Engineer", "Senior Data Engineer", "Software Engineer, Data Platform",
+                      "ETL Developer", "Big Data Engineer", "Junior Data Engineer"],
+    "data_analyst": ["Data Analyst", "Business Analyst", "Senior Data Analyst", "Reporting Analyst",
+                     "Junior Analyst", "BI Analyst"],
+}
+# Skills that appear in resumes but score for neither role
+DISTRACTOR_SKILLS = ["java", "scala", "go", "c++", "javascript", "react", "terraform", "snowflake", "dbt",
+                     "pandas", "numpy", "git", "linux", "jira", "sas", "spss", "google analytics", "mongodb"]
+VERBS = ["Built", "Designed", "Maintained", "Migrated", "Automated", "Optimised", "Led", "Delivered",
+         "Owned", "Scaled", "Monitored", "Documented"]
+OBJECTS = ["reporting dashboards", "ingestion jobs", "a customer churn model", "nightly batch loads",
+           "the finance data mart", "streaming event processing", "data quality checks",
+           "self-service analytics", "a cost attribution report", "warehouse schemas"]
+OUTCOMES = ["cutting run time by {}%", "for {} business units", "serving {} daily users",
+            "reducing incidents by {}%", "saving {} hours a month"]
+DEGREES = ["Bachelor of Science in Computer Science", "Master of Science in Statistics",
+           "Bachelor of Engineering", "Master of Business Administration", "BSc Mathematics",
+           "Bachelor of Arts in Economics", "Coding bootcamp certificate", "High school diploma"]
+
+def _skill_pool(rng: random.Random, job_type: str) -> List[str]:
+    """Skills this candidate mentions: a random share of the role's, plus distractors"""
+    profile = get_registry()[job_type]
+    strength = rng.random()
+    skills = [s for s in profile.required_skills if rng.random() < 0.2 + 0.75 * strength]
+    skills += [s for s in profile.preferred_skills if rng.random() < 0.1 + 0.6 * strength]
+    skills += rng.sample(DISTRACTOR_SKILLS, rng.randint(1, 6))
+    rng.shuffle(skills)
+    return skills
+
+def _titles(job_type: str) -> List[str]:
+    """Job titles to write for a role; registry roles without a list use the profile's own title"""
+    return TITLES.get(job_type) or [get_registry()[job_type].title]
+
+def _bullet(rng: random.Random, skills: List[str]) -> str:
+    outcome = rng.choice(OUTCOMES).format(rng.randint(2, 90))
+    tools = ", ".join(rng.sample(skills, min(len(skills), rng.randint(1, 3))))
+    return f"- {rng.choice(VERBS)} {rng.choice(OBJECTS)} using {tools}, {outcome}.\n"
+
+def _experience_line(rng: random.Random, years: int) -> str:
+    forms = [f"{years}+ years of experience in data work.",
+             f"{years} years experience delivering analytics projects.",
+             f"Professional experience: {years} years across startups and enterprise.",
+             "Experienced professional with a track record of delivery.",
+             "Senior practitioner who enjoys mentoring.",
+             "Entry-level candidate eager to learn."]
+    return rng.choice(forms) + "\n"
+
+def generate_resume(rng: random.Random, job_type: str, size: int) -> str:
+    """One resume of roughly `size` bytes (UTF-8) for the given role"""
+    skills = _skill_pool(rng, job_type)
+    titles = _titles(job_type)
+    years = rng.choice([0, 1, 1, 2, 3, 4, 5, 6, 8, 10, 12, 15])
+    name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+
+    parts = [
+        f"{name}\n{name.lower().replace(' ', '.')}@example.com | +1 555 {rng.randint(1000000, 9999999)}\n\n",
+        "SUMMARY\n",
+        f"{rng.choice(titles)}. " + _experience_line(rng, years) + "\n",
+        "EXPERIENCE\n",
+    ]
+    tail = [
+        "\nSKILLS\n" + ", ".join(skills) + "\n",
+        "\nEDUCATION\n" + rng.choice(DEGREES) + f", {rng.choice(['State University', 'Tech Institute', 'Online'])}\n",
+    ]
+    used = sum(len(p) for p in parts) + sum(len(p) for p in tail)
+
+    # Fill the experience section with roles and bullets until the target size
+    body: List[str] = []
+    year = 2024
+    while used < size:
+        role_header = (f"\n{rng.choice(titles)} - {rng.choice(COMPANIES)} "
+                       f"({year - rng.randint(1, 4)}-{year})\n")
+        year -= 1
+        body.append(role_header)
+        used += len(role_header)
+        for _ in range(rng.randint(3, 8)):
+            line = _bullet(rng, skills)
+            body.append(line)
+            used += len(line)
+            if used >= size:
+                break
+
+    return "".join(parts + body + tail)
+
+def resume_size(rng: random.Random, min_size: int = MIN_SIZE, max_size: int = MAX_SIZE) -> int:
+    """A log-normal resume size around MEDIAN_SIZE, clipped to [min_size, max_size]"""
+    size = int(rng.lognormvariate(math.log(MEDIAN_SIZE), 1.0))
+    return max(min_size, min(max_size, size))
+
+def generate_corpus(count: int, seed: int = 0, job_types: Optional[List[str]] = None,
+                    min_size: int = MIN_SIZE, max_size: int = MAX_SIZE) -> Iterator[Tuple[str, str, bytes]]:
+    """Lazily yield (resume_id, job_type, utf-8 bytes) for `count` resumes.
+
+    Each resume gets its own Random seeded from (seed, index), so any slice of
+    the corpus can be regenerated without producing the resumes before it.
+    """
+    job_types = job_types or sorted(get_registry())
+    for index in range(count):
+        rng = random.Random(f"{seed}:{index}")
+        job_type = job_types[index % len(job_types)]
+        text = generate_resume(rng, job_type, resume_size(rng, min_size, max_size))
+        yield f"resume_{index:06d}", job_type, text.encode('utf-8')
+
+def main():
+    parser = argparse.ArgumentParser(description="Write a seeded synthetic resume corpus")
+    parser.add_argument("output", help="directory for .txt files, or '-' for JSONL on stdout")
+    parser.add_argument("--count", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--role", action="append", choices=sorted(get_registry()),
+                        help="limit to one or more roles (default: all, alternating)")
+    parser.add_argument("--min-kb", type=int, default=MIN_SIZE // 1024)
+    parser.add_argument("--max-kb", type=int, default=MAX_SIZE // 1024)
+    args = parser.parse_args()
+
+    corpus = generate_corpus(args.count, args.seed, args.role, args.min_kb * 1024, args.max_kb * 1024)
+    if args.output == "-":
+        for resume_id, job_type, data in corpus:
+            sys.stdout.write(json.dumps({"id": resume_id, "role": job_type, "text": data.decode('utf-8')}) + "\n")
+        return
+
+    os.makedirs(args.output, exist_ok=True)
+    for resume_id, job_type, data in corpus:
+        with open(os.path.join(args.output, f"{resume_id}_{job_type}.txt"), "wb") as handle:
+            handle.write(data)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+# Worst-case timing for extract_experience on pathological resumes
+#
+#   python benchmarks/experience_worst_case.py [--size-kb 2048]
+#
+# Compares the linear-time extractor against the original unanchored
+# findall patterns. The legacy patterns are only run up to --legacy-max-kb,
+# past which their quadratic behaviour makes a single call take minutes.
+
+import argparse
+import os
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from screening import extract_experience
+
+LEGACY_PATTERNS = [
+    r'(\d+)\+?\s*years?\s*(?:of\s*)?experience',
+    r'experience.*?(\d+)\+?\s*years?'
+]
+
+# Each case repeats a short unit up to the requested size
+CASES = {
+    "experience_without_figures": "experience ",
+    "experience_then_late_figure": None,  # built separately below
+    "digit_run": "7",
+    "digits_and_spaces": "1 ",
+    "whitespace_after_figure": None,
+    "plain_prose": "built reliable data pipelines with python and sql. ",
+}
+
+def build_case(name: str, size: int) -> str:
+    if name == "experience_then_late_figure":
+        return "experience " * (size // 11) + "5 years"
+    if name == "whitespace_after_figure":
+        return ("3" + " " * 1000) * (size // 1001)
+    unit = CASES[name]
+    return unit * (size // len(unit))
+
+def legacy_extract(resume_text: str) -> None:
+    for pattern in LEGACY_PATTERNS:
+        re.findall(pattern, resume_text.lower())
+
+def timed(func, text: str) -> float:
+    start = time.perf_counter()
+    try:
+        func(text)
+    except ValueError:
+        # The legacy code calls int() on arbitrarily long digit runs
+        pass
+    return time.perf_counter() - start
+
+def main():
+    parser = argparse.ArgumentParser(description="Worst-case timing for extract_experience")
+    parser.add_argument("--size-kb", type=int, default=2048, help="largest resume size to test")
+    parser.add_argument("--legacy-max-kb", type=int, default=16, help="largest size to run the legacy patterns on")
+    args = parser.parse_args()
+
+    sizes = []
+    size_kb = 16
+    while size_kb < args.size_kb:
+        sizes.append(size_kb)
+        size_kb *= 4
+    sizes.append(args.size_kb)
+
+    print(f"{'case':<30}{'size':>10}{'linear (ms)':>14}{'legacy (ms)':>14}")
+    for name in CASES:
+        for size_kb in sizes:
+            text = build_case(name, size_kb * 1024)
+            linear_ms = timed(extract_experience, text) * 1000
+            legacy_ms = timed(legacy_extract, text) * 1000 if size_kb <= args.legacy_max_kb else None
+            legacy_col = f"{legacy_ms:14.1f}" if legacy_ms is not None else f"{'skipped':>14}"
+            print(f"{name:<30}{str(size_kb) + ' KB':>10}{linear_ms:14.1f}{legacy_col}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+# Synthetic job-profile registries
+# Writes a directory of N generated roles (one JSON file per department) for
+# exercising the registry, multi-role scoring and retrieval at realistic scale
+#
+#   python benchmarks/profiles.py --count 300 --output /tmp/profiles
+#   python benchmarks/profiles.py --count 300 --output /tmp/profiles --time
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from typing import Dict, List, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from job_profiles import load_profiles
+
+DEPARTMENTS = ["Engineering", "Analytics", "Finance", "Marketing", "Operations", "Sales", "Product", "Security"]
+LEVELS = ["Junior", "", "Senior", "Staff", "Lead", "Principal"]
+FUNCTIONS = ["Data Engineer", "Data Analyst", "Backend Engineer", "Frontend Engineer", "ML Engineer",
+             "Platform Engineer", "BI Developer", "Financial Analyst", "Marketing Analyst", "Product Analyst",
+             "Security Engineer", "Site Reliability Engineer", "Data Scientist", "QA Engineer", "Solutions Architect"]
+SKILLS = ["python", "sql", "etl", "data pipeline", "spark", "airflow", "aws", "docker", "kubernetes", "kafka",
+          "hadoop", "excel", "tableau", "power bi", "statistics", "r", "looker", "data visualization",
+          "business intelligence", "java", "scala", "go", "c++", "javascript", "typescript", "react", "terraform",
+          "snowflake", "dbt", "pandas", "numpy", "git", "linux", "jira", "sas", "spss", "google analytics",
+          "mongodb", "postgresql", "redis", "graphql", "rest api", "microservices", "ci/cd", "machine learning",
+          "deep learning", "pytorch", "tensorflow", "nlp", "computer vision", "a/b testing", "forecasting",
+          "financial modeling", "accounting", "salesforce", "hubspot", "seo", "penetration testing", "siem",
+          "incident response", "azure", "gcp", "bigquery", "redshift", "databricks", "flink", "prometheus"]
+EDUCATION = ["bachelor", "master", "phd", "computer science", "engineering", "statistics", "mathematics",
+             "business", "economics", "finance", "physics"]
+
+def generate_profiles(count: int, seed: int = 0) -> Dict[str, Dict]:
+    """count reproducible role definitions, keyed by profile id"""
+    rng = random.Random(seed)
+    profiles = {}
+    for index in range(count):
+        level = LEVELS[index % len(LEVELS)]
+        function = FUNCTIONS[(index // len(LEVELS)) % len(FUNCTIONS)]
+        title = f"{level} {function}".strip() + f" ({index // (len(LEVELS) * len(FUNCTIONS)) + 1})"
+        skills = rng.sample(SKILLS, rng.randint(8, 14))
+        split = rng.randint(4, len(skills) - 3)
+        profiles[f"role_{index:04d}"] = {
+            "title": title,
+            "department": rng.choice(DEPARTMENTS),
+            "min_experience": 1 + LEVELS.index(level) + rng.randint(0, 2),
+            "required_skills": skills[:split],
+            "preferred_skills": skills[split:],
+            "education_required": rng.sample(EDUCATION, rng.randint(2, 5)),
+        }
+    return profiles
+
+def write_profiles(profiles: Dict[str, Dict], output: str) -> List[str]:
+    """Write one file per department and return their paths"""
+    os.makedirs(output, exist_ok=True)
+    by_department: Dict[str, Dict] = {}
+    for profile_id, spec in profiles.items():
+        by_department.setdefault(spec["department"], {})[profile_id] = spec
+    paths = []
+    for department, group in sorted(by_department.items()):
+        path = os.path.join(output, f"{department.lower()}.json")
+        with open(path, "w", encoding="utf-8") as handle:
+            json.dump(group, handle, indent=2)
+        paths.append(path)
+    return paths
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Generate a synthetic job-profile registry")
+    parser.add_argument("--count", type=int, default=300)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", required=True, help="directory to write profile files into")
+    parser.add_argument("--time", action="store_true", help="report how long loading the registry takes")
+    args = parser.parse_args(argv)
+
+    paths = write_profiles(generate_profiles(args.count, args.seed), args.output)
+    print(f"wrote {args.count} profiles to {len(paths)} files in {args.output}", file=sys.stderr)
+    if args.time:
+        start = time.perf_counter()
+        load_profiles(args.output)
+        print(f"validated and compiled in {(time.perf_counter() - start) * 1000:.1f} ms", file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,90 @@
+# Talent-pool retrieval benchmark
+#
+#   python benchmarks/retrieval.py [--pool 2000000] [--k 50] [--repeat 5]
+#
+# Builds a synthetic pool straight from feature distributions (each term is
+# present in a resume with its own frequency; years are skewed towards the
+# low end), then times TalentIndex.top_k for every registry profile and
+# checks each shortlist against scoring the whole pool by brute force. It
+# also times re-scoring the whole pool under a new policy from a FeatureCache.
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from typing import Dict, List, Optional
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from job_profiles import get_registry
+from rescoring import DEFAULT_POLICY, FeatureCache, ScoringPolicy
+from talent_pool import TalentIndex
+
+def synthetic_pool(size: int, seed: int = 0) -> TalentIndex:
+    """A pool of `size` resumes over the registry's vocabulary"""
+    rng = np.random.default_rng(seed)
+    vocabulary = sorted({term for profile in get_registry().values()
+                         for term in profile.required_skills + profile.preferred_skills + profile.education_required})
+    # A few very common terms (python, sql, bachelor...) and a long tail of rare ones
+    frequencies = np.clip(0.6 / (1 + rng.permutation(len(vocabulary))) ** 0.7, 0.005, 0.6)
+    postings = {term: np.flatnonzero(rng.random(size) < frequency).astype(np.int32)
+                for term, frequency in zip(vocabulary, frequencies)}
+    years = np.minimum(rng.geometric(0.2, size) - 1, 40)
+    return TalentIndex(np.arange(size).astype(str), years, postings, vocabulary)
+
+def brute_force_scores(index: TalentIndex, profile) -> np.ndarray:
+    """Every resume's total score, computed without any pruning"""
+    required = index._hits(profile.required_skills)
+    preferred = index._hits(profile.preferred_skills)
+    educated = index._hits(profile.education_required) > 0
+    skills = required / len(profile.required_skills) * 70 + preferred / len(profile.preferred_skills) * 30
+    experience = np.minimum(index.years / profile.min_experience * 100, 100)
+    return (skills * 0.5 + experience * 0.3 + np.where(educated, 100, 50) * 0.2).astype(np.int64)
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Time top-K shortlists over a synthetic talent pool")
+    parser.add_argument("--pool", type=int, default=2_000_000)
+    parser.add_argument("--k", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    index = synthetic_pool(args.pool, args.seed)
+    print(f"built {len(index):,}-resume pool in {time.perf_counter() - start:.1f}s", file=sys.stderr)
+
+    report: Dict[str, Dict] = {}
+    for role, profile in sorted(get_registry().items()):
+        timings = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            shortlist = index.top_k(profile, args.k)
+            timings.append(time.perf_counter() - start)
+        expected = np.sort(brute_force_scores(index, profile))[::-1][:args.k]
+
+        features = FeatureCache.from_talent_index(index, profile)
+        rescore_timings = []
+        for threshold in range(args.repeat):
+            start = time.perf_counter()
+            features.rescore(ScoringPolicy(required_weight=80, preferred_weight=20, accept_threshold=60 + threshold))
+            rescore_timings.append(time.perf_counter() - start)
+
+        report[role] = {
+            'median_ms': statistics.median(timings) * 1000,
+            'max_ms': max(timings) * 1000,
+            'matches_brute_force': [row['total_score'] for row in shortlist] == expected.tolist(),
+            'kth_score': shortlist[-1]['total_score'] if shortlist else None,
+            'rescore_median_ms': statistics.median(rescore_timings) * 1000,
+            'rescore_matches_brute_force': bool((features.rescore(DEFAULT_POLICY)[0]
+                                                 == brute_force_scores(index, profile)).all()),
+        }
+    json.dump({'pool': len(index), 'k': args.k, 'roles': report}, sys.stdout, indent=2)
+    sys.stdout.write('\n')
+    return 0 if all(r['matches_brute_force'] and r['rescore_matches_brute_force'] for r in report.values()) else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,246 @@
+# Screening benchmark suite
+#
+#   python benchmarks/run.py --count 10000 --output bench.json
+#   python benchmarks/run.py --count 100000 --sizes 1,64,1024,5120 --workers 4
+#   python benchmarks/run.py --count 10000 --compare bench.json   # exit 1 on regression
+#
+# Runs a seeded synthetic corpus (benchmarks/corpus.py) through each stage
+# of the screening path and reports resumes/sec, p50/p99 latency and peak
+# traced memory per stage:
+#
+#   extract_experience   per resume, on decoded text
+#   screen_resume        per resume, for the resume's own role
+#   upload_decode        content hash + charset detection/decoding of the raw bytes
+#                        (the per-file work in show_resume_screening)
+#   upload_rerun         hash + cache lookup for an already screened upload
+#   screen_resumes       vectorised batch path, latency per batch
+#   screen_resumes_parallel   process-pool path, only with --workers > 1
+#
+# The corpus is generated and consumed in chunks, so a 100k-document run
+# never holds more than one chunk in memory. Peak memory is measured in a
+# separate tracemalloc pass over the first --memory-sample resumes, since
+# tracing slows the timed pass down considerably.
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from itertools import groupby
+from typing import Callable, Dict, List, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.corpus import MAX_SIZE, MIN_SIZE, generate_corpus
+from cli import percentile
+from ingest import decode_bytes
+from screening import (SCORING_VERSION, extract_experience, screen_resume, screen_resumes,
+                       screen_resumes_parallel)
+from screening_cache import ScreeningCache, content_hash, screening_key
+
+Document = Tuple[str, str, bytes, str]  # (id, job_type, raw bytes, decoded text)
+
+class StageStats:
+    """Latencies and volume for one stage, accumulated across chunks"""
+
+    def __init__(self, per: str = "resume"):
+        self.per = per
+        self.latencies: List[float] = []
+        self.resumes = 0
+        self.bytes = 0
+        self.peak_memory = 0
+
+    def record(self, seconds: float, resumes: int, size: int) -> None:
+        self.latencies.append(seconds)
+        self.resumes += resumes
+        self.bytes += size
+
+    def report(self) -> Dict:
+        latencies = sorted(self.latencies)
+        seconds = sum(latencies)
+        return {
+            'resumes': self.resumes,
+            'megabytes': round(self.bytes / 2 ** 20, 2),
+            'seconds': round(seconds, 4),
+            'resumes_per_sec': round(self.resumes / seconds, 1) if seconds else None,
+            'mb_per_sec': round(self.bytes / 2 ** 20 / seconds, 2) if seconds else None,
+            'latency_per': self.per,
+            'p50_ms': round(percentile(latencies, 50) * 1000, 3),
+            'p99_ms': round(percentile(latencies, 99) * 1000, 3),
+            'max_ms': round((latencies[-1] if latencies else 0) * 1000, 3),
+            'peak_memory_mb': round(self.peak_memory / 2 ** 20, 2),
+        }
+
+def per_resume_stages(workers: int) -> Dict[str, Callable[[List[Document], ScreeningCache], List[Tuple[float, int, int]]]]:
+    """Stage name -> function timing that stage over one chunk, as (seconds, resumes, bytes) samples"""
+
+    def timed_each(func):
+        def run(docs, cache):
+            samples = []
+            for doc in docs:
+                start = time.perf_counter()
+                func(doc, cache)
+                samples.append((time.perf_counter() - start, 1, len(doc[2])))
+            return samples
+        return run
+
+    def upload_rerun(doc, cache):
+        cache.get(screening_key(content_hash(doc[2]), doc[1]))
+
+    def timed_batches(screen):
+        def run(docs, cache):
+            samples = []
+            # Batches are per role, as in the app
+            for job_type, group in groupby(sorted(docs, key=lambda d: d[1]), key=lambda d: d[1]):
+                group = list(group)
+                start = time.perf_counter()
+                screen([d[3] for d in group], job_type)
+                samples.append((time.perf_counter() - start, len(group), sum(len(d[2]) for d in group)))
+            return samples
+        return run
+
+    stages = {
+        'extract_experience': timed_each(lambda doc, cache: extract_experience(doc[3])),
+        'screen_resume': timed_each(lambda doc, cache: screen_resume(doc[3], doc[1])),
+        'upload_decode': timed_each(lambda doc, cache: (content_hash(doc[2]), decode_bytes(doc[2]))),
+        'upload_rerun': timed_each(upload_rerun),
+        'screen_resumes': timed_batches(screen_resumes),
+    }
+    if workers > 1:
+        stages['screen_resumes_parallel'] = timed_batches(
+            lambda texts, job_type: screen_resumes_parallel(texts, job_type, workers=workers))
+    return stages
+
+def warm_cache(docs: List[Document], cache: ScreeningCache) -> None:
+    """Populate the cache the way a first upload would, so upload_rerun measures hits"""
+    for doc in docs:
+        cache.put(screening_key(content_hash(doc[2]), doc[1]), {'result': None})
+
+def load_chunk(corpus) -> List[Document]:
+    return [(resume_id, job_type, data, decode_bytes(data).text) for resume_id, job_type, data in corpus]
+
+def warm_up(workers: int) -> None:
+    """Run every stage once untimed, so lazy imports and pool start-up are not billed to the first chunk"""
+    docs = load_chunk(generate_corpus(4, seed=-1, max_size=MIN_SIZE * 4))
+    cache = ScreeningCache()
+    for stage in per_resume_stages(workers).values():
+        stage(docs, cache)
+
+def run_corpus(stats: Dict[str, StageStats], label: str, count: int, seed: int, min_size: int, max_size: int,
+               chunk_size: int, memory_sample: int, workers: int) -> None:
+    stages = per_resume_stages(workers)
+    for name in stages:
+        key = f"{name}{label}"
+        if key not in stats:
+            stats[key] = StageStats('batch' if name.startswith('screen_resumes') else 'resume')
+
+    corpus = generate_corpus(count, seed, min_size=min_size, max_size=max_size)
+    cache = ScreeningCache(max_entries=chunk_size)
+    done = 0
+    while done < count:
+        docs = load_chunk(next(corpus) for _ in range(min(chunk_size, count - done)))
+        warm_cache(docs, cache)
+        for name, stage in stages.items():
+            for seconds, resumes, size in stage(docs, cache):
+                stats[f"{name}{label}"].record(seconds, resumes, size)
+
+        # Peak memory, traced separately over the first memory_sample resumes
+        if done < memory_sample:
+            sample = docs[:memory_sample - done]
+            for name, stage in stages.items():
+                if name == 'screen_resumes_parallel':
+                    continue  # allocations happen in the worker processes
+                tracemalloc.start()
+                stage(sample, cache)
+                _, peak = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+                entry = stats[f"{name}{label}"]
+                entry.peak_memory = max(entry.peak_memory, peak)
+
+        done += len(docs)
+        print(f"  {label or 'corpus'}: {done}/{count}", file=sys.stderr, end="\r")
+    print(file=sys.stderr)
+
+def git_revision() -> str:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__)), check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+def compare(current: Dict, baseline: Dict, tolerance: float) -> List[str]:
+    """Stages whose throughput fell, or p99 latency rose, by more than `tolerance`"""
+    regressions = []
+    for name, stage in current['stages'].items():
+        before = baseline.get('stages', {}).get(name)
+        if not before:
+            continue
+        if before['resumes_per_sec'] and stage['resumes_per_sec'] < before['resumes_per_sec'] * (1 - tolerance):
+            regressions.append(f"{name}: {before['resumes_per_sec']} -> {stage['resumes_per_sec']} resumes/sec")
+        if before['p99_ms'] and stage['p99_ms'] > before['p99_ms'] * (1 + tolerance):
+            regressions.append(f"{name}: p99 {before['p99_ms']} -> {stage['p99_ms']} ms")
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the screening path on a synthetic corpus")
+    parser.add_argument("--count", type=int, default=2000, help="resumes in the main corpus (up to 100k+)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--min-kb", type=int, default=MIN_SIZE // 1024)
+    parser.add_argument("--max-kb", type=int, default=64, help="largest resume in the main corpus")
+    parser.add_argument("--sizes", default="1,16,256,5120",
+                        help="comma-separated KB sizes for the fixed-size sweep ('' to skip)")
+    parser.add_argument("--sweep-count", type=int, default=4, help="resumes per size in the sweep")
+    parser.add_argument("--chunk-size", type=int, default=1000, help="resumes generated and held at once")
+    parser.add_argument("--memory-sample", type=int, default=200, help="resumes traced for peak memory")
+    parser.add_argument("--workers", type=int, default=1, help="also time screen_resumes_parallel above 1")
+    parser.add_argument("--output", help="write results as JSON to this file")
+    parser.add_argument("--compare", help="baseline JSON; exit 1 if a stage regresses beyond --tolerance")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    args = parser.parse_args()
+
+    stats: Dict[str, StageStats] = {}
+    started = time.perf_counter()
+    warm_up(args.workers)
+    run_corpus(stats, "", args.count, args.seed, args.min_kb * 1024, min(args.max_kb * 1024, MAX_SIZE),
+               args.chunk_size, args.memory_sample, args.workers)
+    for size_kb in (int(s) for s in args.sizes.split(",") if s.strip()):
+        size = min(size_kb * 1024, MAX_SIZE)
+        run_corpus(stats, f"[{size_kb}KB]", args.sweep_count, args.seed, size, size,
+                   args.chunk_size, args.sweep_count, args.workers)
+
+    results = {
+        'meta': {
+            'timestamp': time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            'git_revision': git_revision(),
+            'scoring_version': SCORING_VERSION,
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+            'args': vars(args),
+            'wall_seconds': round(time.perf_counter() - started, 2),
+        },
+        'stages': {name: entry.report() for name, entry in stats.items()},
+    }
+
+    print(f"{'stage':<36}{'resumes/s':>12}{'MB/s':>9}{'p50 ms':>10}{'p99 ms':>10}{'peak MB':>9}")
+    for name, stage in results['stages'].items():
+        print(f"{name:<36}{stage['resumes_per_sec'] or 0:>12.1f}{stage['mb_per_sec'] or 0:>9.2f}"
+              f"{stage['p50_ms']:>10.3f}{stage['p99_ms']:>10.3f}{stage['peak_memory_mb']:>9.2f}")
+
+    if args.output:
+        with open(args.output, "w") as handle:
+            json.dump(results, handle, indent=2)
+
+    if args.compare:
+        with open(args.compare) as handle:
+            regressions = compare(results, json.load(handle), args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+# Cold-start timing for the Streamlit apps
+#
+#   python benchmarks/startup.py [--repeat 5] [--output startup.json]
+#
+# Every sample runs in a fresh interpreter, as a new container would:
+#
+#   streamlit_import   import streamlit on its own (the floor no app can beat)
+#   module_import      import the app module on top of that
+#   first_run          first script run of the default page via AppTest
+#   rerun              a second run in the same session
+#
+# and records which heavy libraries the first page pulled in. Reported
+# times are medians over --repeat samples.
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APPS = ["app.py", "questions.py"]
+HEAVY_MODULES = ["pandas", "numpy", "pyarrow", "plotly.express", "plotly.graph_objects"]
+
+SAMPLE = """
+import importlib, json, sys, time
+sys.path.insert(0, {root!r})
+start = time.perf_counter()
+import streamlit
+streamlit_import = time.perf_counter() - start
+
+start = time.perf_counter()
+importlib.import_module({module!r})
+module_import = time.perf_counter() - start
+
+from streamlit.testing.v1 import AppTest
+at = AppTest.from_file({path!r}, default_timeout=60)
+start = time.perf_counter()
+at.run()
+first_run = time.perf_counter() - start
+start = time.perf_counter()
+at.run()
+rerun = time.perf_counter() - start
+
+print(json.dumps({{
+    'streamlit_import': streamlit_import,
+    'module_import': module_import,
+    'first_run': first_run,
+    'rerun': rerun,
+    'exceptions': [str(e.value) for e in at.exception],
+    'heavy_modules': [m for m in {heavy!r} if m in sys.modules],
+}}))
+"""
+
+def sample(app: str) -> Dict:
+    script = SAMPLE.format(root=ROOT, module=os.path.splitext(app)[0], path=os.path.join(ROOT, app),
+                           heavy=HEAVY_MODULES)
+    # Run from a scratch directory so the app's results database is not touched
+    output = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True,
+                            cwd=os.environ.get("TMPDIR", "/tmp")).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+def main():
+    parser = argparse.ArgumentParser(description="Cold-start timing for app.py and questions.py")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", help="write results as JSON to this file")
+    args = parser.parse_args()
+
+    results = {}
+    print(f"{'app':<16}{'streamlit':>12}{'module':>10}{'first run':>12}{'rerun':>10}  heavy modules")
+    for app in APPS:
+        samples = [sample(app) for _ in range(args.repeat)]
+        report = {key: round(statistics.median(s[key] for s in samples) * 1000, 1)
+                  for key in ('streamlit_import', 'module_import', 'first_run', 'rerun')}
+        report['cold_start_ms'] = round(report['module_import'] + report['first_run'], 1)
+        report['heavy_modules'] = samples[-1]['heavy_modules']
+        report['exceptions'] = samples[-1]['exceptions']
+        results[app] = report
+        print(f"{app:<16}{report['streamlit_import']:>10.0f}ms{report['module_import']:>8.0f}ms"
+              f"{report['first_run']:>10.0f}ms{report['rerun']:>8.0f}ms  {', '.join(report['heavy_modules']) or '-'}")
+
+    if args.output:
+        with open(args.output, "w") as handle:
+            json.dump(results, handle, indent=2)
+
+if __name__ == "__main__":
+    main()
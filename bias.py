@@ -0,0 +1,183 @@
+# Bias analysis engine
+# Acceptance rates, disparate-impact ratios, chi-square and permutation
+# tests per group attribute, over whole batches or the full results store
+
+import math
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Dict, Optional, Sequence
+
+import numpy as np
+
+# The "four-fifths rule": a group selected at under 80% of the best-treated
+# group's rate is evidence of adverse impact
+FOUR_FIFTHS = 0.8
+
+def chi2_sf(statistic: float, dof: int) -> float:
+    """Upper tail of the chi-square distribution (regularised upper incomplete gamma)"""
+    if dof <= 0:
+        return float('nan')
+    a, x = dof / 2, statistic / 2
+    if x <= 0:
+        return 1.0
+    log_prefix = -x + a * math.log(x) - math.lgamma(a)
+    if x < a + 1:
+        # Series for the lower tail
+        term = total = 1.0 / a
+        denominator = a
+        for _ in range(10000):
+            denominator += 1
+            term *= x / denominator
+            total += term
+            if abs(term) < abs(total) * 1e-15:
+                break
+        return max(0.0, 1.0 - total * math.exp(log_prefix))
+    # Continued fraction for the upper tail (modified Lentz)
+    tiny = 1e-300
+    b = x + 1 - a
+    c = 1 / tiny
+    d = 1 / b
+    h = d
+    for i in range(1, 10000):
+        an = -i * (i - a)
+        b += 2
+        d = an * d + b
+        d = 1 / (d if abs(d) > tiny else tiny)
+        c = b + an / c
+        c = c if abs(c) > tiny else tiny
+        h *= d * c
+        if abs(d * c - 1) < 1e-15:
+            break
+    return math.exp(log_prefix) * h
+
+def _chi_square_statistic(accepted: np.ndarray, sizes: np.ndarray) -> np.ndarray:
+    """Pearson chi-square of the groups x {accept, reject} table; accepted may be (..., groups)"""
+    total_accepted = accepted.sum(axis=-1, keepdims=True)
+    n = sizes.sum()
+    expected_accept = sizes * total_accepted / n
+    expected_reject = sizes - expected_accept
+    rejected = sizes - accepted
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cells = ((accepted - expected_accept) ** 2 / expected_accept
+                 + (rejected - expected_reject) ** 2 / expected_reject)
+    return np.nansum(cells, axis=-1)
+
+def _hypergeometric_draws(colors: np.ndarray, nsample: int, size: int, seed) -> np.ndarray:
+    """`size` draws of how many of each color land in a random subset of nsample items"""
+    rng = np.random.default_rng(seed)
+    return rng.multivariate_hypergeometric(colors, nsample, size=size, method='marginals')
+
+def _permutation_draws(colors: np.ndarray, nsample: int, n_permutations: int, seed: int,
+                       workers: int, pool: Optional[ProcessPoolExecutor] = None) -> np.ndarray:
+    """Hypergeometric draws for a permutation test, split over `workers` chunks.
+
+    Chunks get independent streams from one SeedSequence, so a given seed and
+    worker count always reproduce the same draws; with a pool they run on
+    separate cores.
+    """
+    workers = max(1, min(workers, n_permutations))
+    sizes = [n_permutations // workers + (i < n_permutations % workers) for i in range(workers)]
+    seeds = np.random.SeedSequence(seed).spawn(workers)
+    if pool is None:
+        chunks = map(_hypergeometric_draws, repeat(colors), repeat(nsample), sizes, seeds)
+    else:
+        chunks = pool.map(_hypergeometric_draws, repeat(colors), repeat(nsample), sizes, seeds)
+    return np.concatenate(list(chunks))
+
+def analyze_bias(groups: Sequence, decisions: Sequence[str], scores: Sequence[int],
+                 n_permutations: int = 10000, seed: int = 0, workers: int = 1,
+                 reference: Optional[str] = None) -> Dict:
+    """Per-group acceptance and score statistics with significance tests.
+
+    Permutation tests shuffle group labels over applications. Shuffling
+    labels only changes which group each accepted application (or each
+    score) lands in, so the shuffled per-group counts follow a multivariate
+    hypergeometric distribution; drawing from it directly gives the exact
+    permutation distribution in O(permutations x groups) rather than
+    O(permutations x applications). Score tests use the same idea over
+    the histogram of scores, which must be discrete (total_score is an
+    integer 0-100).
+
+    Disparate impact is each group's acceptance rate over the reference
+    group's; by default the reference is the group with the highest rate.
+    """
+    groups = np.asarray(groups, dtype=object).astype(str)
+    accepted_mask = np.asarray(decisions) == 'Accept'
+    scores = np.asarray(scores, dtype=np.int64)
+
+    labels, codes, sizes = np.unique(groups, return_inverse=True, return_counts=True)
+    accepted = np.bincount(codes, weights=accepted_mask, minlength=len(labels)).astype(np.int64)
+    score_sums = np.bincount(codes, weights=scores, minlength=len(labels))
+    rates = accepted / sizes
+
+    reference_index = int(np.argmax(rates)) if reference is None else int(np.flatnonzero(labels == reference)[0])
+    reference_rate = rates[reference_index]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        impact = np.where(reference_rate > 0, rates / reference_rate, np.nan)
+
+    # One pool for every test in the analysis; process start-up would dwarf a single test
+    pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    try:
+        acceptance_p = _acceptance_permutation_p(sizes, accepted, n_permutations, seed, workers, pool)
+        score_p_values = [_score_permutation_p(scores, codes == g, n_permutations, seed + 1 + g, workers, pool)
+                          for g in range(len(labels))]
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    statistic = float(_chi_square_statistic(accepted, sizes))
+    dof = len(labels) - 1 if 0 < accepted.sum() < len(scores) else 0
+    return {
+        'groups': [
+            {
+                'group': str(labels[g]),
+                'applications': int(sizes[g]),
+                'accepted': int(accepted[g]),
+                'acceptance_rate': float(rates[g]),
+                'impact_ratio': float(impact[g]),
+                'adverse_impact': bool(impact[g] < FOUR_FIFTHS),
+                'mean_score': float(score_sums[g] / sizes[g]),
+                'score_p_value': score_p_values[g]
+            }
+            for g in range(len(labels))
+        ],
+        'reference_group': str(labels[reference_index]),
+        'chi_square': statistic,
+        'dof': dof,
+        'chi_square_p': chi2_sf(statistic, dof),
+        'chi_square_permutation_p': acceptance_p,
+        'n_permutations': n_permutations
+    }
+
+def _acceptance_permutation_p(sizes: np.ndarray, accepted: np.ndarray, n_permutations: int, seed: int,
+                               workers: int, pool: Optional[ProcessPoolExecutor]) -> float:
+    """Permutation p-value of the acceptance chi-square statistic"""
+    statistic = _chi_square_statistic(accepted, sizes)
+    permuted = _chi_square_statistic(
+        _permutation_draws(sizes, int(accepted.sum()), n_permutations, seed, workers, pool), sizes)
+    return float((1 + np.sum(permuted >= statistic - 1e-9)) / (n_permutations + 1))
+
+def _score_permutation_p(scores: np.ndarray, in_group: np.ndarray, n_permutations: int, seed: int,
+                         workers: int, pool: Optional[ProcessPoolExecutor]) -> float:
+    """Two-sided permutation p-value for a group's mean score against everyone else's"""
+    size = int(in_group.sum())
+    rest = len(scores) - size
+    if size == 0 or rest == 0:
+        return float('nan')
+    total = float(scores.sum())
+    group_sum = float(scores[in_group].sum())
+    observed = abs(group_sum / size - (total - group_sum) / rest)
+
+    values, value_counts = np.unique(scores, return_counts=True)
+    permuted_sums = _permutation_draws(value_counts, size, n_permutations, seed, workers, pool) @ values
+    permuted = np.abs(permuted_sums / size - (total - permuted_sums) / rest)
+    return float((1 + np.sum(permuted >= observed - 1e-9)) / (n_permutations + 1))
+
+def experience_bracket(years: int) -> str:
+    if years < 2:
+        return "0-1 years"
+    if years < 5:
+        return "2-4 years"
+    if years < 10:
+        return "5-9 years"
+    return "10+ years"
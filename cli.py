@@ -0,0 +1,288 @@
+# TechCorp Resume Screening - headless batch CLI
+#
+#   python cli.py --role data_engineer resumes/               # a directory
+#   python cli.py --role data_analyst "inbox/**/*.txt" -f csv  # a glob
+#   find inbox -name '*.txt' | python cli.py --role data_engineer -
+#   python cli.py --role data_engineer --stdin-format jsonl - < resumes.jsonl
+#   python cli.py --best-fit 5 resumes/                        # rank every role
+#
+# Reuses screen_resume and the job-profile registry without importing Streamlit,
+# Plotly or pandas, so a nightly bulk run starts in well under a second.
+
+import argparse
+import csv
+import glob
+import json
+import math
+import os
+import sys
+import time
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from ingest import decode_bytes
+from job_profiles import get_registry
+from screening import screen_resume
+
+OUTPUT_FIELDS = ['id', 'role', 'decision', 'total_score', 'skills_score', 'experience_score',
+                 'education_score', 'experience_years', 'found_skills', 'encoding']
+# Extra field in --best-fit mode: the top roles as (role, total_score) pairs
+RANKED_FIELD = 'ranked_roles'
+
+def iter_paths(inputs: List[str]) -> Iterator[str]:
+    """Expand directories (recursively, *.txt) and glob patterns, lazily and in order"""
+    for item in inputs:
+        if os.path.isdir(item):
+            for root, dirs, files in os.walk(item):
+                dirs.sort()
+                for name in sorted(files):
+                    if name.lower().endswith('.txt'):
+                        yield os.path.join(root, name)
+        elif glob.has_magic(item):
+            yield from sorted(glob.iglob(item, recursive=True))
+        else:
+            yield item
+
+def _skip(source: str, reason: str, unreadable: Optional[List[str]]) -> None:
+    print(f"skipping {source}: {reason}", file=sys.stderr)
+    if unreadable is not None:
+        unreadable.append(source)
+
+def _record_problem(record) -> Optional[str]:
+    """Why a parsed JSONL record cannot be screened, or None if it can"""
+    if not isinstance(record, dict):
+        return "not a JSON object"
+    if 'text' not in record:
+        return "no 'text' field"
+    if not isinstance(record['text'], str):
+        return f"'text' is {type(record['text']).__name__}, not a string"
+    return None
+
+def iter_resumes(inputs: List[str], stdin_format: str,
+                 unreadable: Optional[List[str]] = None) -> Iterator[Tuple[str, bytes]]:
+    """(id, raw bytes) for every resume named by the inputs; '-' reads stdin.
+
+    A file that cannot be read, or a JSONL record that is malformed or has
+    no string 'text', is reported on stderr, appended to `unreadable` (as its
+    path or stdin:<line>) and skipped, so one bad input does not end the run.
+    """
+    for item in inputs:
+        if item != '-':
+            for path in iter_paths([item]):
+                try:
+                    with open(path, 'rb') as handle:
+                        data = handle.read()
+                except OSError as exc:
+                    _skip(path, exc.strerror or str(exc), unreadable)
+                    continue
+                yield path, data
+        elif stdin_format == 'jsonl':
+            for line_number, line in enumerate(sys.stdin, 1):
+                if not line.strip():
+                    continue
+                source = f"stdin:{line_number}"
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError as exc:
+                    _skip(source, f"invalid JSON ({exc.msg} at column {exc.colno})", unreadable)
+                    continue
+                problem = _record_problem(record)
+                if problem:
+                    _skip(source, problem, unreadable)
+                    continue
+                yield str(record.get('id', source)), record['text'].encode('utf-8')
+        else:
+            for line in sys.stdin:
+                path = line.strip()
+                if path:
+                    yield from iter_resumes([path], stdin_format, unreadable)
+
+def positive_int(value: str) -> int:
+    """argparse type for counts that must be at least 1"""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+class ResultWriter:
+    """Buffers result rows and writes them as JSONL or CSV, one batch at a time"""
+
+    def __init__(self, stream, output_format: str, fields: List[str] = OUTPUT_FIELDS):
+        self.stream = stream
+        self.output_format = output_format
+        self._csv = None
+        if output_format == 'csv':
+            self._csv = csv.DictWriter(stream, fieldnames=fields)
+            self._csv.writeheader()
+
+    def write_batch(self, rows: List[Dict]) -> None:
+        if self._csv is not None:
+            self._csv.writerows(self._flatten(row) for row in rows)
+        else:
+            self.stream.write(''.join(json.dumps(row) + '\n' for row in rows))
+        self.stream.flush()
+
+    @staticmethod
+    def _flatten(row: Dict) -> Dict:
+        flat = dict(row, found_skills=';'.join(row['found_skills']))
+        if RANKED_FIELD in row:
+            flat[RANKED_FIELD] = ';'.join(f"{role}:{score}" for role, score in row[RANKED_FIELD])
+        return flat
+
+def screen_batch_serial(batch: List[Tuple[str, bytes]], role: str, latencies: List[float]) -> List[Dict]:
+    rows = []
+    for resume_id, data in batch:
+        start = time.perf_counter()
+        decoded = decode_bytes(data)
+        result = screen_resume(decoded.text, role)
+        latencies.append(time.perf_counter() - start)
+        rows.append({
+            'id': resume_id,
+            'role': role,
+            'decision': result['decision'],
+            'total_score': result['total_score'],
+            'skills_score': result['skills_score'],
+            'experience_score': result['experience_score'],
+            'education_score': result['education_score'],
+            'experience_years': result['experience_years'],
+            'found_skills': result['found_skills'],
+            'encoding': decoded.encoding
+        })
+    return rows
+
+def screen_batch_best_fit(batch: List[Tuple[str, bytes]], top: int, latencies: List[float]) -> List[Dict]:
+    """One row per resume for its best-fit role, with the top roles alongside"""
+    from role_index import get_role_index
+
+    index = get_role_index()
+    rows = []
+    for resume_id, data in batch:
+        start = time.perf_counter()
+        decoded = decode_bytes(data)
+        ranked = index.rank(decoded.text, top)
+        latencies.append(time.perf_counter() - start)
+        best = ranked[0]
+        rows.append({
+            'id': resume_id,
+            'role': best['job_type'],
+            'decision': best['decision'],
+            'total_score': best['total_score'],
+            'skills_score': best['skills_score'],
+            'experience_score': best['experience_score'],
+            'education_score': best['education_score'],
+            'experience_years': best['experience_years'],
+            'found_skills': best['found_skills'],
+            'encoding': decoded.encoding,
+            RANKED_FIELD: [(r['job_type'], r['total_score']) for r in ranked]
+        })
+    return rows
+
+def screen_batch_parallel(batch: List[Tuple[str, bytes]], role: str, workers: int, executor,
+                          latencies: List[float]) -> List[Dict]:
+    from screening import screen_resumes_parallel
+
+    start = time.perf_counter()
+    decoded = [decode_bytes(data) for _, data in batch]
+    frame = screen_resumes_parallel([d.text for d in decoded], role, workers=workers, executor=executor)
+    latencies.append(time.perf_counter() - start)
+
+    rows = []
+    for (resume_id, _), d, result in zip(batch, decoded, frame.to_dict('records')):
+        rows.append({
+            'id': resume_id,
+            'role': role,
+            'decision': result['decision'],
+            'total_score': int(result['total_score']),
+            'skills_score': int(result['skills_score']),
+            'experience_score': int(result['experience_score']),
+            'education_score': int(result['education_score']),
+            'experience_years': int(result['experience_years']),
+            'found_skills': list(result['found_skills']),
+            'encoding': d.encoding
+        })
+    return rows
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Batch-screen resumes without the Streamlit UI")
+    parser.add_argument('inputs', nargs='+', help="directories, files, glob patterns, or '-' for stdin")
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument('-r', '--role', choices=sorted(get_registry()))
+    target.add_argument('--best-fit', type=positive_int, metavar='K',
+                        help="score every role in one pass per resume and report the top K")
+    parser.add_argument('-f', '--format', dest='output_format', choices=['jsonl', 'csv'], default='jsonl')
+    parser.add_argument('-o', '--output', help="output file (default: stdout)")
+    parser.add_argument('-b', '--batch-size', type=int, default=500, help="resumes screened and written per batch")
+    parser.add_argument('-w', '--workers', type=int, default=1,
+                        help="worker processes; above 1, every batch goes through one process pool "
+                             "kept for the whole run")
+    parser.add_argument('--stdin-format', choices=['paths', 'jsonl'], default='paths',
+                        help="stdin carries file paths (one per line) or JSONL records with 'text' and optional 'id'")
+    args = parser.parse_args(argv)
+    best_fit = args.best_fit is not None
+    if best_fit and args.workers > 1:
+        parser.error("--workers is not supported with --best-fit, which scores every role in one pass per resume")
+
+    stream = open(args.output, 'w', newline='', encoding='utf-8') if args.output else sys.stdout
+    writer = ResultWriter(stream, args.output_format,
+                          OUTPUT_FIELDS + [RANKED_FIELD] if best_fit else OUTPUT_FIELDS)
+    latencies: List[float] = []
+    unreadable: List[str] = []
+    processed = 0
+    accepted = 0
+    started = time.perf_counter()
+    executor = None
+    if args.workers > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        # One pool for the whole run, not one per batch
+        executor = ProcessPoolExecutor(max_workers=args.workers)
+
+    def flush(batch: List[Tuple[str, bytes]]) -> None:
+        nonlocal processed, accepted
+        if best_fit:
+            rows = screen_batch_best_fit(batch, args.best_fit, latencies)
+        elif args.workers > 1:
+            rows = screen_batch_parallel(batch, args.role, args.workers, executor, latencies)
+        else:
+            rows = screen_batch_serial(batch, args.role, latencies)
+        writer.write_batch(rows)
+        processed += len(rows)
+        accepted += sum(1 for row in rows if row['decision'] == 'Accept')
+
+    try:
+        batch = []
+        for resume in iter_resumes(args.inputs, args.stdin_format, unreadable):
+            batch.append(resume)
+            if len(batch) >= args.batch_size:
+                flush(batch)
+                batch = []
+        if batch:
+            flush(batch)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+        if args.output:
+            stream.close()
+
+    elapsed = time.perf_counter() - started
+    latencies.sort()
+    unit = "per batch" if args.workers > 1 and not best_fit else "per resume"
+    print(f"Screened {processed} resumes ({accepted} Accept) in {elapsed:.2f}s - "
+          f"{processed / elapsed if elapsed else 0:.1f} resumes/sec", file=sys.stderr)
+    print(f"Latency {unit}: p50 {percentile(latencies, 50) * 1000:.2f} ms, "
+          f"p90 {percentile(latencies, 90) * 1000:.2f} ms, "
+          f"p99 {percentile(latencies, 99) * 1000:.2f} ms, "
+          f"max {(latencies[-1] if latencies else 0) * 1000:.2f} ms", file=sys.stderr)
+    if unreadable:
+        print(f"{len(unreadable)} inputs (files or stdin records) could not be read and were skipped",
+              file=sys.stderr)
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
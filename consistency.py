@@ -0,0 +1,215 @@
+# Metamorphic consistency testing
+# Re-screens controlled perturbations of each resume - changes a human
+# reviewer would call irrelevant - and reports how often the decision flips
+#
+#   python consistency.py --role data_engineer resumes/ --variants 20
+
+import argparse
+import functools
+import json
+import random
+import re
+import sys
+import time
+from typing import Callable, Dict, List, Optional, Pattern, Sequence
+
+from job_profiles import JobProfile, get_registry
+from screening import get_profile, screen_resumes_parallel
+
+NAMES = ["Jordan Lee", "Aaliyah Washington", "Nguyen Van An", "Siobhan O'Connor", "Mohammed Al-Farsi",
+         "Emily Chen", "José Hernández", "Oluwaseun Adeyemi", "Anna Kowalczyk", "Rahul Sharma"]
+
+# Phrasings a reviewer would treat as equivalent. Degree names ("bachelor of
+# science" / "bsc") and "years" / "yrs" are deliberately absent: education
+# terms and experience extraction depend on the exact wording, so swapping
+# them changes the score itself. synonym_pattern() also drops any group that
+# overlaps a role's own terms.
+SYNONYMS = [
+    ["developed", "built", "created"],
+    ["managed", "led", "oversaw"],
+    ["improved", "enhanced", "optimized"],
+    ["company", "organization", "firm"],
+    ["university", "college"],
+]
+_SYNONYM_LOOKUP = {word: group for group in SYNONYMS for word in group}
+
+def _alternation(words: Sequence[str]) -> Pattern:
+    return re.compile(r'\b(' + '|'.join(sorted((re.escape(w) for w in words), key=len, reverse=True))
+                      + r')(?!\w)', re.IGNORECASE)
+
+_SYNONYM_RE = _alternation(list(_SYNONYM_LOOKUP))
+_SECTION_BREAK_RE = re.compile(r'\n\s*\n')
+
+def swap_name(text: str, rng: random.Random) -> str:
+    """Replace the first non-empty line (the candidate's name) with another name"""
+    lines = text.split('\n')
+    for i, line in enumerate(lines):
+        if line.strip():
+            lines[i] = rng.choice(NAMES)
+            break
+    return '\n'.join(lines)
+
+def reorder_sections(text: str, rng: random.Random) -> str:
+    """Shuffle blank-line separated sections, keeping the header block first"""
+    sections = _SECTION_BREAK_RE.split(text)
+    body = sections[1:]
+    rng.shuffle(body)
+    return '\n\n'.join(sections[:1] + body)
+
+@functools.lru_cache(maxsize=64)
+def synonym_pattern(profile: JobProfile) -> Optional[Pattern]:
+    """Phrasings safe to swap for a role: groups where no phrasing contains, or is part of, one of its terms"""
+    terms = profile.required_skills + profile.preferred_skills + profile.education_required
+    safe = [
+        group for group in SYNONYMS
+        if not any(profile.matcher.find(word) or any(re.search(r'\b' + re.escape(word) + r'\b', term)
+                                                     for term in terms)
+                   for word in group)
+    ]
+    return _alternation([word for group in safe for word in group]) if safe else None
+
+def substitute_synonyms(text: str, rng: random.Random, pattern: Optional[Pattern] = _SYNONYM_RE) -> str:
+    """Swap about half of the known phrasings (those `pattern` matches) for an equivalent one"""
+    if pattern is None:
+        return text
+
+    def replace(match):
+        word = match.group(0)
+        if rng.random() < 0.5:
+            return word
+        alternatives = [w for w in _SYNONYM_LOOKUP[word.lower()] if w != word.lower()]
+        replacement = rng.choice(alternatives)
+        return replacement.capitalize() if word[0].isupper() else replacement
+    return pattern.sub(replace, text)
+
+def change_whitespace(text: str, rng: random.Random) -> str:
+    """Collapse or widen spacing, or switch to CRLF line endings"""
+    choice = rng.randrange(3)
+    if choice == 0:
+        return re.sub(r'[ \t]+', ' ', text)
+    if choice == 1:
+        return text.replace(' ', '  ')
+    return text.replace('\n', '\r\n')
+
+def change_case(text: str, rng: random.Random) -> str:
+    """Upper-case, lower-case or title-case the whole resume"""
+    return rng.choice([str.upper, str.lower, str.title])(text)
+
+PERTURBATIONS: Dict[str, Callable[[str, random.Random], str]] = {
+    'name_swap': swap_name,
+    'section_order': reorder_sections,
+    'synonyms': substitute_synonyms,
+    'whitespace': change_whitespace,
+    'casing': change_case,
+}
+
+def variant_kinds(n_variants: int) -> List[str]:
+    """Perturbation used for each variant slot: PERTURBATIONS in turn"""
+    names = list(PERTURBATIONS)
+    return [names[k % len(names)] for k in range(n_variants)]
+
+def generate_variants(text: str, n_variants: int, seed: str,
+                      profile: Optional[JobProfile] = None) -> List[str]:
+    """n_variants perturbed copies of a resume, one per slot of variant_kinds().
+
+    With a profile, synonym swaps are limited to phrasings that cannot touch
+    the role's skill or education terms.
+    """
+    perturbations = PERTURBATIONS
+    if profile is not None:
+        perturbations = dict(PERTURBATIONS, synonyms=functools.partial(substitute_synonyms,
+                                                                       pattern=synonym_pattern(profile)))
+    return [perturbations[name](text, random.Random(f"{seed}:{k}"))
+            for k, name in enumerate(variant_kinds(n_variants))]
+
+def check_consistency(texts: Sequence[str], job_type: str, n_variants: int = 20, seed: int = 0,
+                      workers: Optional[int] = None, chunk_size: int = 500) -> Dict:
+    """Screen every resume and its variants in large batches and count decision flips.
+
+    Originals and variants for up to chunk_size resumes go through
+    screen_resumes_parallel together, so a 20-variant run costs a handful of
+    vectorised batches rather than one screen_resume call per variant.
+    """
+    import numpy as np
+
+    profile = get_profile(job_type)
+    kinds = np.array(variant_kinds(n_variants))
+    by_perturbation = {name: {'variants': 0, 'flips': 0, 'score_change': 0} for name in PERTURBATIONS}
+    flips_per_resume: List[int] = []
+    screening_seconds = 0.0
+
+    for start in range(0, len(texts), chunk_size):
+        chunk = texts[start:start + chunk_size]
+        batch: List[str] = []
+        for offset, text in enumerate(chunk):
+            batch.append(text)
+            batch.extend(generate_variants(text, n_variants, f"{seed}:{start + offset}", profile))
+
+        began = time.perf_counter()
+        frame = screen_resumes_parallel(batch, job_type, workers=workers)
+        screening_seconds += time.perf_counter() - began
+
+        decisions = frame['decision'].to_numpy().reshape(len(chunk), n_variants + 1)
+        scores = frame['total_score'].to_numpy().reshape(len(chunk), n_variants + 1)
+        flipped = decisions[:, 1:] != decisions[:, :1]
+        score_change = abs(scores[:, 1:] - scores[:, :1])
+        flips_per_resume.extend(int(f) for f in flipped.sum(axis=1))
+
+        # Every row uses the same perturbation per column, so tally whole columns at once
+        for name, stats in by_perturbation.items():
+            columns = kinds == name
+            stats['variants'] += int(columns.sum()) * len(chunk)
+            stats['flips'] += int(flipped[:, columns].sum())
+            stats['score_change'] += int(score_change[:, columns].sum())
+
+    total_variants = len(texts) * n_variants
+    total_flips = sum(flips_per_resume)
+    unstable = sorted(((flips, i) for i, flips in enumerate(flips_per_resume) if flips), reverse=True)
+    return {
+        'job_type': job_type,
+        'resumes': len(texts),
+        'variants': total_variants,
+        'flips': total_flips,
+        'flip_rate': total_flips / total_variants if total_variants else 0.0,
+        'resumes_with_flips': len(unstable),
+        'by_perturbation': {
+            name: {
+                'variants': stats['variants'],
+                'flips': stats['flips'],
+                'flip_rate': stats['flips'] / stats['variants'] if stats['variants'] else 0.0,
+                'mean_score_change': stats['score_change'] / stats['variants'] if stats['variants'] else 0.0
+            }
+            for name, stats in by_perturbation.items()
+        },
+        'most_unstable': [{'index': i, 'flips': flips} for flips, i in unstable[:10]],
+        'screening_seconds': screening_seconds,
+        'variants_per_sec': (total_variants + len(texts)) / screening_seconds if screening_seconds else 0.0
+    }
+
+def main(argv: Optional[List[str]] = None) -> int:
+    from cli import iter_resumes
+    from ingest import decode_bytes
+
+    parser = argparse.ArgumentParser(description="Metamorphic decision-consistency test over a resume corpus")
+    parser.add_argument('inputs', nargs='+', help="directories, files, glob patterns, or '-' for stdin")
+    parser.add_argument('-r', '--role', required=True, choices=sorted(get_registry()))
+    parser.add_argument('-n', '--variants', type=int, default=20, help="perturbed variants per resume")
+    parser.add_argument('-s', '--seed', type=int, default=0)
+    parser.add_argument('-w', '--workers', type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument('--stdin-format', choices=['paths', 'jsonl'], default='paths')
+    args = parser.parse_args(argv)
+
+    ids, texts = [], []
+    for resume_id, data in iter_resumes(args.inputs, args.stdin_format):
+        ids.append(resume_id)
+        texts.append(decode_bytes(data).text)
+
+    report = check_consistency(texts, args.role, args.variants, args.seed, args.workers)
+    for entry in report['most_unstable']:
+        entry['id'] = ids[entry['index']]
+    json.dump(report, sys.stdout, indent=2)
+    sys.stdout.write('\n')
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,203 @@
+# Edge-case stress runner
+# Feeds generated pathological resumes through decoding, screen_resume and
+# extract_experience, each in its own process, and reports any input that
+# crashes or breaks its time or peak-memory budget
+#
+#   python edge_cases.py [--size-mb 1] [--large-mb 50] [--json]
+
+import argparse
+import json
+import multiprocessing
+import random
+import signal
+import sys
+import time
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+from ingest import decode_bytes
+from job_profiles import get_registry
+from screening import extract_experience, screen_resume
+
+MB = 1024 * 1024
+
+# Budgets grow with the input: a fixed allowance plus a per-MB rate
+TIME_BUDGET_BASE = 2.0           # seconds
+TIME_BUDGET_PER_MB = 0.5
+MEMORY_BUDGET_BASE = 64 * MB     # bytes of peak resident-set growth
+MEMORY_BUDGET_PER_INPUT_BYTE = 8
+
+_PARAGRAPH = ("Senior Data Engineer with 6+ years of experience building data pipeline and ETL systems "
+              "in Python, SQL and Spark, orchestrated with Airflow on AWS. Bachelor of Computer Science.\n")
+
+def _repeat(unit: bytes, size: int) -> bytes:
+    return unit * max(1, size // len(unit)) if size else b""
+
+def _deep_unicode(size: int) -> bytes:
+    # Stacked combining marks, RTL text, emoji ZWJ sequences, full-width digits and a
+    # non-ASCII "experience" lookalike, so lowercasing and \w/\d classes all get exercised
+    unit = ("e" + "́" * 64 + " ניסיון "
+            "\U0001F469‍\U0001F4BB‍\U0001F52C ５ years experiеnce "
+            "İSTANBUL python​sql ﻿\n").encode('utf-8')
+    return _repeat(unit, size)
+
+CASES: Dict[str, Callable[[int], bytes]] = {
+    'empty': lambda size: b"",
+    'whitespace_only': lambda size: _repeat(b" \t\r\n", size),
+    'large_resume': lambda size: _repeat(_PARAGRAPH.encode('utf-8'), size),
+    'binary_junk': lambda size: random.Random(0).randbytes(size),
+    'nul_bytes': lambda size: bytes(size),
+    'invalid_utf8': lambda size: _repeat(b"python \xff\xfe sql \xc3\x28 5 years \xed\xa0\x80 ", size),
+    'utf16_with_bom': lambda size: b"\xff\xfe" + _repeat(_PARAGRAPH.encode('utf-16-le'), size),
+    'deep_unicode': _deep_unicode,
+    'repeated_experience': lambda size: _repeat(b"experience ", size),
+    'experience_then_late_figure': lambda size: _repeat(b"experience ", size) + b"5 years",
+    'digit_run': lambda size: _repeat(b"7", size),
+    'digits_and_years': lambda size: _repeat(b"1 year ", size),
+    'single_long_word': lambda size: _repeat(b"pythonsql", size),
+    'skill_flood': lambda size: _repeat(b"python sql etl data pipeline spark airflow ", size),
+}
+
+# Cases generated at --large-mb rather than --size-mb
+LARGE_CASES = ('large_resume', 'repeated_experience')
+
+class EdgeCaseResult(NamedTuple):
+    case: str
+    size: int
+    status: str               # ok, time_budget, memory_budget, timeout, error, crashed, signal
+    seconds: Optional[float]
+    peak_memory: Optional[int]
+    time_budget: float
+    memory_budget: int
+    detail: str
+
+def budgets(size: int) -> tuple:
+    """(seconds, bytes) allowed for an input of `size` bytes"""
+    return (TIME_BUDGET_BASE + TIME_BUDGET_PER_MB * size / MB,
+            MEMORY_BUDGET_BASE + MEMORY_BUDGET_PER_INPUT_BYTE * size)
+
+def _peak_rss() -> Optional[int]:
+    """High-water resident set size of this process in bytes, where the platform reports it"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+def _run_case(case: str, size: int, job_type: str, conn) -> None:
+    """Child process: build the input, then time the full screening path and measure its memory.
+
+    Memory is the growth of the peak resident set over the input alone;
+    tracemalloc would be more precise but slows the pure-Python parts of
+    screening several times over, which would make the time budget meaningless.
+    """
+    data = CASES[case](size)
+    baseline = _peak_rss()
+    start = time.perf_counter()
+    try:
+        decoded = decode_bytes(data)
+        result = screen_resume(decoded.text, job_type)
+        extract_experience(decoded.text)
+        detail = f"{decoded.encoding}, {result['decision']} ({result['total_score']})"
+        error = None
+    except Exception as exc:  # reported, not raised: finding these is the point
+        detail = ""
+        error = f"{type(exc).__name__}: {exc}"
+    seconds = time.perf_counter() - start
+    peak = _peak_rss()
+    if peak is not None:
+        peak -= baseline
+    conn.send((len(data), seconds, peak, detail, error))
+    conn.close()
+
+def _exit_result(process: multiprocessing.Process, case: str, size: int, time_budget: float,
+                 memory_budget: int) -> EdgeCaseResult:
+    """Result for a child that died before reporting: killed by a signal, or a non-zero exit"""
+    code = process.exitcode
+    if code < 0:
+        try:
+            name = signal.Signals(-code).name
+        except ValueError:
+            name = f"signal {-code}"
+        return EdgeCaseResult(case, size, 'signal', None, None, time_budget, memory_budget, f"killed by {name}")
+    return EdgeCaseResult(case, size, 'crashed', None, None, time_budget, memory_budget, f"exit code {code}")
+
+def default_role() -> str:
+    """The role cases are screened for when none is given: the registry's first profile id"""
+    return sorted(get_registry())[0]
+
+def run_case(case: str, size: int, job_type: Optional[str] = None) -> EdgeCaseResult:
+    """Run one case in a child process, killing it once it overruns its time budget twice over"""
+    job_type = job_type or default_role()
+    time_budget, memory_budget = budgets(size)
+    parent, child = multiprocessing.Pipe(duplex=False)
+    process = multiprocessing.Process(target=_run_case, args=(case, size, job_type, child), daemon=True)
+    process.start()
+    child.close()
+
+    # Building the input happens inside the child, so allow a little extra wall time
+    deadline = 2 * time_budget + 5
+    if not parent.poll(deadline):
+        # Still running at the deadline: our kill is the timeout, not a crash
+        process.kill()
+        process.join()
+        return EdgeCaseResult(case, size, 'timeout', None, None, time_budget, memory_budget,
+                              f"killed after {deadline:.0f}s")
+    try:
+        actual_size, seconds, peak, detail, error = parent.recv()
+    except EOFError:
+        # The child died before reporting, e.g. a segfault or the OOM killer
+        process.join()
+        return _exit_result(process, case, size, time_budget, memory_budget)
+    process.join()
+
+    time_budget, memory_budget = budgets(actual_size)
+    if error:
+        status, detail = 'error', error
+    elif seconds > time_budget:
+        status = 'time_budget'
+    elif peak is not None and peak > memory_budget:
+        status = 'memory_budget'
+    else:
+        status = 'ok'
+    return EdgeCaseResult(case, actual_size, status, seconds, peak, time_budget, memory_budget, detail)
+
+def run_edge_cases(size: int = MB, large_size: int = 50 * MB, job_type: Optional[str] = None,
+                   cases: Optional[List[str]] = None,
+                   progress: Optional[Callable[[EdgeCaseResult], None]] = None) -> List[EdgeCaseResult]:
+    """Run every case (or the named ones) and return their results in order"""
+    job_type = job_type or default_role()
+    results = []
+    for case in cases or list(CASES):
+        result = run_case(case, large_size if case in LARGE_CASES else size, job_type)
+        if progress:
+            progress(result)
+        results.append(result)
+    return results
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Stress screening with pathological resumes")
+    parser.add_argument('--size-mb', type=float, default=1, help="size of most generated inputs")
+    parser.add_argument('--large-mb', type=float, default=50, help=f"size of {', '.join(LARGE_CASES)}")
+    parser.add_argument('-r', '--role', choices=sorted(get_registry()),
+                        help="role to screen for (default: the registry's first profile id)")
+    parser.add_argument('--case', action='append', choices=sorted(CASES), help="run only these cases")
+    parser.add_argument('--json', action='store_true', help="print results as JSON")
+    args = parser.parse_args(argv)
+
+    def report(result: EdgeCaseResult) -> None:
+        if not args.json:
+            seconds = f"{result.seconds:.2f}s" if result.seconds is not None else "-"
+            peak = f"{result.peak_memory / MB:.1f}MB" if result.peak_memory is not None else "-"
+            print(f"{result.case:<30}{result.size / MB:>9.2f}MB {result.status:<14}{seconds:>9}{peak:>10}"
+                  f"  {result.detail}", file=sys.stderr)
+
+    results = run_edge_cases(int(args.size_mb * MB), int(args.large_mb * MB), args.role, args.case, report)
+    if args.json:
+        json.dump([r._asdict() for r in results], sys.stdout, indent=2)
+        sys.stdout.write('\n')
+    failures = [r for r in results if r.status != 'ok']
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
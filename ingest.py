@@ -0,0 +1,63 @@
+# Resume ingestion
+# Decode uploaded bytes once, detecting the charset from a small sample
+
+import codecs
+import time
+from typing import NamedTuple, Union
+
+# Bytes inspected to pick an encoding before decoding the whole buffer
+SAMPLE_SIZE = 64 * 1024
+
+# Byte values cp1252 leaves undefined; their presence rules it out in favour of latin-1
+_CP1252_UNDEFINED = [bytes([value]) for value in b'\x81\x8d\x8f\x90\x9d']
+
+_BOMS = (
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16'),
+)
+
+class DecodedText(NamedTuple):
+    text: str
+    encoding: str
+    decode_seconds: float
+
+def detect_encoding(sample: Union[bytes, memoryview]) -> str:
+    """Best guess at the encoding of a resume from its first bytes"""
+    sample = memoryview(sample)[:SAMPLE_SIZE]
+    for bom, encoding in _BOMS:
+        if sample[:len(bom)] == bom:
+            return encoding
+
+    # Incremental decoder: a multi-byte character cut off by the sample
+    # boundary is not mistaken for invalid UTF-8
+    try:
+        codecs.getincrementaldecoder('utf-8')().decode(sample, final=False)
+        return 'utf-8'
+    except UnicodeDecodeError:
+        pass
+
+    sample_bytes = sample.tobytes()
+    if not any(byte in sample_bytes for byte in _CP1252_UNDEFINED):
+        return 'cp1252'
+    return 'latin-1'
+
+def decode_bytes(data: Union[bytes, memoryview]) -> DecodedText:
+    """Decode a whole buffer without copying it, trying the detected encoding first.
+
+    Detection only looks at the first SAMPLE_SIZE bytes, so a file that turns
+    out not to match further in falls back to cp1252 and finally latin-1,
+    which accepts any byte sequence.
+    """
+    start = time.perf_counter()
+    view = memoryview(data)
+    encoding = detect_encoding(view[:SAMPLE_SIZE])
+
+    for candidate in dict.fromkeys([encoding, 'cp1252', 'latin-1']):
+        try:
+            text = str(view, candidate)
+            break
+        except UnicodeDecodeError:
+            continue
+
+    return DecodedText(text, candidate, time.perf_counter() - start)
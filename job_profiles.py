@@ -0,0 +1,288 @@
+# Job-profile registry
+# Role definitions live in JSON files rather than in code. Each profile is
+# validated and compiled into its skill matcher once, at load time, and the
+# compiled set is shared read-only by every session in the process
+#
+#   JOB_PROFILES_PATH=/etc/screening/profiles streamlit run app.py
+
+import json
+import os
+import re
+import threading
+import time
+import zlib
+from types import MappingProxyType
+from typing import Dict, Iterable, Iterator, List, Mapping, NamedTuple, Optional, Set, Tuple
+
+DEFAULT_PROFILES_PATH = os.environ.get(
+    "JOB_PROFILES_PATH", os.path.join(os.path.dirname(os.path.abspath(__file__)), "profiles"))
+
+# Seconds between checks for edited profile files
+WATCH_INTERVAL = 5.0
+
+PROFILE_FIELDS = {
+    'title': str,
+    'department': str,
+    'min_experience': int,
+    'required_skills': list,
+    'preferred_skills': list,
+    'education_required': list,
+}
+_PROFILE_ID_RE = re.compile(r'[a-z0-9][a-z0-9_]*\Z')
+
+class ProfileError(ValueError):
+    """One or more job profiles failed validation; the message lists every problem"""
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isalnum() or ch == '_'
+
+def _trie_pattern(terms: Iterable[str]) -> str:
+    """Build a regex alternation factored as a prefix trie of the given terms"""
+    trie: Dict = {}
+    for term in terms:
+        node = trie
+        for ch in term:
+            node = node.setdefault(ch, {})
+        node[''] = {}
+
+    def render(node: Dict) -> str:
+        terminal = '' in node
+        branches = [re.escape(ch) + render(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        if terminal:
+            # Greedy optional group: the longest term wins, shorter prefix is the fallback
+            return ('(?:' + body + ')?') if len(branches) == 1 else body + '?'
+        return body
+
+    return render(trie)
+
+class SkillMatcher:
+    """Single-pass, word-boundary aware matcher for a fixed set of keywords.
+
+    The keywords are compiled into one trie-shaped regular expression, so the
+    text is scanned once and the work per character is bounded by the longest
+    keyword rather than by how many keywords there are (Aho-Corasick style).
+    A trailing plural "s" is accepted, so "pipelines" still counts as
+    "data pipeline" while "r" no longer matches inside ordinary words.
+    """
+
+    def __init__(self, terms: Iterable[str]):
+        self.terms = sorted({term.lower() for term in terms if term})
+        # Zero-width lookahead so matches starting inside an earlier match
+        # (e.g. "intelligence" within "business intelligence") are still seen
+        self._pattern = re.compile(r'(?=(?<![\w])(' + _trie_pattern(self.terms) + r')s?(?![\w]))')
+        # Terms that are themselves whole-word prefixes of a longer term
+        # ("business" in "business intelligence") are credited alongside it
+        self._implied = {term: [other for other in self.terms
+                                if other != term and self._is_word_prefix(other, term)]
+                         for term in self.terms}
+
+    @staticmethod
+    def _is_word_prefix(prefix: str, term: str) -> bool:
+        if not term.startswith(prefix):
+            return False
+        rest = term[len(prefix):]
+        if rest.startswith('s'):
+            rest = rest[1:]
+        return not rest or not _is_word_char(rest[0]) or not _is_word_char(prefix[-1])
+
+    def find(self, text_lower: str) -> Set[str]:
+        """Return every keyword present in already-lowercased text"""
+        found: Set[str] = set()
+        for match in self._pattern.finditer(text_lower):
+            term = match.group(1)
+            if term not in found:
+                found.add(term)
+                found.update(self._implied[term])
+        return found
+
+class JobProfile(NamedTuple):
+    """A validated role, with its skill lists lowercased and its matcher compiled"""
+    id: str
+    title: str
+    department: str
+    min_experience: int
+    required_skills: Tuple[str, ...]
+    preferred_skills: Tuple[str, ...]
+    education_required: Tuple[str, ...]
+    matcher: SkillMatcher
+    revision: int                 # checksum of the definition; changes whenever the profile does
+    source: str
+
+def _validate(profile_id: str, spec, source: str) -> Tuple[Optional[Dict], List[str]]:
+    """Normalised copy of one raw profile and every problem found with it"""
+    where = f"{source}: {profile_id!r}"
+    if not isinstance(profile_id, str) or not _PROFILE_ID_RE.match(profile_id):
+        return None, [f"{where}: ids are lowercase letters, digits and underscores"]
+    if not isinstance(spec, dict):
+        return None, [f"{where}: expected an object, got {type(spec).__name__}"]
+
+    problems = [f"{where}: unknown field {key!r}" for key in sorted(set(spec) - set(PROFILE_FIELDS))]
+    clean: Dict = {}
+    for field, kind in PROFILE_FIELDS.items():
+        value = spec.get(field)
+        if value is None:
+            problems.append(f"{where}: missing {field!r}")
+        elif not isinstance(value, kind) or isinstance(value, bool):
+            problems.append(f"{where}: {field!r} must be a {kind.__name__}")
+        elif kind is list:
+            terms = [term.strip().lower() for term in value if isinstance(term, str) and term.strip()]
+            if len(terms) != len(value):
+                problems.append(f"{where}: {field!r} must hold non-empty strings")
+            elif len(set(terms)) != len(terms):
+                problems.append(f"{where}: {field!r} lists a term twice")
+            clean[field] = tuple(terms)
+        else:
+            clean[field] = value.strip() if kind is str else value
+
+    # Scoring divides by these
+    if clean.get('min_experience', 1) < 1:
+        problems.append(f"{where}: 'min_experience' must be at least 1")
+    for field in ('required_skills', 'preferred_skills'):
+        if field in clean and not clean[field]:
+            problems.append(f"{where}: {field!r} must not be empty")
+    if 'title' in clean and not clean['title']:
+        problems.append(f"{where}: 'title' must not be empty")
+    return clean, problems
+
+def compile_profile(profile_id: str, spec: Dict, source: str = "<memory>") -> JobProfile:
+    """Validate one raw profile definition and compile its matcher"""
+    clean, problems = _validate(profile_id, spec, source)
+    if problems:
+        raise ProfileError("\n".join(problems))
+    return _compile(profile_id, clean, source)
+
+def _compile(profile_id: str, clean: Dict, source: str) -> JobProfile:
+    canonical = json.dumps([profile_id, clean], sort_keys=True)
+    matcher = SkillMatcher(clean['required_skills'] + clean['preferred_skills'] + clean['education_required'])
+    return JobProfile(id=profile_id, matcher=matcher, revision=zlib.crc32(canonical.encode('utf-8')),
+                      source=source, **clean)
+
+def profile_files(path: str) -> List[str]:
+    """The JSON files making up a registry: the file itself, or every *.json under a directory"""
+    if not os.path.isdir(path):
+        return [path]
+    files = []
+    for root, dirs, names in os.walk(path):
+        dirs.sort()
+        files.extend(os.path.join(root, name) for name in sorted(names) if name.lower().endswith('.json'))
+    return files
+
+def load_profiles(path: str) -> Dict[str, JobProfile]:
+    """Read, validate and compile every profile under path.
+
+    Each file holds one JSON object mapping profile id to definition, so a
+    directory can be split by department or team. Nothing is returned unless
+    every profile is valid; ProfileError lists all problems at once.
+    """
+    raw: Dict[str, Tuple[Dict, str]] = {}
+    problems: List[str] = []
+    for file_path in profile_files(path):
+        try:
+            with open(file_path, encoding='utf-8') as handle:
+                document = json.load(handle)
+        except (OSError, ValueError) as exc:
+            problems.append(f"{file_path}: {exc}")
+            continue
+        if not isinstance(document, dict):
+            problems.append(f"{file_path}: expected an object mapping profile ids to definitions")
+            continue
+        for profile_id, spec in document.items():
+            if profile_id in raw:
+                problems.append(f"{file_path}: {profile_id!r} is already defined in {raw[profile_id][1]}")
+                continue
+            clean, found = _validate(profile_id, spec, file_path)
+            problems.extend(found)
+            raw[profile_id] = (clean, file_path)
+
+    if not raw and not problems:
+        problems.append(f"{path}: no job profiles found")
+    if problems:
+        raise ProfileError("\n".join(problems))
+    return {profile_id: _compile(profile_id, clean, source) for profile_id, (clean, source) in raw.items()}
+
+def _signature(path: str) -> Tuple:
+    """Cheap change detector: (file, mtime, size) for every profile file"""
+    signature = []
+    for file_path in profile_files(path):
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            continue
+        signature.append((file_path, stat.st_mtime_ns, stat.st_size))
+    return tuple(signature)
+
+class ProfileRegistry(Mapping):
+    """Read-only mapping of profile id to compiled JobProfile.
+
+    The profiles live in one immutable dict. reload() builds and compiles a
+    complete replacement off to the side and then swaps the reference, so
+    readers never wait on a reload and never see a half-loaded set: a batch
+    that looked its profile up before the swap finishes with the old one.
+    A reload that fails validation leaves the current profiles in place.
+    """
+
+    def __init__(self, path: str = DEFAULT_PROFILES_PATH):
+        self.path = path
+        self.last_error: Optional[str] = None
+        self._reload_lock = threading.Lock()
+        self._watcher: Optional[threading.Thread] = None
+        self._signature = _signature(path)
+        self._profiles: Mapping[str, JobProfile] = MappingProxyType(load_profiles(path))
+
+    def __getitem__(self, profile_id: str) -> JobProfile:
+        return self._profiles[profile_id]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._profiles)
+
+    def __len__(self) -> int:
+        return len(self._profiles)
+
+    def snapshot(self) -> Mapping[str, JobProfile]:
+        """The current profile set; unaffected by later reloads"""
+        return self._profiles
+
+    def reload(self, force: bool = False) -> bool:
+        """Reload if any profile file changed; True when a new set was swapped in"""
+        with self._reload_lock:
+            signature = _signature(self.path)
+            if signature == self._signature and not force:
+                return False
+            try:
+                profiles = load_profiles(self.path)
+            except ProfileError as exc:
+                self.last_error = str(exc)
+                self._signature = signature   # do not retry until the files change again
+                return False
+            self._profiles = MappingProxyType(profiles)
+            self._signature = signature
+            self.last_error = None
+            return True
+
+    def watch(self, interval: float = WATCH_INTERVAL) -> None:
+        """Poll for edited profile files on a daemon thread (once per registry)"""
+        with self._reload_lock:
+            if self._watcher is not None:
+                return
+            def poll():
+                while True:
+                    time.sleep(interval)
+                    self.reload()
+
+            self._watcher = threading.Thread(target=poll, name="job-profile-watcher", daemon=True)
+            self._watcher.start()
+
+_registry: Optional[ProfileRegistry] = None
+_registry_lock = threading.Lock()
+
+def get_registry() -> ProfileRegistry:
+    """The process-wide registry, loaded from DEFAULT_PROFILES_PATH on first use"""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = ProfileRegistry()
+    return _registry
@@ -0,0 +1,14 @@
+# Static page styles
+# Stylesheets live in styles/ and are read once per process; each run sends
+# them as a style-only st.html element, which Streamlit keeps out of the layout
+
+import os
+from functools import lru_cache
+
+STYLES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "styles")
+
+@lru_cache(maxsize=None)
+def stylesheet(name: str) -> str:
+    """<style> block for styles/<name>"""
+    with open(os.path.join(STYLES_DIR, name), encoding="utf-8") as handle:
+        return f"<style>\n{handle.read()}</style>"
@@ -2,6 +2,8 @@
 
 import streamlit as st
 
+from page_styles import stylesheet
+
 def main():
     st.set_page_config(
         page_title="Diagnose Knowledge Check",
@@ -9,60 +11,8 @@ def main():
         layout="centered"
     )
     
-    # Compact CSS styling
-    st.markdown("""
-    <style>
-    .quiz-header {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        padding: 1.5rem;
-        border-radius: 10px;
-        color: white;
-        text-align: center;
-        margin-bottom: 1.5rem;
-    }
-    
-    .question-card {
-        background: #f8fafc;
-        padding: 1.2rem;
-        border-radius: 8px;
-        border-left: 4px solid #3b82f6;
-        margin: 1rem 0;
-        box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1);
-    }
-    
-    .correct-feedback {
-        background: #dcfce7;
-        border: 1px solid #16a34a;
-        padding: 1rem;
-        border-radius: 6px;
-        margin: 1rem 0;
-        border-left: 4px solid #16a34a;
-    }
-    
-    .incorrect-feedback {
-        background: #fee2e2;
-        border: 1px solid #dc2626;
-        padding: 1rem;
-        border-radius: 6px;
-        margin: 1rem 0;
-        border-left: 4px solid #dc2626;
-    }
-    
-    .progress-bar {
-        background: #e5e7eb;
-        height: 8px;
-        border-radius: 4px;
-        margin: 1rem 0;
-    }
-    
-    .progress-fill {
-        background: #3b82f6;
-        height: 100%;
-        border-radius: 4px;
-        transition: width 0.3s ease;
-    }
-    </style>
-    """, unsafe_allow_html=True)
+    # Compact CSS styling, loaded from styles/questions.css once per process
+    st.html(stylesheet("questions.css"))
     
     # Initialize session state
     if 'current_question' not in st.session_state:
@@ -0,0 +1,164 @@
+# Policy re-scoring
+# Each resume's screening features are kept once per role in compact numeric
+# form, so a new set of weights or a new Accept threshold is applied to a
+# whole pool without re-reading or re-scanning a single resume
+
+import threading
+from typing import Dict, Iterable, List, NamedTuple, Sequence, Set, Tuple
+
+import numpy as np
+
+from job_profiles import JobProfile
+
+class ScoringPolicy(NamedTuple):
+    """The weights and threshold screen_resume applies; the defaults reproduce it exactly"""
+    required_weight: float = 70
+    preferred_weight: float = 30
+    skills_weight: float = 0.5
+    experience_weight: float = 0.3
+    education_weight: float = 0.2
+    education_missing_score: float = 50
+    accept_threshold: int = 70
+
+DEFAULT_POLICY = ScoringPolicy()
+
+def policy_scores(required_hits, n_required, preferred_hits, n_preferred, educated, years, min_experience,
+                  policy: ScoringPolicy = DEFAULT_POLICY) -> Tuple[np.ndarray, ...]:
+    """(total, skills, experience, education) scores from hit counts, element-wise over arrays.
+
+    The one vectorised copy of screen_resume's arithmetic (and rounding) for
+    the feature cache, the talent index and multi-role ranking; under
+    DEFAULT_POLICY it reproduces screen_resume exactly. Compare the total
+    with policy.accept_threshold for the decision.
+    """
+    skills_score = (required_hits / n_required * policy.required_weight
+                    + preferred_hits / n_preferred * policy.preferred_weight)
+    experience_score = np.minimum(years / min_experience * 100, 100)
+    education_score = np.where(educated, 100, policy.education_missing_score)
+    total = (skills_score * policy.skills_weight + experience_score * policy.experience_weight
+             + education_score * policy.education_weight).astype(np.int64)
+    return total, skills_score, experience_score, education_score
+
+# Set bits per byte value, for counting matched terms in a packed bitmask
+_POPCOUNT = np.array([bin(value).count('1') for value in range(256)], dtype=np.uint8)
+
+class FeatureCache:
+    """Screening features of a pool of resumes for one role.
+
+    Per resume: a bitmask of which of the role's terms it contains (one
+    bit per term, in required, preferred, education order), its years of
+    experience and its education flag. A score depends only on the required
+    and preferred hit counts, the education flag and the years capped at
+    min_experience, so the pool collapses into a few hundred distinct
+    feature cells. rescore() scores each cell with exactly screen_resume's
+    arithmetic and broadcasts the cell scores back to every resume with one
+    gather. extend() appends resumes, computing features for the new ones
+    only; a lock keeps readers from seeing a half-appended batch.
+    """
+
+    def __init__(self, profile: JobProfile, ids: Sequence[str], masks: np.ndarray, years: Sequence[int]):
+        self.profile = profile
+        n_required, n_preferred = len(profile.required_skills), len(profile.preferred_skills)
+        self.n_terms = n_required + n_preferred + len(profile.education_required)
+        kinds = np.repeat([0, 1, 2], [n_required, n_preferred, len(profile.education_required)])
+        self._kind_masks = [np.packbits(kinds == kind, bitorder='little') for kind in range(3)]
+        self._shape = (n_required + 1, n_preferred + 1, 2, profile.min_experience + 1)
+        self._lock = threading.RLock()
+
+        self.ids = np.asarray(ids, dtype=object)
+        self.masks, self.years, self.educated, self._cells = self._features(masks, years)
+
+    def _features(self, masks: np.ndarray, years: Sequence[int]) -> Tuple[np.ndarray, ...]:
+        """(masks, years, education flags, feature cells) for a run of resumes"""
+        # Explicit row width, so an empty pool still has the right shape
+        masks = np.asarray(masks, dtype=np.uint8).reshape(-1, (self.n_terms + 7) // 8)
+        years = np.asarray(years, dtype=np.int32)
+        required_hits, preferred_hits, education_hits = (
+            _POPCOUNT[masks & kind_mask].sum(axis=1, dtype=np.int64) for kind_mask in self._kind_masks)
+        educated = education_hits > 0
+
+        # Cell of every resume: (required hits, preferred hits, education, capped years)
+        cells = np.ravel_multi_index(
+            (required_hits, preferred_hits, educated.astype(np.int64), np.minimum(years, self.profile.min_experience)),
+            self._shape)
+        return masks, years, educated, cells
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def extend(self, ids: Sequence[str], masks: np.ndarray, years: Sequence[int]) -> None:
+        """Append resumes by their term bitmasks and years"""
+        features = self._features(masks, years)
+        with self._lock:
+            self.ids = np.concatenate((self.ids, np.asarray(ids, dtype=object)))
+            self.masks, self.years, self.educated, self._cells = (
+                np.concatenate((current, new))
+                for current, new in zip((self.masks, self.years, self.educated, self._cells), features))
+
+    def sync(self, index) -> int:
+        """Append the TalentIndex resumes past the ones already held, from their posting lists; returns how many"""
+        with self._lock:
+            start, stop = len(self), len(index)
+            if stop <= start:
+                return 0
+            self.extend(index.ids[start:stop], _index_bits(index, self.profile, start, stop), index.years[start:stop])
+            return stop - start
+
+    @classmethod
+    def from_term_sets(cls, profile: JobProfile, ids: Sequence[str], term_sets: Iterable[Set[str]],
+                       years: Sequence[int]) -> 'FeatureCache':
+        """Build from each resume's matched terms (terms outside the role are ignored)"""
+        vocabulary = profile.required_skills + profile.preferred_skills + profile.education_required
+        # A term can count twice, e.g. "statistics" as both a skill and an education term
+        positions: Dict[str, List[int]] = {}
+        for bit, term in enumerate(vocabulary):
+            positions.setdefault(term, []).append(bit)
+        bits = np.zeros((len(ids), len(vocabulary)), dtype=bool)
+        for row, terms in enumerate(term_sets):
+            bits[row, [bit for term in terms for bit in positions.get(term, ())]] = True
+        return cls(profile, ids, np.packbits(bits, axis=1, bitorder='little'), years)
+
+    @classmethod
+    def from_talent_index(cls, index, profile: JobProfile) -> 'FeatureCache':
+        """Build from a TalentIndex's posting lists, without touching any resume text"""
+        stop = len(index)
+        return cls(profile, index.ids[:stop], _index_bits(index, profile, 0, stop), index.years[:stop])
+
+    def cell_scores(self, policy: ScoringPolicy = DEFAULT_POLICY) -> Tuple[np.ndarray, ...]:
+        """(total, skills, experience, education) score of every feature cell under a policy"""
+        required, preferred, educated, years = np.indices(self._shape)
+        profile = self.profile
+        scores = policy_scores(required, len(profile.required_skills), preferred, len(profile.preferred_skills),
+                               educated, years, profile.min_experience, policy)
+        return tuple(column.ravel() for column in scores)
+
+    def rescore(self, policy: ScoringPolicy = DEFAULT_POLICY) -> Tuple[np.ndarray, np.ndarray]:
+        """(total score, accepted) for every resume under a policy"""
+        totals = self.cell_scores(policy)[0][self._cells]
+        return totals, totals >= policy.accept_threshold
+
+    def compare(self, policy: ScoringPolicy, baseline: ScoringPolicy = DEFAULT_POLICY) -> Dict:
+        """How decisions move between the baseline policy and a new one"""
+        with self._lock:
+            cells = self._cells
+        before = self.cell_scores(baseline)[0][cells] >= baseline.accept_threshold
+        totals = self.cell_scores(policy)[0][cells]
+        after = totals >= policy.accept_threshold
+        return {
+            'candidates': len(cells),
+            'accepted_before': int(before.sum()),
+            'accepted_after': int(after.sum()),
+            'newly_accepted': int((after & ~before).sum()),
+            'newly_rejected': int((before & ~after).sum()),
+            'mean_score': float(totals.mean()) if len(totals) else 0.0,
+        }
+
+def _index_bits(index, profile: JobProfile, start: int, stop: int) -> np.ndarray:
+    """Packed term bitmasks of TalentIndex resumes start..stop-1, read off the posting lists"""
+    vocabulary = profile.required_skills + profile.preferred_skills + profile.education_required
+    bits = np.zeros((stop - start, len(vocabulary)), dtype=bool)
+    for bit, term in enumerate(vocabulary):
+        posting = index.postings(term)
+        rows = posting[np.searchsorted(posting, start):np.searchsorted(posting, stop)]
+        bits[rows - start, bit] = True
+    return np.packbits(bits, axis=1, bitorder='little')
@@ -0,0 +1,286 @@
+# Persistent screening results store
+# SQLite (WAL mode) so results outlive the Streamlit session and can be
+# sliced across batches by role, decision and score band
+
+import os
+import sqlite3
+import threading
+import time
+import uuid
+import zlib
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from analytics import ScreeningAggregates
+from job_profiles import JobProfile
+from screening import get_profile, scoring_version
+
+DEFAULT_DB_PATH = os.environ.get("SCREENING_DB_PATH", "screening_results.db")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS candidates (
+    id INTEGER PRIMARY KEY,
+    content_hash TEXT NOT NULL UNIQUE,
+    filename TEXT NOT NULL,
+    snippet TEXT NOT NULL,
+    first_seen REAL NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS results (
+    id INTEGER PRIMARY KEY,
+    candidate_id INTEGER NOT NULL REFERENCES candidates(id),
+    job_type TEXT NOT NULL,
+    scoring_version INTEGER NOT NULL,
+    decision TEXT NOT NULL,
+    total_score INTEGER NOT NULL,
+    skills_score INTEGER NOT NULL,
+    experience_score INTEGER NOT NULL,
+    education_score INTEGER NOT NULL,
+    experience_years INTEGER NOT NULL,
+    ingested_at REAL NOT NULL,
+    UNIQUE (candidate_id, job_type, scoring_version)
+);
+
+CREATE TABLE IF NOT EXISTS skill_matches (
+    result_id INTEGER NOT NULL REFERENCES results(id),
+    skill TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    PRIMARY KEY (result_id, skill)
+) WITHOUT ROWID;
+
+-- Full resume text, zlib-compressed, for re-screening (e.g. consistency tests)
+CREATE TABLE IF NOT EXISTS resume_texts (
+    content_hash TEXT PRIMARY KEY,
+    body BLOB NOT NULL
+) WITHOUT ROWID;
+
+-- Order in which full texts were stored, so the talent index can pick up only new ones
+CREATE TABLE IF NOT EXISTS resume_text_order (
+    sequence INTEGER PRIMARY KEY,
+    content_hash TEXT NOT NULL UNIQUE REFERENCES resume_texts(content_hash)
+);
+
+CREATE TABLE IF NOT EXISTS batches (
+    id TEXT PRIMARY KEY,
+    job_type TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    created_at REAL NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS batch_members (
+    batch_id TEXT NOT NULL REFERENCES batches(id),
+    position INTEGER NOT NULL,
+    result_id INTEGER NOT NULL REFERENCES results(id),
+    filename TEXT NOT NULL,
+    PRIMARY KEY (batch_id, position)
+) WITHOUT ROWID;
+
+-- Role + score band slices are answered from the index alone
+CREATE INDEX IF NOT EXISTS idx_results_role_score ON results (job_type, total_score, decision);
+CREATE INDEX IF NOT EXISTS idx_results_score ON results (total_score, decision);
+CREATE INDEX IF NOT EXISTS idx_results_decision ON results (decision, job_type);
+CREATE INDEX IF NOT EXISTS idx_results_ingested ON results (ingested_at);
+CREATE INDEX IF NOT EXISTS idx_skill_matches_skill ON skill_matches (skill, result_id);
+"""
+
+RESULT_COLUMNS = ['decision', 'total_score', 'skills_score', 'experience_score',
+                  'education_score', 'experience_years']
+
+class ResultStore:
+    """SQLite-backed store of candidates, screening results and skill matches.
+
+    One connection is shared by all sessions in the process and serialised
+    with a lock; WAL mode keeps readers in other processes (e.g. the CLI or a
+    second app server) from blocking on writes.
+    """
+
+    def __init__(self, path: str = DEFAULT_DB_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA foreign_keys=ON")
+        self._conn.executescript(SCHEMA)
+        with self._conn:
+            # Texts stored before resume_text_order existed, in first-seen order
+            self._conn.execute(
+                "INSERT OR IGNORE INTO resume_text_order (content_hash) "
+                "SELECT t.content_hash FROM resume_texts t JOIN candidates c ON c.content_hash = t.content_hash "
+                "WHERE t.content_hash NOT IN (SELECT content_hash FROM resume_text_order) ORDER BY c.id")
+        self._aggregates: Optional[ScreeningAggregates] = None
+
+    @property
+    def aggregates(self) -> ScreeningAggregates:
+        """Running aggregates over the latest result of every candidate for each role.
+
+        A resume re-screened after a profile edit has one result per scoring
+        version; only the most recently screened one is counted. Seeded from
+        the database on first use, then kept current by add_batch, so reading
+        them never touches the results table again. Writes from other
+        processes are only picked up on the next seed.
+        """
+        with self._lock:
+            if self._aggregates is None:
+                aggregates = ScreeningAggregates()
+                for job_type, total_score, decision, count in self._conn.execute(
+                        "SELECT job_type, total_score, decision, COUNT(*) FROM ("
+                        "  SELECT job_type, total_score, decision, ROW_NUMBER() OVER ("
+                        "    PARTITION BY candidate_id, job_type ORDER BY ingested_at DESC, id DESC) AS recency"
+                        "  FROM results) WHERE recency = 1 "
+                        "GROUP BY job_type, total_score, decision"):
+                    aggregates.add(job_type, total_score, decision, count)
+                self._aggregates = aggregates
+            return self._aggregates
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def add_batch(self, job_type: str, rows: List[Dict], profile: Optional[JobProfile] = None) -> str:
+        """Persist one screened upload batch and return its batch id.
+
+        Each row carries 'content_hash', 'filename', 'resume_text' (the stored
+        snippet), 'result' (a screen_resumes record) and optionally
+        'full_text', kept compressed for later re-screening. A resume already
+        screened for the same role and scoring version is linked to the new
+        batch rather than stored twice (and becomes its latest result again).
+        The version includes the role's profile revision, so results from
+        before a profile edit are not reused; pass the profile the rows were
+        screened with (default: the registry's current one).
+        """
+        profile = profile or get_profile(job_type)
+        required = set(profile.required_skills)
+        version = scoring_version(profile)
+        batch_id = uuid.uuid4().hex
+        now = time.time()
+
+        changes: List[Tuple[int, str, int]] = []
+
+        with self._lock:
+            with self._conn:
+                self._insert_batch(batch_id, job_type, version, rows, required, now, changes)
+            if self._aggregates is not None:
+                for total_score, decision, count in changes:
+                    self._aggregates.add(job_type, total_score, decision, count)
+
+        return batch_id
+
+    def _insert_batch(self, batch_id: str, job_type: str, version: int, rows: List[Dict], required: set,
+                      now: float, changes: List[Tuple[int, str, int]]) -> None:
+        """Write one batch inside the caller's transaction.
+
+        Collects (total_score, decision, +1/-1) for every change to which
+        result is a candidate's latest for the role, for the running aggregates.
+        """
+        conn = self._conn
+        conn.execute("INSERT INTO batches (id, job_type, size, created_at) VALUES (?, ?, ?, ?)",
+                     (batch_id, job_type, len(rows), now))
+        for position, row in enumerate(rows):
+            conn.execute(
+                "INSERT OR IGNORE INTO candidates (content_hash, filename, snippet, first_seen) VALUES (?, ?, ?, ?)",
+                (row['content_hash'], row['filename'], row['resume_text'], now))
+            candidate_id = conn.execute("SELECT id FROM candidates WHERE content_hash = ?",
+                                        (row['content_hash'],)).fetchone()[0]
+            if row.get('full_text') is not None:
+                if conn.execute("INSERT OR IGNORE INTO resume_texts (content_hash, body) VALUES (?, ?)",
+                                (row['content_hash'], zlib.compress(row['full_text'].encode('utf-8')))).rowcount:
+                    conn.execute("INSERT INTO resume_text_order (content_hash) VALUES (?)", (row['content_hash'],))
+
+            previous = conn.execute(
+                "SELECT id, total_score, decision FROM results WHERE candidate_id = ? AND job_type = ? "
+                "ORDER BY ingested_at DESC, id DESC LIMIT 1", (candidate_id, job_type)).fetchone()
+
+            result = row['result']
+            cursor = conn.execute(
+                "INSERT OR IGNORE INTO results (candidate_id, job_type, scoring_version, decision, total_score, "
+                "skills_score, experience_score, education_score, experience_years, ingested_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (candidate_id, job_type, version, result['decision'], int(result['total_score']),
+                 int(result['skills_score']), int(result['experience_score']),
+                 int(result['education_score']), int(result['experience_years']), now))
+            if cursor.rowcount:
+                result_id = cursor.lastrowid
+                conn.executemany(
+                    "INSERT OR IGNORE INTO skill_matches (result_id, skill, kind) VALUES (?, ?, ?)",
+                    [(result_id, skill, 'required' if skill in required else 'preferred')
+                     for skill in result.get('found_skills', [])])
+            else:
+                result_id = conn.execute(
+                    "SELECT id FROM results WHERE candidate_id = ? AND job_type = ? AND scoring_version = ?",
+                    (candidate_id, job_type, version)).fetchone()[0]
+                # Screened again under this version (e.g. a profile edit was reverted): latest once more
+                conn.execute("UPDATE results SET ingested_at = ? WHERE id = ?", (now, result_id))
+
+            if previous is None or previous[0] != result_id:
+                if previous is not None:
+                    changes.append((previous[1], previous[2], -1))
+                changes.append((int(result['total_score']), result['decision'], 1))
+
+            conn.execute("INSERT INTO batch_members (batch_id, position, result_id, filename) VALUES (?, ?, ?, ?)",
+                         (batch_id, position, result_id, row['filename']))
+
+    def batch_results(self, batch_id: str) -> List[Dict]:
+        """A batch's results in upload order, shaped like the app's screening_results"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT m.position, m.filename, c.snippet, c.content_hash, r.job_type, r.id, r." + ", r.".join(RESULT_COLUMNS) + " "
+                "FROM batch_members m JOIN results r ON r.id = m.result_id "
+                "JOIN candidates c ON c.id = r.candidate_id "
+                "WHERE m.batch_id = ? ORDER BY m.position", (batch_id,)).fetchall()
+            skills = self._skills_for([row[5] for row in rows])
+
+        return [
+            {
+                'name': f"Candidate_{position + 1}",
+                'position': position,
+                'job_type': job_type,
+                'content_hash': digest,
+                'filename': filename,
+                'result': dict(zip(RESULT_COLUMNS, values), found_skills=skills.get(result_id, [])),
+                'resume_text': snippet
+            }
+            for position, filename, snippet, digest, job_type, result_id, *values in rows
+        ]
+
+    def resume_texts(self, content_hashes: List[str]) -> Dict[str, str]:
+        """Full text of each stored resume, by content hash; resumes stored without text are absent"""
+        texts: Dict[str, str] = {}
+        with self._lock:
+            for start in range(0, len(content_hashes), 500):
+                chunk = content_hashes[start:start + 500]
+                query = ("SELECT content_hash, body FROM resume_texts WHERE content_hash IN ("
+                         + ", ".join("?" * len(chunk)) + ")")
+                for digest, body in self._conn.execute(query, chunk):
+                    texts[digest] = zlib.decompress(body).decode('utf-8')
+        return texts
+
+    def stored_resumes(self, after: int = 0, page_size: int = 500) -> Iterator[Tuple[int, str, str, str]]:
+        """Resumes stored with their full text after a sequence number, in storage order.
+
+        Yields (sequence number, content hash, first filename, full text),
+        read a page at a time so the texts are never all held at once and the
+        lock is released between pages.
+        """
+        while True:
+            with self._lock:
+                rows = self._conn.execute(
+                    "SELECT o.sequence, t.content_hash, c.filename, t.body FROM resume_text_order o "
+                    "JOIN resume_texts t ON t.content_hash = o.content_hash "
+                    "JOIN candidates c ON c.content_hash = o.content_hash "
+                    "WHERE o.sequence > ? ORDER BY o.sequence LIMIT ?", (after, page_size)).fetchall()
+            for sequence, digest, filename, body in rows:
+                yield sequence, digest, filename, zlib.decompress(body).decode('utf-8')
+            if len(rows) < page_size:
+                return
+            after = rows[-1][0]
+
+    def _skills_for(self, result_ids: List[int]) -> Dict[int, List[str]]:
+        skills: Dict[int, List[str]] = {}
+        # Stay well under SQLite's bound-parameter limit
+        for start in range(0, len(result_ids), 500):
+            chunk = result_ids[start:start + 500]
+            query = ("SELECT result_id, skill FROM skill_matches WHERE result_id IN ("
+                     + ", ".join("?" * len(chunk)) + ")")
+            for result_id, skill in self._conn.execute(query, chunk):
+                skills.setdefault(result_id, []).append(skill)
+        return skills
@@ -0,0 +1,120 @@
+# Columnar screening results
+# One NumPy column per field, so the results view can sort, filter and page
+# through thousands of candidates without touching per-candidate objects.
+# This is the only per-candidate state a session keeps: matched skills are a
+# packed bitmask against the role's vocabulary, decoded only for display
+
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from job_profiles import JobProfile
+
+SCORE_COLUMNS = ['total_score', 'skills_score', 'experience_score', 'education_score', 'experience_years']
+
+class ResultsTable:
+    """A screened batch held column-wise.
+
+    query() computes the row order for a filter and sort with a few array
+    operations; page() builds display rows for one page only. Matched skills
+    are one bit per term of the role's skills (required, then preferred), so
+    filtering on a skill is a bit test over one byte column and skill names
+    are only built for the rows on screen. Scores fit in int16 (experience
+    years are capped at three digits by extraction).
+    """
+
+    def __init__(self, profile: JobProfile, filenames: Sequence[str], content_hashes: Sequence[str], frame,
+                 encodings: Sequence[str], decode_ms: Sequence[float], size_kb: Sequence[float]):
+        self.vocabulary = profile.required_skills + profile.preferred_skills
+        self.filenames = np.asarray(filenames, dtype=object)
+        # Raw digest bytes (a bytes dtype would drop trailing NULs)
+        self.content_hashes = np.frombuffer(b''.join(bytes.fromhex(digest) for digest in content_hashes),
+                                            dtype=np.uint8).reshape(len(self.filenames), -1)
+        self.accepted = frame['decision'].to_numpy() == 'Accept'
+        self.columns: Dict[str, np.ndarray] = {
+            column: frame[column].to_numpy(dtype=np.int16) for column in SCORE_COLUMNS
+        }
+        self.skill_masks = self.encode_skills(frame['found_skills'])
+
+        # Upload decoding details, for the decoding expander
+        self.encoding_labels, codes = np.unique(np.asarray(encodings, dtype=object), return_inverse=True)
+        self.encoding_codes = codes.astype(np.uint8)
+        self.decode_ms = np.asarray(decode_ms, dtype=np.float32)
+        self.size_kb = np.asarray(size_kb, dtype=np.float32)
+
+    def __len__(self) -> int:
+        return len(self.filenames)
+
+    def encode_skills(self, found_skills: Sequence[Sequence[str]]) -> np.ndarray:
+        """Packed (rows, bytes) bitmask of each row's matched skills"""
+        # A term listed as both required and preferred is reported once per list
+        positions: Dict[str, List[int]] = {}
+        for bit, term in enumerate(self.vocabulary):
+            positions.setdefault(term, []).append(bit)
+        bits = np.zeros((len(found_skills), len(self.vocabulary)), dtype=bool)
+        for row, skills in enumerate(found_skills):
+            bits[row, [bit for skill in set(skills) for bit in positions[skill]]] = True
+        return np.packbits(bits, axis=1, bitorder='little')
+
+    def found_skills(self, row: int) -> List[str]:
+        """Matched skill names of one row, in screen_resume's order"""
+        bits = np.unpackbits(self.skill_masks[row], count=len(self.vocabulary), bitorder='little')
+        return [self.vocabulary[bit] for bit in np.flatnonzero(bits)]
+
+    def _has_skill(self, skill: str) -> np.ndarray:
+        has_skill = np.zeros(len(self), dtype=bool)
+        for bit, term in enumerate(self.vocabulary):
+            if term == skill:
+                has_skill |= ((self.skill_masks[:, bit >> 3] >> (bit & 7)) & 1).astype(bool)
+        return has_skill
+
+    def name(self, row: int) -> str:
+        return f"Candidate_{row + 1}"
+
+    def content_hash(self, row: int) -> str:
+        return self.content_hashes[row].tobytes().hex()
+
+    def encodings(self) -> np.ndarray:
+        return self.encoding_labels[self.encoding_codes]
+
+    def skills(self) -> List[str]:
+        """Every skill matched by at least one candidate in the batch"""
+        if not len(self):
+            return []
+        present = np.unpackbits(np.bitwise_or.reduce(self.skill_masks, axis=0), count=len(self.vocabulary),
+                                bitorder='little')
+        return sorted({self.vocabulary[bit] for bit in np.flatnonzero(present)})
+
+    def query(self, decision: Optional[str] = None, min_score: int = 0, max_score: int = 100,
+              skill: Optional[str] = None, sort_by: Optional[str] = 'total_score',
+              descending: bool = True) -> np.ndarray:
+        """Row indices matching the filters, in display order (upload order if sort_by is None)"""
+        score = self.columns['total_score']
+        mask = (score >= min_score) & (score <= max_score)
+        if decision:
+            mask &= self.accepted if decision == 'Accept' else ~self.accepted
+        if skill:
+            mask &= self._has_skill(skill)
+
+        rows = np.flatnonzero(mask)
+        if sort_by:
+            keys = self.columns[sort_by][rows]
+            # Stable, so ties keep upload order in both directions
+            rows = rows[np.argsort(-keys if descending else keys, kind='stable')]
+        return rows
+
+    def page(self, rows: np.ndarray, page: int, page_size: int):
+        """Display frame for one page (1-based) of the given row order"""
+        import pandas as pd
+
+        visible = rows[(page - 1) * page_size:page * page_size]
+        return pd.DataFrame({
+            'Candidate': [self.name(row) for row in visible],
+            'File': self.filenames[visible],
+            'Decision': np.where(self.accepted[visible], 'Accept', 'Reject'),
+            'Score': self.columns['total_score'][visible],
+            'Skills': self.columns['skills_score'][visible],
+            'Experience (years)': self.columns['experience_years'][visible],
+            'Education': self.columns['education_score'][visible],
+            'Matched skills': [', '.join(self.found_skills(row)) for row in visible],
+        })
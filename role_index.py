@@ -0,0 +1,127 @@
+# Multi-role scoring
+# Scores one resume against every job profile in a single scan: one matcher
+# over the union of all roles' terms, and an inverted index from each term
+# to the roles (and requirement kinds) it counts for
+
+import threading
+from typing import Dict, List, Mapping, Optional, Set, Tuple
+
+import numpy as np
+
+from job_profiles import JobProfile, SkillMatcher, get_registry
+from rescoring import DEFAULT_POLICY, policy_scores
+from screening import _extract_experience_lower
+
+REQUIRED, PREFERRED, EDUCATION = 0, 1, 2
+
+class RoleIndex:
+    """Inverted index over a fixed set of compiled job profiles.
+
+    The text is scanned once by a matcher over every role's terms, and each
+    matched term adds a hit to the roles listed in its posting list; scoring
+    is then a handful of array operations across all roles. Scanning costs
+    the same however many roles there are, so ranking 300 roles costs little
+    more than screening against one.
+    """
+
+    def __init__(self, profiles: Mapping[str, JobProfile]):
+        self.role_ids = list(profiles)
+        self.profiles = [profiles[role] for role in self.role_ids]
+
+        postings: Dict[str, List[Tuple[int, int]]] = {}
+        for role, profile in enumerate(self.profiles):
+            for kind, terms in ((REQUIRED, profile.required_skills), (PREFERRED, profile.preferred_skills),
+                                (EDUCATION, profile.education_required)):
+                for term in terms:
+                    postings.setdefault(term, []).append((role, kind))
+
+        self.matcher = SkillMatcher(list(postings))
+        # Each term's posting list is a slice of one flat array of cells; a hit
+        # adds one to cell kind * roles + role of the flattened (kind, role) counts
+        self._slices: Dict[str, slice] = {}
+        cells: List[int] = []
+        for term, entries in postings.items():
+            self._slices[term] = slice(len(cells), len(cells) + len(entries))
+            cells.extend(kind * len(self.role_ids) + role for role, kind in entries)
+        self._cells = np.asarray(cells, dtype=np.int64)
+
+        self._n_required = np.array([len(p.required_skills) for p in self.profiles], dtype=np.float64)
+        self._n_preferred = np.array([len(p.preferred_skills) for p in self.profiles], dtype=np.float64)
+        self._min_experience = np.array([p.min_experience for p in self.profiles], dtype=np.float64)
+
+    def __len__(self) -> int:
+        return len(self.role_ids)
+
+    def hits(self, matched: Set[str]) -> np.ndarray:
+        """(3, roles) counts of required, preferred and education terms present"""
+        n_roles = len(self.role_ids)
+        if not matched:
+            return np.zeros((3, n_roles), dtype=np.int64)
+        cells = np.concatenate([self._cells[self._slices[term]] for term in matched])
+        return np.bincount(cells, minlength=3 * n_roles).reshape(3, n_roles)
+
+    def scores(self, hits: np.ndarray, experience_years: int) -> Dict[str, np.ndarray]:
+        """Every role's score components, computed exactly as screen_resume does"""
+        total_score, skills_score, experience_score, education_score = policy_scores(
+            hits[REQUIRED], self._n_required, hits[PREFERRED], self._n_preferred, hits[EDUCATION] > 0,
+            experience_years, self._min_experience)
+        return {
+            'total_score': total_score,
+            'skills_score': skills_score.astype(np.int64),
+            'experience_score': experience_score.astype(np.int64),
+            'education_score': education_score,
+        }
+
+    def rank(self, resume_text: str, top: Optional[int] = None) -> List[Dict]:
+        """Roles ranked by total score, then skills score, each with a full breakdown.
+
+        Every entry has the fields of a screen_resume result plus 'job_type'
+        and 'title'; only the returned roles have their skill lists built.
+        """
+        resume_lower = resume_text.lower()
+        matched = self.matcher.find(resume_lower)
+        years = _extract_experience_lower(resume_lower)
+        scores = self.scores(self.hits(matched), years)
+
+        # lexsort keys run last-to-first: total score, then skills score, both descending
+        order = np.lexsort((-scores['skills_score'], -scores['total_score']))
+        if top is not None:
+            order = order[:top]
+
+        ranked = []
+        for role in order:
+            profile = self.profiles[role]
+            total = int(scores['total_score'][role])
+            ranked.append({
+                'job_type': self.role_ids[role],
+                'title': profile.title,
+                'decision': 'Accept' if total >= DEFAULT_POLICY.accept_threshold else 'Reject',
+                'total_score': total,
+                'skills_score': int(scores['skills_score'][role]),
+                'experience_score': int(scores['experience_score'][role]),
+                'education_score': int(scores['education_score'][role]),
+                'found_skills': ([s for s in profile.required_skills if s in matched]
+                                 + [s for s in profile.preferred_skills if s in matched]),
+                'experience_years': years,
+                'experience_assessment': f"{years} years"
+            })
+        return ranked
+
+_index: Optional[Tuple[Mapping, RoleIndex]] = None
+_index_lock = threading.Lock()
+
+def get_role_index() -> RoleIndex:
+    """Index over the registry's current profiles, rebuilt after each reload"""
+    global _index
+    profiles = get_registry().snapshot()
+    cached = _index
+    if cached is None or cached[0] is not profiles:
+        with _index_lock:
+            if _index is None or _index[0] is not profiles:
+                _index = (profiles, RoleIndex(profiles))
+            cached = _index
+    return cached[1]
+
+def rank_roles(resume_text: str, top: Optional[int] = None) -> List[Dict]:
+    """Best-fit roles for one resume across every job profile"""
+    return get_role_index().rank(resume_text, top)
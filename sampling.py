@@ -0,0 +1,121 @@
+# Stratified review sampling
+# Picks which screened candidates go to human review: every score band,
+# decision and role is represented, and the sample is large enough for a
+# target confidence interval on the human-AI agreement rate
+
+import math
+from statistics import NormalDist
+from typing import List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Band edges on total_score; 70 is the Accept threshold
+SCORE_BAND_EDGES = (0, 50, 70, 85, 101)
+
+class StratifiedSample(NamedTuple):
+    positions: np.ndarray         # sampled row positions, ascending
+    strata: List[str]             # "role / decision / band" label per stratum
+    population: np.ndarray        # rows per stratum
+    allocated: np.ndarray         # sampled rows per stratum
+
+def band_labels(edges: Sequence[int] = SCORE_BAND_EDGES) -> List[str]:
+    return [f"{low}-{high - 1}" for low, high in zip(edges[:-1], edges[1:])]
+
+def required_sample_size(confidence: float = 0.95, margin: float = 0.05, expected_rate: float = 0.5,
+                         population: Optional[int] = None) -> int:
+    """Reviews needed to estimate an agreement rate within +/- margin.
+
+    Normal-approximation (Cochran) size for a proportion, with the finite
+    population correction when the population is known. expected_rate=0.5
+    is the conservative choice when nothing is known about agreement yet.
+    """
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    n = z * z * expected_rate * (1 - expected_rate) / (margin * margin)
+    if population:
+        n = n / (1 + (n - 1) / population)
+        return min(population, math.ceil(n))
+    return math.ceil(n)
+
+def _factorize(values) -> Tuple[np.ndarray, np.ndarray]:
+    """(sorted unique values, code per row) for a low-cardinality column.
+
+    Uniques are guessed from a strided subsample and every row is then
+    located with a binary search, which is much cheaper than sorting a
+    million strings; if the guess missed a value, fall back to np.unique.
+    """
+    values = np.asarray(values)
+    if values.dtype == object:
+        values = values.astype(str)
+    uniques = np.unique(values[::max(1, len(values) // 4096)])
+    codes = np.searchsorted(uniques, values)
+    if len(values) and not (uniques[np.minimum(codes, len(uniques) - 1)] == values).all():
+        return np.unique(values, return_inverse=True)
+    return uniques, codes
+
+def _allocate(population: np.ndarray, n: int) -> np.ndarray:
+    """Proportional allocation by largest remainder, at least one row per stratum when n allows"""
+    n = min(n, int(population.sum()))
+    if n >= len(population):
+        # Seed every stratum, then share the rest proportionally to what is left
+        allocated = np.ones(len(population), dtype=np.int64)
+        remaining = population - 1
+        extra = n - len(population)
+    else:
+        allocated = np.zeros(len(population), dtype=np.int64)
+        remaining = population.copy()
+        extra = n
+    if extra and remaining.sum():
+        quota = remaining * (extra / remaining.sum())
+        share = np.floor(quota).astype(np.int64)
+        leftover = extra - int(share.sum())
+        # Largest fractional parts get the leftover rows; stable, so ties go to earlier strata
+        share[np.argsort(-(quota - share), kind='stable')[:leftover]] += 1
+        allocated += np.minimum(share, remaining)
+    return allocated
+
+def stratified_sample(scores: Sequence[int], decisions: Sequence[str], roles: Sequence[str], n: int,
+                      seed: int = 0, band_edges: Sequence[int] = SCORE_BAND_EDGES) -> StratifiedSample:
+    """Draw n rows stratified by role, decision and score band.
+
+    Everything runs as whole-array operations: stratum ids come from
+    integer codes, and each stratum keeps the `allocated` rows with the
+    smallest random keys. The same seed always returns the same rows for
+    the same input.
+    """
+    scores = np.asarray(scores)
+    role_values, role_codes = _factorize(roles)
+    decision_values, decision_codes = _factorize(decisions)
+    bands = np.digitize(scores, band_edges[1:-1])
+    n_bands = len(band_edges) - 1
+
+    stratum_ids = (role_codes * len(decision_values) + decision_codes) * n_bands + bands
+    present, stratum_index, population = np.unique(stratum_ids, return_inverse=True, return_counts=True)
+    allocated = _allocate(population, n)
+
+    # Each stratum keeps the rows with its smallest random keys. Only rows under
+    # a per-stratum cutoff (about twice the allocation, in expectation) can
+    # qualify, so just those are sorted; if a cutoff happens to leave too few
+    # rows, sort them all. Either way the same rows are chosen.
+    keys = np.random.default_rng(seed).random(len(scores))
+    cutoff = np.minimum(1.0, (2 * allocated + 16) / population)
+    candidates = np.flatnonzero(keys < cutoff[stratum_index])
+    candidate_counts = np.bincount(stratum_index[candidates], minlength=len(population))
+    if (candidate_counts < allocated).any():
+        candidates = np.arange(len(keys))
+        candidate_counts = population
+
+    # By stratum, then randomly within it (lexsort keys run last-to-first)
+    order = candidates[np.lexsort((keys[candidates], stratum_index[candidates]))]
+    starts = np.concatenate(([0], np.cumsum(candidate_counts)[:-1]))
+    sorted_strata = stratum_index[order]
+    rank = np.arange(len(order)) - starts[sorted_strata]
+    positions = np.sort(order[rank < allocated[sorted_strata]])
+
+    labels = band_labels(band_edges)
+    strata = []
+    for stratum in present:
+        role_decision, band = divmod(int(stratum), n_bands)
+        role, decision = divmod(role_decision, len(decision_values))
+        strata.append(f"{role_values[role]} / {decision_values[decision]} / {labels[band]}")
+
+    return StratifiedSample(positions, strata, population, allocated)
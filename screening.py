@@ -0,0 +1,230 @@
+# TechCorp Resume Screening Core
+# Scoring logic shared by the Streamlit app and offline tooling
+
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from job_profiles import JobProfile, get_registry
+
+# Bump whenever scoring logic changes; cached screening results are keyed on
+# it (via scoring_version, with the profile revision) and older entries
+# simply stop matching
+SCORING_VERSION = 1
+
+# Batches smaller than this are screened in-process by screen_resumes_parallel
+PARALLEL_MIN_BATCH = 200
+
+# Every digit run, with an optional "years" tail (group 2) and an optional
+# "of experience" suffix after it (group 3). The tails are optional so a run
+# is always consumed whole and never re-entered from its second digit.
+_FIGURE_RE = re.compile(r'(\d+)(?:(\+?\s*years?)(\s*(?:of\s*)?experience)?)?')
+_MAX_YEARS_DIGITS = 3
+
+def get_profile(job_type: str) -> JobProfile:
+    """The compiled profile for a role from the shared registry (see job_profiles.py)"""
+    return get_registry()[job_type]
+
+def scoring_version(profile: JobProfile) -> int:
+    """SCORING_VERSION combined with the profile's revision, so editing a role retires its old results"""
+    return (SCORING_VERSION << 32) | profile.revision
+
+def _resume_features(resume_text: str, profile: JobProfile) -> Tuple[List[str], List[str], bool, int]:
+    """Found required skills, found preferred skills, education match and years of experience"""
+    resume_lower = resume_text.lower()
+    matched = profile.matcher.find(resume_lower)
+
+    # Profile terms are lowercased at load time
+    found_required = [skill for skill in profile.required_skills if skill in matched]
+    found_preferred = [skill for skill in profile.preferred_skills if skill in matched]
+    has_education = any(edu in matched for edu in profile.education_required)
+
+    return found_required, found_preferred, has_education, _extract_experience_lower(resume_lower)
+
+def screen_resume(resume_text: str, job_type: str) -> Dict:
+    """Simulate AI resume screening"""
+
+    profile = get_profile(job_type)
+
+    # Skills, education and experience extraction
+    found_required, found_preferred, has_education, experience_years = _resume_features(resume_text, profile)
+
+    # Experience scoring
+    experience_score = min(experience_years / profile.min_experience * 100, 100)
+
+    # Skills scoring
+    required_match = len(found_required) / len(profile.required_skills)
+    preferred_match = len(found_preferred) / len(profile.preferred_skills)
+    skills_score = (required_match * 70 + preferred_match * 30)
+
+    # Education assessment
+    education_score = 100 if has_education else 50
+
+    # Final calculation
+    total_score = int((skills_score * 0.5 + experience_score * 0.3 + education_score * 0.2))
+    decision = 'Accept' if total_score >= 70 else 'Reject'
+
+    return {
+        'decision': decision,
+        'total_score': total_score,
+        'skills_score': int(skills_score),
+        'experience_score': int(experience_score),
+        'education_score': int(education_score),
+        'found_skills': found_required + found_preferred,
+        'experience_years': experience_years,
+        'experience_assessment': f"{experience_years} years"
+    }
+
+def _batch_features(texts: List[str], profile: JobProfile) -> Tuple:
+    """Feature arrays (required hits, preferred hits, education, years, found skills) for a batch"""
+    import numpy as np
+
+    features = [_resume_features(text, profile) for text in texts]
+    n_required = np.fromiter((len(f[0]) for f in features), dtype=np.float64, count=len(features))
+    n_preferred = np.fromiter((len(f[1]) for f in features), dtype=np.float64, count=len(features))
+    has_education = np.fromiter((f[2] for f in features), dtype=bool, count=len(features))
+    experience_years = np.fromiter((f[3] for f in features), dtype=np.int64, count=len(features))
+    found_skills = np.empty(len(features), dtype=object)
+    found_skills[:] = [f[0] + f[1] for f in features]
+
+    return n_required, n_preferred, has_education, experience_years, found_skills
+
+def _score_batch(n_required, n_preferred, has_education, experience_years, found_skills, profile: JobProfile):
+    """Apply the scoring weights and Accept threshold to whole feature arrays"""
+    import numpy as np
+    import pandas as pd
+
+    skills_score = (n_required / len(profile.required_skills) * 70
+                    + n_preferred / len(profile.preferred_skills) * 30)
+    experience_score = np.minimum(experience_years / profile.min_experience * 100, 100)
+    education_score = np.where(has_education, 100, 50)
+    total_score = (skills_score * 0.5 + experience_score * 0.3 + education_score * 0.2).astype(np.int64)
+
+    return pd.DataFrame({
+        'skills_score': skills_score.astype(np.int64),
+        'experience_score': experience_score.astype(np.int64),
+        'education_score': education_score,
+        'experience_years': experience_years,
+        'total_score': total_score,
+        'decision': np.where(total_score >= 70, 'Accept', 'Reject'),
+        'found_skills': found_skills,
+    })
+
+def screen_resumes(texts: Iterable[str], job_type: str, profile: Optional[JobProfile] = None):
+    """Screen a batch of resumes, returning one DataFrame row per resume.
+
+    Keyword matching and experience extraction still run per resume, but the
+    weighting and the Accept threshold are applied as array operations over
+    the whole batch. Scores match screen_resume exactly. The role's profile
+    (the one given, or the registry's current one) is looked up once, so a
+    registry reload mid-batch cannot mix two versions.
+    """
+    profile = profile or get_profile(job_type)
+    return _score_batch(*_batch_features(list(texts), profile), profile)
+
+def screen_resumes_parallel(texts: Iterable[str], job_type: str, workers: Optional[int] = None,
+                            chunk_size: Optional[int] = None, profile: Optional[JobProfile] = None,
+                            executor: Optional[ProcessPoolExecutor] = None):
+    """Like screen_resumes, but spreads the per-resume work over a process pool.
+
+    Resumes are sent to the workers in contiguous chunks and the feature
+    arrays come back in submission order, so rows stay in upload order.
+    Without an executor a pool is started for the call, and batches smaller
+    than PARALLEL_MIN_BATCH (or a single worker) are screened serially, where
+    pool start-up would cost more than it saves. A caller screening many
+    batches passes one long-lived executor (and its worker count) instead;
+    every non-empty batch then goes to it.
+    """
+    import numpy as np
+
+    texts = list(texts)
+    if not workers:
+        # Respect CPU affinity / container limits where the platform exposes them
+        workers = len(os.sched_getaffinity(0)) if hasattr(os, 'sched_getaffinity') else os.cpu_count() or 1
+    if not texts or (executor is None and (workers < 2 or len(texts) < PARALLEL_MIN_BATCH)):
+        return screen_resumes(texts, job_type, profile)
+
+    # Workers get the compiled profile itself, not a role name to look up in their own registry
+    profile = profile or get_profile(job_type)
+
+    # A few chunks per worker keeps the pool busy when resume sizes vary
+    chunk_size = chunk_size or max(1, -(-len(texts) // (workers * 4)))
+    chunks = [texts[i:i + chunk_size] for i in range(0, len(texts), chunk_size)]
+
+    if executor is not None:
+        parts = list(executor.map(_batch_features, chunks, repeat(profile, len(chunks))))
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as pool:
+            parts = list(pool.map(_batch_features, chunks, repeat(profile, len(chunks))))
+
+    return _score_batch(*(np.concatenate(column) for column in zip(*parts)), profile)
+
+def extract_experience(resume_text: str) -> int:
+    """Extract years of experience"""
+    return _extract_experience_lower(resume_text.lower())
+
+def _extract_experience_lower(text: str) -> int:
+    r"""extract_experience over an already-lowercased resume, in linear time.
+
+    Equivalent to the original two findall patterns
+
+        (\d+)\+?\s*years?\s*(?:of\s*)?experience
+        experience.*?(\d+)\+?\s*years?
+
+    but every digit run is matched whole, exactly once, in a single scan, so
+    a failed "N years" never backtracks into the run. The lazy
+    "experience ... N years" search is then replayed with two cursors instead
+    of rescanning to the end of the line for every mention of "experience".
+    Digit runs longer than _MAX_YEARS_DIGITS are not plausible experience
+    figures and are ignored rather than parsed.
+    """
+    explicit = [digits for digits, _, suffix in _FIGURE_RE.findall(text) if suffix]
+
+    years = _plausible_max(explicit)
+    if years is None and 'experience' in text:
+        spans = [(match.start(), match.end(2), match.group(1))
+                 for match in _FIGURE_RE.finditer(text) if match.group(2)]
+        years = _plausible_max(_years_after_experience(text, spans))
+    if years is not None:
+        return years
+
+    # Estimate from keywords
+    if any(word in text for word in ['senior', 'lead']):
+        return 5
+    elif any(word in text for word in ['junior', 'entry']):
+        return 1
+
+    return 2
+
+def _plausible_max(digit_runs: List[str]) -> Optional[int]:
+    values = [int(run) for run in digit_runs if len(run) <= _MAX_YEARS_DIGITS]
+    return max(values) if values else None
+
+def _years_after_experience(text: str, spans: List[Tuple[int, int, str]]) -> List[str]:
+    r"""First "N years" after each mention of "experience" on the same line.
+
+    Mirrors re.findall(r'experience.*?(\d+)\+?\s*years?') given the
+    (start, end, digits) spans of every "N years" phrase: once a mention is
+    paired with a figure, the search resumes after that figure.
+    """
+    found = []
+    j = 0
+    line_end = -1
+    start = text.find('experience')
+    while start != -1:
+        end = start + len('experience')
+        if end > line_end:
+            # '.' does not cross newlines; line ends only move forward
+            line_end = text.find('\n', end)
+            if line_end == -1:
+                line_end = len(text)
+        while j < len(spans) and spans[j][0] < end:
+            j += 1
+        if j < len(spans) and spans[j][0] < line_end:
+            found.append(spans[j][2])
+            start = text.find('experience', spans[j][1])
+        else:
+            start = text.find('experience', end)
+    return found
@@ -0,0 +1,65 @@
+# Screening result cache
+# Keeps Streamlit reruns from re-decoding and re-screening unchanged uploads
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Dict, Hashable, Optional, Tuple
+
+from job_profiles import JobProfile
+from screening import get_profile, scoring_version
+
+def content_hash(data) -> str:
+    """Stable digest of an uploaded file's raw bytes"""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+def screening_key(digest: str, job_type: str, decoder: str = "text",
+                  profile: Optional[JobProfile] = None) -> Tuple[str, str, int, str]:
+    """Cache key: (content hash, job_type, scoring and profile version, decode path).
+
+    The decode path is part of the key because the same bytes are read
+    differently depending on how they were uploaded (plain text is decoded,
+    anything else goes through the PDF path). Pass the profile the batch is
+    screened with, so keys and results agree on its revision.
+    """
+    return (digest, job_type, scoring_version(profile or get_profile(job_type)), decoder)
+
+class ScreeningCache:
+    """Size-bounded LRU cache of per-file screening results.
+
+    One instance is shared by every session in the process, so access is
+    guarded by a lock. Entries are keyed on file content rather than file
+    name, which makes sharing safe: a hit can only come from identical bytes.
+    """
+
+    def __init__(self, max_entries: int = 10000):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Hashable, Dict]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Dict]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, key: Hashable, entry: Dict) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
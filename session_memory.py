@@ -0,0 +1,227 @@
+# Session memory budget
+# Large per-session values (result tables, review decisions, diagnostic
+# reports) are held here instead of in st.session_state, under a memory
+# budget per session and per process. Cold values are pickled to a local
+# spill directory and read back transparently on their next access
+#
+#   SESSION_MEMORY_BUDGET_MB=64 PROCESS_MEMORY_BUDGET_MB=1024 streamlit run app.py
+
+import atexit
+import hashlib
+import os
+import pickle
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+MB = 1024 * 1024
+
+SESSION_MEMORY_BUDGET = int(float(os.environ.get("SESSION_MEMORY_BUDGET_MB", 64)) * MB)
+PROCESS_MEMORY_BUDGET = int(float(os.environ.get("PROCESS_MEMORY_BUDGET_MB", 1024)) * MB)
+DEFAULT_SPILL_DIR = os.environ.get(
+    "SESSION_SPILL_DIR", os.path.join(tempfile.gettempdir(), "resume-screening-sessions"))
+
+# A session must be idle this long before another session's run may evict it,
+# so a value is never spilled while its own script run still holds it
+SESSION_IDLE_SECONDS = 300.0
+# Sessions idle this long are assumed closed and dropped, spill files included
+SESSION_EXPIRY_SECONDS = 24 * 3600.0
+
+def deep_size(value: Any, seen: Optional[set] = None) -> int:
+    """Approximate bytes held by a value and everything it references (shared objects counted once)"""
+    seen = set() if seen is None else seen
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+
+    if isinstance(value, np.ndarray):
+        # An array owning its data reports it in getsizeof; a view over another buffer does not
+        size = sys.getsizeof(value) + (value.nbytes if value.base is not None else 0)
+        if value.dtype == object:
+            size += sum(deep_size(item, seen) for item in value.ravel())
+        return size
+    size = sys.getsizeof(value)
+    if isinstance(value, (str, bytes, int, float, bool, type(None))):
+        return size
+    if isinstance(value, dict):
+        size += sum(deep_size(key, seen) + deep_size(item, seen) for key, item in value.items())
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        size += sum(deep_size(item, seen) for item in value)
+    if hasattr(value, '__dict__'):
+        size += deep_size(vars(value), seen)
+    return size
+
+class SessionUsage(NamedTuple):
+    """One session's footprint, for the admin view"""
+    session_id: str
+    idle_seconds: float
+    resident_bytes: int
+    spilled_bytes: int
+    resident_keys: Tuple[str, ...]
+    spilled_keys: Tuple[str, ...]
+
+class _Session:
+    def __init__(self):
+        self.values: "OrderedDict[str, Any]" = OrderedDict()  # least recently used first
+        self.sizes: Dict[str, int] = {}
+        self.spilled: Dict[str, Tuple[str, int]] = {}  # key -> (path, bytes)
+        self.last_seen = time.monotonic()
+
+    def resident_bytes(self) -> int:
+        return sum(self.sizes.values())
+
+class SessionMemory:
+    """Budgeted key-value state for every session in the process.
+
+    Each session's values are kept in least-recently-used order. rebalance()
+    runs at the start of a script run, when the run holds no references
+    yet: it re-measures the session's values (they may have been mutated in
+    place), spills its coldest values until it fits its own budget - always
+    keeping the most recently used one - and then, while the process is over
+    its budget, evicts whole sessions that have been idle at least
+    SESSION_IDLE_SECONDS, least recently seen first. A spilled value is read
+    back on its next access. One lock guards everything; spill files live in
+    a private directory removed when the process exits.
+    """
+
+    def __init__(self, spill_dir: str = DEFAULT_SPILL_DIR, session_budget: int = SESSION_MEMORY_BUDGET,
+                 process_budget: int = PROCESS_MEMORY_BUDGET, idle_seconds: float = SESSION_IDLE_SECONDS,
+                 expiry_seconds: float = SESSION_EXPIRY_SECONDS):
+        self.session_budget = session_budget
+        self.process_budget = process_budget
+        self.idle_seconds = idle_seconds
+        self.expiry_seconds = expiry_seconds
+        self.spills = self.restores = self.evictions = 0
+        os.makedirs(spill_dir, exist_ok=True)
+        # Private to this process, so several app servers can share spill_dir
+        self.spill_dir = tempfile.mkdtemp(prefix=f"{os.getpid()}-", dir=spill_dir)
+        atexit.register(shutil.rmtree, self.spill_dir, True)
+        self._sessions: Dict[str, _Session] = {}
+        self._lock = threading.RLock()
+
+    def _session(self, session_id: str) -> _Session:
+        session = self._sessions.get(session_id)
+        if session is None:
+            session = self._sessions[session_id] = _Session()
+        session.last_seen = time.monotonic()
+        return session
+
+    def _spill(self, session_id: str, session: _Session, key: str) -> None:
+        value = session.values.pop(key)
+        directory = os.path.join(self.spill_dir, session_id)
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, hashlib.blake2b(key.encode(), digest_size=8).hexdigest() + ".pickle")
+        with open(path + ".tmp", "wb") as handle:
+            pickle.dump(value, handle, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(path + ".tmp", path)
+        session.spilled[key] = (path, session.sizes.pop(key))
+        self.spills += 1
+
+    def _restore(self, session: _Session, key: str) -> None:
+        path, size = session.spilled.pop(key)
+        with open(path, "rb") as handle:
+            session.values[key] = pickle.load(handle)
+        os.remove(path)
+        session.sizes[key] = size
+        self.restores += 1
+
+    def get(self, session_id: str, key: str, default: Any = None) -> Any:
+        with self._lock:
+            session = self._session(session_id)
+            if key in session.spilled:
+                self._restore(session, key)
+            if key not in session.values:
+                return default
+            session.values.move_to_end(key)
+            return session.values[key]
+
+    def set(self, session_id: str, key: str, value: Any) -> None:
+        with self._lock:
+            session = self._session(session_id)
+            if key in session.spilled:
+                os.remove(session.spilled.pop(key)[0])
+            session.values[key] = value
+            session.values.move_to_end(key)
+            session.sizes[key] = deep_size(value)
+
+    def setdefault(self, session_id: str, key: str, default: Any) -> Any:
+        with self._lock:
+            value = self.get(session_id, key, self)
+            if value is self:
+                self.set(session_id, key, default)
+                value = default
+            return value
+
+    def rebalance(self, session_id: str) -> None:
+        """Fit this session into its budget, then the process into its budget"""
+        with self._lock:
+            now = time.monotonic()
+            for other_id in [other_id for other_id, other in self._sessions.items()
+                             if now - other.last_seen > self.expiry_seconds and other_id != session_id]:
+                self.drop(other_id)
+
+            session = self._session(session_id)
+            for key, value in session.values.items():
+                session.sizes[key] = deep_size(value)
+            while len(session.values) > 1 and session.resident_bytes() > self.session_budget:
+                self._spill(session_id, session, next(iter(session.values)))
+
+            idle = sorted((other.last_seen, other_id) for other_id, other in self._sessions.items()
+                          if other.values and now - other.last_seen >= self.idle_seconds)
+            for _, other_id in idle:
+                if self.resident_bytes() <= self.process_budget:
+                    break
+                other = self._sessions[other_id]
+                while other.values:
+                    self._spill(other_id, other, next(iter(other.values)))
+                self.evictions += 1
+
+    def drop(self, session_id: str) -> None:
+        """Forget a session and delete its spill files"""
+        with self._lock:
+            if self._sessions.pop(session_id, None) is not None:
+                shutil.rmtree(os.path.join(self.spill_dir, session_id), ignore_errors=True)
+
+    def resident_bytes(self) -> int:
+        with self._lock:
+            return sum(session.resident_bytes() for session in self._sessions.values())
+
+    def usage(self) -> List[SessionUsage]:
+        """Every session's footprint, most recently seen first"""
+        with self._lock:
+            now = time.monotonic()
+            usage = [
+                SessionUsage(session_id, now - session.last_seen, session.resident_bytes(),
+                             sum(size for _, size in session.spilled.values()),
+                             tuple(session.values), tuple(session.spilled))
+                for session_id, session in self._sessions.items()
+            ]
+        return sorted(usage, key=lambda u: u.idle_seconds)
+
+class SessionValues:
+    """Dict-style view of one session's budgeted values"""
+
+    def __init__(self, memory: SessionMemory, session_id: str):
+        self.memory = memory
+        self.session_id = session_id
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self.memory.get(self.session_id, key, default)
+
+    def setdefault(self, key: str, default: Any) -> Any:
+        return self.memory.setdefault(self.session_id, key, default)
+
+    def __getitem__(self, key: str) -> Any:
+        value = self.memory.get(self.session_id, key, self)
+        if value is self:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.memory.set(self.session_id, key, value)
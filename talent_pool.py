@@ -0,0 +1,214 @@
+# Talent-pool retrieval
+# Inverted index over every stored resume: a posting list of resumes per
+# skill term plus per-resume years of experience, so a new requisition's
+# top-K shortlist is found without re-screening the pool. New resumes are
+# appended to the lists as they are stored; the pool is never rescanned
+
+import threading
+from typing import Callable, Dict, Iterable, List, Sequence, Set, Tuple
+
+import numpy as np
+
+from job_profiles import JobProfile
+from rescoring import DEFAULT_POLICY, policy_scores
+from screening import _extract_experience_lower
+
+class GrowableArray:
+    """A 1-D array with amortised O(1) appends: capacity doubles as it fills"""
+
+    def __init__(self, dtype, values: Sequence = ()):
+        values = np.asarray(values, dtype=dtype)
+        self._data = np.empty(max(len(values), 16), dtype=dtype)
+        self._data[:len(values)] = values
+        self._size = len(values)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def extend(self, values: Sequence) -> None:
+        values = np.asarray(values, dtype=self._data.dtype)
+        size = self._size + len(values)
+        if size > len(self._data):
+            grown = np.empty(max(size, 2 * len(self._data)), dtype=self._data.dtype)
+            grown[:self._size] = self._data[:self._size]
+            self._data = grown
+        self._data[self._size:size] = values
+        self._size = size
+
+    def view(self) -> np.ndarray:
+        """The filled prefix; later appends never change the rows of an earlier view"""
+        return self._data[:self._size]
+
+class TalentIndex:
+    """Posting lists and experience features for a growing pool of resumes.
+
+    Terms cover the vocabulary the index was built with (normally every
+    profile term in the registry); querying a profile that uses a term
+    outside it raises KeyError, since the pool was never scanned for it.
+    extend() appends resumes in place, so adding a batch costs time in the
+    batch's size, not the pool's. A lock keeps top_k and sync from seeing
+    a half-appended batch; ids, years and postings are prefix views that a
+    later append never changes, so a reader bounds them by len() taken first.
+    """
+
+    def __init__(self, ids: Sequence[str], years: Sequence[int], postings: Dict[str, np.ndarray],
+                 vocabulary: Iterable[str]):
+        self.vocabulary = frozenset(vocabulary)
+        self._ids = GrowableArray(object, ids)
+        self._years = GrowableArray(np.int32, years)
+        # Ascending resume numbers per term; terms nobody matched get an empty list
+        self._postings = {term: GrowableArray(np.int32, postings.get(term, ())) for term in self.vocabulary}
+        self.last_sequence = 0  # store sequence number of the last resume sync() appended
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    @property
+    def ids(self) -> np.ndarray:
+        return self._ids.view()
+
+    @property
+    def years(self) -> np.ndarray:
+        return self._years.view()
+
+    def extend(self, ids: Sequence[str], term_sets: Iterable[Set[str]], years: Sequence[int]) -> None:
+        """Append resumes by their already-extracted features (terms outside the vocabulary are ignored)"""
+        with self._lock:
+            start = len(self)
+            rows: Dict[str, List[int]] = {}
+            for number, terms in enumerate(term_sets, start):
+                for term in terms:
+                    rows.setdefault(term, []).append(number)
+            for term, numbers in rows.items():
+                if term in self._postings:
+                    self._postings[term].extend(numbers)
+            self._years.extend(years)
+            self._ids.extend(np.asarray(ids, dtype=object))
+
+    def extend_texts(self, items: Iterable[Tuple[str, str]], matcher) -> int:
+        """Scan (id, text) pairs with a matcher over the vocabulary and append them; returns how many"""
+        ids: List[str] = []
+        term_sets: List[Set[str]] = []
+        years: List[int] = []
+        for resume_id, text in items:
+            lower = text.lower()
+            ids.append(resume_id)
+            term_sets.append(matcher.find(lower))
+            years.append(_extract_experience_lower(lower))
+        self.extend(ids, term_sets, years)
+        return len(ids)
+
+    def sync(self, fetch: Callable[[int], Iterable[Tuple[int, str, str]]], matcher) -> int:
+        """Append the resumes stored since the last sync; returns how many.
+
+        fetch(after) yields (sequence number, id, text) for every resume
+        stored after the given sequence number, in sequence order, e.g. a
+        thin wrapper over ResultStore.stored_resumes.
+        """
+        with self._lock:
+            last = self.last_sequence
+
+            def items():
+                nonlocal last
+                for sequence, resume_id, text in fetch(self.last_sequence):
+                    last = sequence
+                    yield resume_id, text
+
+            added = self.extend_texts(items(), matcher)
+            self.last_sequence = last
+            return added
+
+    @classmethod
+    def from_features(cls, ids: Sequence[str], term_sets: Iterable[Set[str]], years: Sequence[int],
+                      vocabulary: Iterable[str]) -> 'TalentIndex':
+        """Index already-extracted features: the matched terms and years of each resume"""
+        index = cls([], [], {}, vocabulary)
+        index.extend(ids, term_sets, years)
+        return index
+
+    @classmethod
+    def from_texts(cls, items: Iterable[Tuple[str, str]], matcher) -> 'TalentIndex':
+        """Scan (id, text) pairs once with a matcher over the whole vocabulary (e.g. RoleIndex.matcher)"""
+        index = cls([], [], {}, matcher.terms)
+        index.extend_texts(items, matcher)
+        return index
+
+    def postings(self, term: str) -> np.ndarray:
+        """Ascending numbers of the resumes containing a term"""
+        return self._postings[term].view()
+
+    def _hits(self, terms: Sequence[str]) -> np.ndarray:
+        """Per-resume count of how many of the terms each resume contains"""
+        missing = [term for term in terms if term not in self.vocabulary]
+        if missing:
+            raise KeyError(f"terms not in the index vocabulary: {', '.join(missing)}")
+        lists = [self._postings[term].view() for term in terms]
+        if not lists:
+            return np.zeros(len(self), dtype=np.int64)
+        return np.bincount(np.concatenate(lists), minlength=len(self))
+
+    def top_k(self, profile: JobProfile, k: int = 50) -> List[Dict]:
+        """The k best-scoring resumes for a profile, best first, scored exactly as screen_resume.
+
+        A resume's score depends only on its required and preferred hit
+        counts, whether it has any education term and its years capped at
+        min_experience - a few hundred combinations at most. One pass over
+        the posting lists puts every resume in its combination's cell;
+        scoring the cells and counting down from 100 gives the k-th best
+        score, and only resumes at or above it are ever materialised. This
+        is the bounded top-K heap turned into bucket counting, which stops
+        as soon as k resumes are accounted for. Ties keep pool order.
+        """
+        with self._lock:
+            return self._top_k(profile, k)
+
+    def _top_k(self, profile: JobProfile, k: int) -> List[Dict]:
+        n = len(self)
+        k = min(k, n)
+        if k <= 0:
+            return []
+
+        n_required, n_preferred, cap = len(profile.required_skills), len(profile.preferred_skills), profile.min_experience
+        required = self._hits(profile.required_skills)
+        preferred = self._hits(profile.preferred_skills)
+        educated = self._hits(profile.education_required) > 0
+        years = self.years
+        cells = ((required * (n_preferred + 1) + preferred) * 2 + educated) * (cap + 1) + np.minimum(years, cap)
+
+        # Score of every cell, with the same arithmetic (and rounding) as screen_resume
+        r, p, e, y = (axis.ravel() for axis in np.indices((n_required + 1, n_preferred + 1, 2, cap + 1)))
+        cell_total, skills_score, experience_score, education_score = policy_scores(
+            r, n_required, p, n_preferred, e, y, cap)
+
+        # Count resumes per score from the top until k are covered
+        per_score = np.bincount(cell_total, weights=np.bincount(cells, minlength=len(cell_total)), minlength=101)
+        cutoff = int(np.flatnonzero(np.cumsum(per_score[::-1]) >= k)[0])
+        kth_score = len(per_score) - 1 - cutoff
+
+        totals = cell_total[cells]
+        above = np.flatnonzero(totals > kth_score)
+        tied = np.flatnonzero(totals == kth_score)[:k - len(above)]
+        rows = np.concatenate((above, tied))
+        rows = rows[np.lexsort((rows, -totals[rows]))]
+        row_cells = cells[rows]
+
+        # Skill names only for the shortlist: a binary search per term into its posting list
+        found = {}
+        for term in profile.required_skills + profile.preferred_skills:
+            posting = self._postings[term].view()
+            at = np.minimum(np.searchsorted(posting, rows), max(len(posting) - 1, 0))
+            found[term] = (posting[at] == rows) if len(posting) else np.zeros(len(rows), dtype=bool)
+        return [
+            {
+                'id': self.ids[row],
+                'decision': 'Accept' if cell_total[cell] >= DEFAULT_POLICY.accept_threshold else 'Reject',
+                'total_score': int(cell_total[cell]),
+                'skills_score': int(skills_score[cell]),
+                'experience_score': int(experience_score[cell]),
+                'education_score': int(education_score[cell]),
+                'experience_years': int(years[row]),
+                'found_skills': [term for term, present in found.items() if present[rank]]
+            }
+            for rank, (row, cell) in enumerate(zip(rows, row_cells))
+        ]